@@ -0,0 +1,24 @@
+# *****************************************************************************
+#
+#          Copyright (c) 2026 Open Compute Project
+#
+#   SPDX-License-Identifier: MIT
+#
+#   Released under the MIT License of this repository. See the LICENSE
+#   file at the root of the repository for the full license text.
+#
+# *****************************************************************************
+#
+# History:
+#
+# 10/19/2026 - The script is in the ocp_telemetry package. This script runs it from a checkout without installing
+#              the package and imports as the package module.
+
+import sys
+
+from ocp_telemetry import benchmark
+
+if __name__ == "__main__":
+    benchmark.main()
+else:
+    sys.modules[__name__] = benchmark
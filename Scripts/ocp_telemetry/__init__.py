@@ -0,0 +1,18 @@
+# *****************************************************************************
+#
+#          Copyright (c) 2026 Open Compute Project
+#
+#   SPDX-License-Identifier: MIT
+#
+#   Released under the MIT License of this repository. See the LICENSE
+#   file at the root of the repository for the full license text.
+#
+# *****************************************************************************
+#
+# OCP Telemetry log page tools:
+#
+#     ocp_telemetry.dump      : parse and print NVMe(TM) Telemetry log pages (ocp-dump-telemetry)
+#     ocp_telemetry.generate  : generate NVMe(TM) Telemetry and OCP Strings log pages (ocp-generate-telemetry)
+#     ocp_telemetry.benchmark : benchmark the parser (ocp-benchmark-telemetry)
+#
+# The modules are not imported here so that each command only imports what it uses.
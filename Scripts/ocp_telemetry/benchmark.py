@@ -0,0 +1,466 @@
+# *****************************************************************************
+#
+#          Copyright (c) 2026 Open Compute Project
+#
+#   SPDX-License-Identifier: MIT
+#
+#   Released under the MIT License of this repository. See the LICENSE
+#   file at the root of the repository for the full license text.
+#
+# *****************************************************************************
+#
+# History:
+#
+# 10/19/2026 - Initial script to benchmark ocp_dump_nvme_telemetry_log.py end to end and per decoder against a corpus
+#              built from the checked-in log pages and log pages generated with fixed seeds
+#            - Moved into the ocp_telemetry package with an ocp-benchmark-telemetry entry point
+#            - Added --binaries to name the directory of the checked-in log pages, which are not installed
+
+
+import sys
+import argparse
+import os
+import json
+import time
+import platform
+import statistics as stats
+import tempfile
+from contextlib import redirect_stdout
+
+from ocp_telemetry import dump as dumper
+from ocp_telemetry import generate as generator
+
+version = 1.0
+
+results_default = "benchmark_results.json"
+# Directory of the checked-in log pages in a source checkout. An installed package does not include them so --binaries
+# names the directory.
+binaries_dir = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "Binaries_and_Output_Files"))
+
+# Checked-in log pages that are always part of the corpus: (name, telemetry filename, strings filename)
+checked_in_logs = [
+    ("telemetry_host", "telemetry_host.bin", "telemetry_strings.bin"),
+    ("telemetry_ctlr", "telemetry_ctlr.bin", "telemetry_strings.bin"),
+]
+
+# Event class mixes used to generate the corpus. Each is the "Event Mix" JSON section given to the generator.
+benchmark_mixes = {
+    "default": {},
+    "nvme": {"Class Weights": {"NVMe Debug": 1}},
+    "vendor unique": {"Class Weights": {"Vendor Unique": 1}},
+    "snapshot": {"Class Weights": {"Static Snapshot": 1}},
+}
+
+benchmark_sizes = [1024 * 1024, 8 * 1024 * 1024]
+benchmark_seed = 1
+
+
+# Get the message of an error raised while generating or benchmarking a log page
+#
+# Input:
+#         error : SystemExit or exception
+#
+# Output: string
+#
+def get_error_message(error):
+    if isinstance(error, SystemExit):
+        return str(error.code)
+    return f"{type(error).__name__}: {error}"
+
+
+# Generate the log pages of the corpus with the generator
+#
+# Input:
+#         directory : directory to write the generated log pages
+#         sizes     : list of Telemetry log page sizes in bytes
+#         seed      : random seed given to the generator
+#
+# Output: A list of (name, telemetry filename, strings filename) for the generated log pages
+#
+def generate_corpus(directory, sizes, seed):
+    corpus = []
+
+    for mix_name, mix in benchmark_mixes.items():
+        ocp_data = json.loads(generator.get_sample_json())
+        ocp_data["Event Mix"] = mix
+
+        json_file = os.path.join(directory, f"{mix_name.replace(' ', '_')}.json")
+        with open(json_file, "w") as f:
+            json.dump(ocp_data, f)
+
+        for size in sizes:
+            name = f"{mix_name.replace(' ', '_')}_{size // 1024}K"
+            telemetry_file = os.path.join(directory, f"{name}_telemetry.bin")
+            strings_file = os.path.join(directory, f"{name}_strings.bin")
+
+            argv = ["-r", str(seed), "-o", "100", "-l", str(size), "-j", json_file, "-t", telemetry_file, "-s", strings_file]
+            try:
+                with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+                    generator.main(argv)
+            except (SystemExit, Exception) as error:
+                print(f"{name}: generating failed, skipped: {get_error_message(error)}", file=sys.stderr)
+                continue
+
+            corpus.append((name, telemetry_file, strings_file))
+
+    return corpus
+
+
+# Time a function
+#
+# Input:
+#         func   : function taking no arguments to time
+#         repeat : number of times to run the function
+#
+# Output: A list of the elapsed time in seconds of each run
+#
+def time_runs(func, repeat):
+    times = []
+
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            times.append(time.perf_counter() - start)
+
+    return times
+
+
+# Time the dumper from reading the files to the end of parsing
+#
+# Input:
+#         telemetry_file : Telemetry log page filename
+#         strings_file   : OCP Strings log page filename
+#         repeat         : number of runs
+#
+# Output: A list of the elapsed time in seconds of each run
+#
+def time_end_to_end(telemetry_file, strings_file, repeat):
+    def run():
+        with open(strings_file, mode="rb") as f:
+            string_log = f.read()
+
+        with open(telemetry_file, mode="rb") as f:
+            telemetry_log = f.read()
+
+        strings = dumper.parse_strings(string_log)
+        dumper.parse_telemetry(telemetry_log, strings)
+
+    return time_runs(run, repeat)
+
+
+# Time the ingest command storing a log page in a new SQLite database
+#
+# Input:
+#         telemetry_file : Telemetry log page filename
+#         strings_file   : OCP Strings log page filename
+#         directory      : directory to write the database
+#         repeat         : number of runs
+#
+# Output: A list of the elapsed time in seconds of each run
+#
+def time_ingest(telemetry_file, strings_file, directory, repeat):
+    database = os.path.join(directory, "benchmark.sqlite")
+
+    def run():
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(database + suffix):
+                os.remove(database + suffix)
+        dumper.ingest_command([telemetry_file, "-s", strings_file, "--sqlite", database])
+
+    return time_runs(run, repeat)
+
+
+# Collect the calls of each decoder of a log page
+#
+# Input:
+#         telemetry : bytearray of the Telemetry log page
+#         strings   : dictionary of the parsed string log page
+#
+# Output: A dictionary of the form {<decoder name> : (decoder function, [<argument tuple>, ...])}
+#
+def get_decoder_calls(telemetry, strings):
+    calls = {"parse_a_statistic": (dumper.parse_a_statistic, [])}
+    for func in dumper.parse_event:
+        if func != None:
+            calls[func.__name__] = (func, [])
+
+    layout = dumper.get_telemetry_layout(telemetry)
+
+    # Statistic descriptors, split using the length returned by the decoder
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        for data_area, (start, end) in layout["statistics"].items():
+            table = telemetry[start:end]
+            offset = 0
+            while (offset + 8) < len(table):
+                size = dumper.parse_a_statistic(data_area, table[offset:], strings, "")
+                calls["parse_a_statistic"][1].append((data_area, table[offset : offset + size], strings, ""))
+                offset += size
+
+    # Event descriptors, using the decoder of the class type in the dispatch table of parse_a_fifo
+    for fifo_num, (data_area, start, end) in layout["fifos"].items():
+        data = telemetry[start:end]
+        for offset, class_type, identifier, dw_size, size in dumper.get_fifo_events(data):
+            func = dumper.parse_event[class_type]
+            if func != None:
+                calls[func.__name__][1].append((data_area, fifo_num, identifier, dw_size, data[offset : offset + size], strings))
+
+    return calls
+
+
+# Time each decoder of a log page on its own
+#
+# Input:
+#         telemetry : bytearray of the Telemetry log page
+#         string_log: bytearray of the OCP Strings log page
+#         repeat    : number of runs
+#
+# Output: A dictionary of the form {<decoder name> : {'calls' : <calls per run>, 'times' : [<seconds>, ...]}}
+#
+def time_decoders(telemetry, string_log, repeat):
+    decoders = {"parse_strings": {"calls": 1, "times": time_runs(lambda: dumper.parse_strings(string_log), repeat)}}
+
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        strings = dumper.parse_strings(string_log)
+
+    for name, (func, args_list) in get_decoder_calls(telemetry, strings).items():
+        if len(args_list) == 0:
+            continue
+
+        def run():
+            for args in args_list:
+                func(*args)
+
+        decoders[name] = {"calls": len(args_list), "times": time_runs(run, repeat)}
+
+    return decoders
+
+
+# Summarize a list of run times
+#
+# Input:
+#         times : list of elapsed times in seconds
+#         bytes : number of bytes processed per run or None
+#         items : number of items processed per run
+#         label : name of the items for the rate
+#
+# Output: A dictionary with the median and minimum time and the rates based on the median time
+#
+def summarize(times, bytes, items, label):
+    median = stats.median(times)
+    summary = {"median seconds": median, "min seconds": min(times)}
+
+    if bytes != None:
+        summary["MB/s"] = (bytes / (1024 * 1024)) / median if median > 0 else 0
+    summary[f"{label}/s"] = items / median if median > 0 else 0
+
+    return summary
+
+
+# Benchmark a log page of the corpus
+#
+# Input:
+#         name           : name of the log page in the results
+#         telemetry_file : Telemetry log page filename
+#         strings_file   : OCP Strings log page filename
+#         directory      : directory to write the ingest database
+#         repeat         : number of runs
+#
+# Output: A dictionary of the results for the log page
+#
+def benchmark_log(name, telemetry_file, strings_file, directory, repeat):
+    with open(telemetry_file, mode="rb") as f:
+        telemetry = f.read()
+    with open(strings_file, mode="rb") as f:
+        string_log = f.read()
+
+    layout = dumper.get_telemetry_layout(telemetry)
+    events = 0
+    for data_area, start, end in layout["fifos"].values():
+        events += sum(1 for _ in dumper.get_fifo_events(telemetry[start:end]))
+
+    result = {
+        "name": name,
+        "telemetry": os.path.basename(telemetry_file),
+        "strings": os.path.basename(strings_file),
+        "size": len(telemetry),
+        "events": events,
+        "end to end": summarize(time_end_to_end(telemetry_file, strings_file, repeat), len(telemetry), events, "events"),
+        "ingest": summarize(time_ingest(telemetry_file, strings_file, directory, repeat), len(telemetry), 1, "dumps"),
+        "decoders": {},
+    }
+
+    for decoder, timing in time_decoders(telemetry, string_log, repeat).items():
+        result["decoders"][decoder] = {"calls": timing["calls"], **summarize(timing["times"], None, timing["calls"], "calls")}
+
+    return result
+
+
+# Parse the input parameters
+#
+# Input:
+#      argv : list of commandline arguments or None to use sys.argv
+#
+# Output: Input parameters
+#
+def parse_inputs(argv=None):
+    parser = argparse.ArgumentParser(
+        description="This script benchmarks ocp_dump_nvme_telemetry_log.py end to end, each of its decoders on its own and "
+        "the dumps per minute stored by its ingest command. "
+        "The corpus is the checked-in log pages plus log pages generated by ocp_generate_nvme_telemetry_log.py with a fixed "
+        "seed and fully packed FIFOs for each size and event class mix. The results are written to a JSON file so that runs "
+        "can be compared.",
+    )
+
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=str,
+        dest="output",
+        required=False,
+        metavar="<filename>",
+        default=results_default,
+        help="JSON filename for the results. If not specified then the filename '" + results_default + "' is used.",
+    )
+    parser.add_argument(
+        "-d",
+        "--directory",
+        type=str,
+        dest="directory",
+        required=False,
+        metavar="<directory>",
+        help="Directory to write the generated log pages. If not specified then a temporary directory is used and removed.",
+    )
+    parser.add_argument(
+        "-b",
+        "--binaries",
+        type=str,
+        dest="binaries",
+        required=False,
+        metavar="<directory>",
+        default=binaries_dir,
+        help="Directory of the checked-in log pages ("
+        + ", ".join(sorted({name for _, telemetry, strings in checked_in_logs for name in (telemetry, strings)}))
+        + "). If not specified then the Binaries_and_Output_Files directory of the source checkout is used.",
+    )
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        dest="sizes",
+        required=False,
+        metavar="<bytes>",
+        default=benchmark_sizes,
+        help="Telemetry log page sizes in bytes to generate for each event class mix.",
+    )
+    parser.add_argument(
+        "-n",
+        "--repeat",
+        type=int,
+        dest="repeat",
+        required=False,
+        metavar="<value>",
+        default=5,
+        help="Number of times to time each measurement. The median and minimum times are reported.",
+    )
+    parser.add_argument(
+        "-r",
+        "--random",
+        type=int,
+        dest="random",
+        required=False,
+        metavar="<value>",
+        default=benchmark_seed,
+        help="Random seed value given to the generator.",
+    )
+    parser.add_argument(
+        "-v", "--version", action="store_true", dest="list_ver", required=False, help="Specify the version of this script and exit."
+    )
+
+    return parser.parse_args(argv)
+
+
+# Main part of the script
+#
+# Input:
+#         argv : list of commandline arguments or None to use sys.argv
+#
+# Output: None
+#
+def main(argv=None):
+    args = parse_inputs(argv)
+    if args.list_ver:
+        print(f"{os.path.basename(sys.argv[0])} version: {version}")
+        return
+
+    if args.repeat < 1:
+        sys.exit(f"Repeat value of {args.repeat} is invalid.")
+
+    corpus = [(name, os.path.join(args.binaries, telemetry), os.path.join(args.binaries, strings)) for name, telemetry, strings in checked_in_logs]
+    for name, telemetry_file, strings_file in corpus:
+        for filename in (telemetry_file, strings_file):
+            if not os.path.isfile(filename):
+                sys.exit(f"Checked-in log page {filename} does not exist. Specify its directory with --binaries.")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        directory = args.directory if args.directory != None else temp_dir
+        os.makedirs(directory, exist_ok=True)
+
+        print(f"Generating corpus in {directory}")
+        corpus += generate_corpus(directory, args.sizes, args.random)
+
+        results = {
+            "version": version,
+            "dumper version": dumper.version,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "seed": args.random,
+            "repeat": args.repeat,
+            "corpus": [],
+            "failures": [],
+        }
+
+        print(f"\n{'Log page':<24}{'Size':>12}{'Events':>10}{'Seconds':>10}{'MB/s':>10}{'Events/s':>12}{'Ingest/min':>12}")
+        for name, telemetry_file, strings_file in corpus:
+            # A log page the dumper rejects is reported and skipped so the rest of the corpus is still measured
+            try:
+                result = benchmark_log(name, telemetry_file, strings_file, directory, args.repeat)
+            except (SystemExit, Exception) as error:
+                print(f"{name:<24}failed, skipped: {get_error_message(error)}")
+                results["failures"].append({"name": name, "error": get_error_message(error)})
+                continue
+            results["corpus"].append(result)
+
+            end_to_end = result["end to end"]
+            print(
+                f"{name:<24}{result['size']:>12}{result['events']:>10}{end_to_end['median seconds']:>10.4f}"
+                f"{end_to_end['MB/s']:>10.2f}{end_to_end['events/s']:>12.0f}{result['ingest']['dumps/s'] * 60:>12.0f}"
+            )
+
+    # Totals of each decoder across the corpus
+    totals = {}
+    for result in results["corpus"]:
+        for decoder, timing in result["decoders"].items():
+            total = totals.setdefault(decoder, {"calls": 0, "median seconds": 0})
+            total["calls"] += timing["calls"]
+            total["median seconds"] += timing["median seconds"]
+    for total in totals.values():
+        total["calls/s"] = total["calls"] / total["median seconds"] if total["median seconds"] > 0 else 0
+    results["decoders"] = totals
+
+    print(f"\n{'Decoder':<24}{'Calls':>12}{'Seconds':>10}{'Calls/s':>12}")
+    for decoder, total in totals.items():
+        print(f"{decoder:<24}{total['calls']:>12}{total['median seconds']:>10.4f}{total['calls/s']:>12.0f}")
+
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=4)
+
+    print(f"\nResults written to {args.output}")
+
+    if len(results["failures"]) > 0:
+        sys.exit(f"{len(results['failures'])} log pages of the corpus failed.")
+
+
+if __name__ == "__main__":
+    main()
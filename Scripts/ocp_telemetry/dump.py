@@ -0,0 +1,6342 @@
+# *****************************************************************************
+#
+#          COPYRIGHT 2022-2023 SAMSUNG ELECTRONICS CO., LTD.
+#                          ALL RIGHTS RESERVED
+#
+#   Permission is hereby granted to licensees of Samsung Electronics
+#   Co., Ltd. products to use or abstract this computer program for the
+#   sole purpose of implementing a product based on Samsung
+#   Electronics Co., Ltd. products. No other rights to reproduce, use,
+#   or disseminate this computer program, whether in part or in whole,
+#   are granted.
+#
+#   Samsung Electronics Co., Ltd. makes no representation or warranties
+#   with respect to the performance of this computer program, and
+#   specifically disclaims any responsibility for any damages,
+#   special or consequential, connected with the use of this program.
+#
+# *****************************************************************************
+#
+# History:
+#
+# 1/4/2023 - Initial script based on OCP Datacenter NVMe SSD SPecification v2.5 with comments from Mike Allison
+# 1/5/2023 - Added the -v commandline option to version of this script
+#          - The Data Area 1 FIFO information was changed start/end to start/size
+# 1/6/2023 - Validated <spaces> are in the ASCI table for unused locations
+#          - Validated the sorting of Strings tables
+# 4/9/2023 - General refactor
+#          - Fixed bug detecting 'critical_warning'
+#          - Formatted with Black
+# 10/19/2026 - Parse an event that ends at the last byte of a FIFO
+#            - Check the String log page tables are sorted against the previous entry rather than only against 0h
+#            - Moved the main part of the script into main() so the script can be imported
+#            - Added get_fifo_events() and get_telemetry_layout() to walk a log page without printing
+#            - Added the --profile and --profile-output commandline options to time each phase of the dump
+#            - Added the --metrics and --metrics-port commandline options to export parser metrics in the OpenMetrics format
+#            - More than one Telemetry log page can be specified to parse a batch of log pages
+#            - Added the --memory-report and --memory-budget commandline options to report and limit the memory of a dump
+#            - Added the diff command to compute the SMART and statistic deltas between two dumps of the same drive
+#            - Added the record command and get_telemetry_record() to decode a log page without printing
+#            - Added the ingest command to store dumps in an SQLite database
+#            - Added the export command to write statistics and events as Parquet, Arrow or CSV
+#            - Added the aggregate command for fleet percentiles using mergeable KLL sketches
+#            - Added a registry of vendor unique event decoders loaded from entry points
+#            - Debug events are dispatched through one table indexed by class type, which also parses the Media (8h)
+#              and Media Wear (9h) classes as those classes
+#            - Added --vu-schema to decode VU event payloads and VU extension data with JSON or TOML schemas
+#            - Read gzip, xz and zstd compressed log pages as a stream. Records stop reading after Data Area 2.
+#            - Read the log pages of tar and zip bundles without extracting them
+#            - Read log pages from stdin ('-') and file descriptors ('fd:N'), parsing Telemetry data areas as they arrive
+#            - Added --format (text, json, ndjson) and a content-addressed parsed result cache (--cache, --cache-size)
+#            - pyarrow and importlib.metadata are imported when they are needed
+#            - Added --drive-state to reuse the sections of a dump that are unchanged since the last dump of the drive
+#            - Added --index to write an event index sidecar (.idx) of the offset of each FIFO event
+#            - Added the timeline command to merge the events of all of the FIFOs by estimated time
+#            - Added timeline --format chrome to write the events as a Chrome trace for Perfetto
+#            - Moved into the ocp_telemetry package with an ocp-dump-telemetry entry point. Modules only needed by some
+#              commands are imported when they are used.
+#            - Added --areas to read and parse only Data Area 1 or Data Areas 1 and 2
+#            - Added the smart-scan command to decode the SMART log pages of many dumps at once with NumPy
+#            - Accept a String log page string that ends at the end of the ASCII table
+#            - --memory-budget is checked during the log page reads and FIFO walks rather than only after each phase
+#            - diff -s is repeated for the Strings log page of each dump so it no longer takes the dump filenames
+#            - ingest -s is repeated for the Strings log page of each dump so it no longer takes the dump filenames
+#            - export -s is repeated for the Strings log page of each dump so it no longer takes the dump filenames
+#            - FIFO events are decoded from views of the log page rather than from copies of the FIFOs
+#            - The log pages of a bundle are streamed from the bundle through the chunked reader instead of being read
+#              into memory when the bundle is opened
+#            - timeline --format chrome ends the slices still open at the end of a FIFO at its last event
+#            - --drive-state keeps only the keys of the sections in the state and each decoded section in a file named
+#              by its key that is written only when the section changes
+
+
+import sys
+import os
+import array
+import fnmatch
+import hashlib
+import heapq
+import io
+import json
+import marshal
+import random
+import posixpath
+import re
+import struct
+import threading
+import zlib
+from contextlib import contextmanager, nullcontext, redirect_stdout
+from functools import lru_cache
+from time import perf_counter, process_time
+
+# The resource module is only available on Unix
+try:
+    import resource
+except ImportError:
+    resource = None
+
+# Modules that are only needed by some commands or options, such as argparse, tomllib, zstandard, sqlite3,
+# multiprocessing and http.server, are imported by the functions that use them so that starting the script stays fast.
+
+# pyarrow is only needed to export Parquet and Arrow files so it is imported by import_pyarrow when an export needs it
+pyarrow = None
+
+# numpy is only needed to decode many dumps at once in the smart-scan command so it is imported by import_numpy
+numpy = None
+
+version = 2.2
+ocp_ver = "2.5r24"
+
+# Parse the strings log file and return a dictionary of the form:
+#
+# Input:
+#
+#      strings : byte array of the entire string log file
+#
+# Output a dictionary containing the string log information
+#
+#      data = {'statistics' : {'hex(identifier)'                    : {'identifier'  : identifier,       # for all static identifiers in the string log page
+#                                                                      'string'      : ASCII string}},
+#              'events'     : {'hex(event_class) + hex(identifier)' : {'class'       : event_class,      # for all event identifiers in the string log page
+#                                                                      'identifier'  : identifier,
+#                                                                      'string'      : ASCII string}},
+#              'vu events'  : 'hex(identifier)"                     : {'identifier'  : identifier,       # for all vu event identifiers in the string log page
+#                                                                      'string'      : ASCII string}}}
+#              'length'     : <length of the strings log page
+#              'sha256'     : <sha256 hex digest of the strings log page used to select the VU schemas
+def parse_strings(strings):
+    print("Parsing String log page ...")
+
+    s_len = len(strings)
+    data = {"length": s_len, "sha256": hashlib.sha256(strings).hexdigest()}
+
+    # The string log has to be atleast 432 bytes in length
+    if s_len < 432:
+        sys.exit(f"Strings log page size of {s_len} is less than the size of the header.")
+
+    log_ver = strings[0]
+    if log_ver != 1:
+        sys.exit(f"Log Page Version of {log_ver} is not the correct value.")
+
+    reserved = int.from_bytes(strings[1:15], "little")
+    if reserved != 0:
+        sys.exit("Reserved bytes 15:1 are not cleared to 0h.")
+
+    guid = int.from_bytes(strings[16:32], "little")
+    if guid != 0xB13A83691A8F408B9EA495940057AA44:
+        sys.exit(f"GUID value is not the correct value: 0x{guid:x}")
+
+    size_dw = int.from_bytes(strings[32:39], "little")
+    size = size_dw * 4
+    if size != s_len:
+        sys.exit(f"Log page dword size size value of {size_dw} idoes not match the size of the string log read of {s_len}")
+
+    reserved = int.from_bytes(strings[40:63], "little")
+    if reserved != 0:
+        sys.exit("Reserved bytes 15:1 are not cleared to 0h.")
+
+    statistics_start_dw = int.from_bytes(strings[64:71], "little")
+    statistics_start = statistics_start_dw * 4
+    statistics_size_dw = int.from_bytes(strings[72:79], "little")
+    statistics_size = statistics_size_dw * 4
+
+    if statistics_size_dw != 0:
+        if statistics_start != 432:
+            sys.exit(f"Statistics Identifier String Table Start value is invalid: {statistics_start_dw}({statistics_start})")
+        if (statistics_start + statistics_size) > s_len:
+            sys.exit(f"Statistics Identifier String Table Size value is invalid: {statistics_size_dw}")
+        statistics_start = 432  # set this value as events should start after the header
+        if (statistics_size % 16) != 0:
+            sys.exit(f"Statistics Identifier String Table Size value is not a multiple of 16: {statistics_size_dw}")
+
+    event_start_dw = int.from_bytes(strings[80:87], "little")
+    event_start = event_start_dw * 4
+    event_size_dw = int.from_bytes(strings[88:95], "little")
+    event_size = event_size_dw * 4
+
+    if event_size_dw != 0:
+        if event_start_dw != (statistics_start_dw + statistics_size_dw):
+            sys.exit(f"Event Identifier String Table Start value is invalid: {event_start_dw}")
+        if (event_start + event_size) > s_len:
+            sys.exit(f"Event Identifier String Table Size value is invalid: {event_size_dw}")
+        if (event_size % 16) != 0:
+            sys.exit(f"Event Identifier String Table Size value is not a multiple of 16: {event_size}")
+
+    vu_event_start_dw = int.from_bytes(strings[96:103], "little")
+    vu_event_start = vu_event_start_dw * 4
+    vu_event_size_dw = int.from_bytes(strings[104:111], "little")
+    vu_event_size = vu_event_size_dw * 4
+
+    if vu_event_size_dw != 0:
+        if vu_event_start_dw != (event_start_dw + event_size_dw):
+            sys.exit(f"VU Event Identifier String Table Start value is invalid: {event_start_dw}")
+        if (vu_event_start + vu_event_size) > s_len:
+            sys.exit(f"VU Event Identifier String Table Size value is invalid: {event_size_dw}")
+        if (vu_event_size % 16) != 0:
+            sys.exit(f"Event Identifier String Table Size value is not a multiple of 16: {vu_event_size}")
+
+    ascii_start_dw = int.from_bytes(strings[112:119], "little")
+    ascii_start = ascii_start_dw * 4
+    ascii_size_dw = int.from_bytes(strings[120:127], "little")
+    ascii_size = ascii_size_dw * 4
+
+    if ascii_start_dw != (vu_event_start_dw + vu_event_size_dw):
+        sys.exit(f"ASCII Table Start value is invalid: {ascii_start_dw}")
+
+    if (ascii_start + ascii_size) > s_len:
+        sys.exit(f"ASCII Table Size value is invalid: {ascii_size_dw}")
+
+    # Extract the FIFO names of up to 16 characters
+    data["fifo"] = {}
+    for x in range(1, 16):
+        fifo_val = int.from_bytes(strings[128 + ((x - 1) * 16) : 143 + ((x - 1) * 16)], "little")
+        if fifo_val == 0:
+            fifo_name = f"FIFO {x}"
+        else:
+            fifo_name = str(strings[128 + ((x - 1) * 16) : 143 + ((x - 1) * 16)])
+
+        data["fifo"][str(x)] = {"name": fifo_name}
+
+    reserved = int.from_bytes(strings[431:384], "little")
+    if reserved != 0:
+        sys.exit("Reserved bytes 431:376 are not cleared to 0h.")
+
+    # Parse statistics strings
+    last_identifier = 0
+    if statistics_size_dw > 0:
+        print("Parsing String log page ... Statistics Identifiers Table")
+
+        data["statistics"] = {}
+        current_stat = statistics_start
+        end_stat = current_stat + statistics_size
+
+        while current_stat < end_stat:
+            identifier = int.from_bytes(strings[current_stat : current_stat + 2], "little")
+            if identifier < 0x8000:
+                sys.exit(f"Statistic Identifier 0x{identifier:x} is not a vendor unique value.")
+
+            if identifier < last_identifier:
+                sys.exit(f"Idententifiers are not sorted current identifier: 0x{identifier:x} previous identifier: 0x{last_identifier:x}")
+            elif identifier == last_identifier:
+                sys.exit(f"Identicle idententifiers in the table: 0x{identifier:x}")
+
+            reserved = strings[current_stat + 2]
+            if reserved != 0:
+                sys.exit(f"Statistic Identifier 0x{identifier:x} reserved field value of {reserved} is not cleared to 0h.")
+
+            stat_len = strings[current_stat + 3] + 1  # convert 0's based number
+            stat_offset_dw = int.from_bytes(strings[current_stat + 4 : current_stat + 12], "little")
+            stat_offset = stat_offset_dw * 4
+
+            if stat_offset_dw >= (ascii_size_dw):
+                sys.exit(f"Statistic Identifier 0x{identifier:x} offset field value of {stat_offset_dw} is not within the ASCII Table.")
+
+            if (stat_offset + stat_len) > ascii_size:
+                sys.exit(f"Statistic Identifier 0x{identifier:x} size field value of {stat_len - 1} is not within the ASCII table.")
+
+            reserved = int.from_bytes(strings[current_stat + 12 : current_stat + 16], "little")
+            if reserved != 0:
+                sys.exit(f"Statistic Identifier 0x{identifier:x} reserved field value of {reserved} is not cleared to 0h.")
+
+            data["statistics"][hex(identifier)] = {
+                "identifier": identifier,
+                "string": str(strings[ascii_start + stat_offset : ascii_start + stat_offset + stat_len]),
+            }
+
+            # Validate the unused string locations are spaces
+            mod = (ascii_start + stat_offset + stat_len) % 4
+            if mod != 0:
+                for x in range(4 - mod):
+                    if int(strings[ascii_start + stat_offset + stat_len + x]) != 0x20:
+                        sys.exit(
+                            f"Unused ASCII table character is not set to <space> after the string: {data['statistics'][hex(identifier)]['string']}"
+                        )
+
+            last_identifier = identifier
+            current_stat += 16
+
+    # Parse event strings
+    if event_size_dw > 0:
+        print("Parsing String log page ... Event Identifiers Table")
+
+        data["events"] = {}
+        current_event = event_start
+        end_event = current_event + event_size
+
+        previous_debug_class = 0
+
+        while current_event < end_event:
+            debug_class = strings[current_event]
+            if (debug_class) < 0x80:
+                sys.exit(f"Event class of 0x{debug_class:x} is not a vendor unique value.")
+
+            if debug_class < previous_debug_class:
+                sys.exit(
+                    f"Debug class values are not sorted current debug class: 0x{debug_class:x} previous debug class: 0x{previous_debug_class:x}"
+                )
+            elif debug_class > previous_debug_class:
+                previous_debug_class = debug_class
+                last_identifier = -1  # identifiers are sorted within each debug class
+
+            identifier = int.from_bytes(strings[current_event + 1 : current_event + 3], "little")
+
+            if identifier < last_identifier:
+                sys.exit(f"Idententifiers are not sorted current identifier: 0x{identifier:x} previous identifier: 0x{last_identifier:x}")
+            elif identifier == last_identifier:
+                sys.exit(f"Identicle idententifiers in the table: 0x{identifier:x}")
+
+            event_len = strings[current_event + 3] + 1  # convert 0's based number
+            event_offset_dw = int.from_bytes(strings[current_event + 4 : current_event + 12], "little")
+            event_offset = event_offset_dw * 4
+
+            if event_offset_dw >= (ascii_size_dw):
+                sys.exit(f"Event Identifier 0x{identifier:x} offset field value of {event_offset_dw} is not within the ASCII table.")
+
+            if (event_offset + event_len) > ascii_size:
+                sys.exit(f"Event Identifier 0x{identifier:x} size field value of {event_len - 1} is not within the ASCII table.")
+
+            reserved = int.from_bytes(strings[current_event + 12 : current_event + 16], "little")
+            if reserved != 0:
+                sys.exit(f"Event Identifier 0x{identifier:x} reserved field value in bytes 15:12 are not cleared to 0h.")
+
+            data["events"][hex(debug_class) + hex(identifier)] = {
+                "class": debug_class,
+                "identifier": identifier,
+                "string": str(strings[ascii_start + event_offset : ascii_start + event_offset + event_len]),
+            }
+
+            # Validate the unused string locations are spaces
+            mod = (ascii_start + event_offset + event_len) % 4
+            if mod != 0:
+                for x in range(4 - mod):
+                    if int(strings[ascii_start + event_offset + event_len + x]) != 0x20:
+                        sys.exit(
+                            f"Unused ASCII table character is not set to <space> after the string: {data['events'][hex(debug_class) + hex(identifier)]['string']}"
+                        )
+
+            last_identifier = identifier
+            current_event += 16
+
+    # Parse VU event strings
+    if vu_event_size_dw > 0:
+        print("Parsing String log page ... Vender Unique (VU) Event Identifiers Table")
+
+        data["vu_events"] = {}
+        current_vu_event = vu_event_start
+        end_vu_event = current_vu_event + vu_event_size
+
+        previous_debug_class = 0
+
+        while current_vu_event < end_vu_event:
+            debug_class = strings[current_vu_event]
+            if (debug_class < 1) or (debug_class > 9):
+                sys.exit(f"VU Event byte 0 is not a valid VU Header class: {debug_class}")
+
+            if debug_class < previous_debug_class:
+                sys.exit(
+                    f"Debug class values are not sorted current debug class: 0x{debug_class:x} previous debug class: 0x{previous_debug_class:x}"
+                )
+            elif debug_class > previous_debug_class:
+                previous_debug_class = debug_class
+                last_identifier = -1  # identifiers are sorted within each debug class
+
+            identifier = int.from_bytes(strings[current_vu_event + 1 : current_vu_event + 3], "little")
+
+            if identifier < last_identifier:
+                sys.exit(f"Idententifiers are not sorted current identifier: 0x{identifier:x} previous identifier: 0x{last_identifier:x}")
+            elif identifier == last_identifier:
+                sys.exit(f"Identicle idententifiers in the table: 0x{identifier:x}")
+
+            vu_event_len = strings[current_vu_event + 3] + 1  # convert 0's based number
+            vu_event_offset_dw = int.from_bytes(strings[current_vu_event + 4 : current_vu_event + 12], "little")
+            vu_event_offset = vu_event_offset_dw * 4
+
+            if vu_event_offset_dw > (ascii_size_dw):
+                sys.exit(f"VU Event Identifier 0x{identifier:x} offset value of {vu_event_offset_dw} is not within the ASCII table.")
+
+            if (vu_event_offset + vu_event_len) > ascii_size:
+                sys.exit(f"VU Event Identifier 0x{identifier:x} size value of {event_len - 1} is not within the ASCII table.")
+
+            reserved = int.from_bytes(strings[current_vu_event + 12 : current_vu_event + 16], "little")
+            if reserved != 0:
+                sys.exit(f"VU Event Identifier 0x{identifier:x} reserved field value in bytes 15:12 are not cleared to 0h.")
+
+            data["vu_events"][hex(debug_class) + hex(identifier)] = {
+                "class": debug_class,
+                "identifier": identifier,
+                "string": str(strings[ascii_start + vu_event_offset : ascii_start + vu_event_offset + vu_event_len]),
+            }
+            # Validate the unused string locations are spaces
+            mod = (ascii_start + vu_event_offset + vu_event_len) % 4
+            if mod != 0:
+                for x in range(4 - mod):
+                    if int(strings[ascii_start + vu_event_offset + vu_event_len + x]) != 0x20:
+                        sys.exit(
+                            f"Unused ASCII table character is not set to <space> after the string: {data['vu_events'][hex(debug_class) + hex(identifier)]['string']}"
+                        )
+
+            last_identifier = identifier
+            current_vu_event += 16
+
+    return data
+
+
+# Parse and print the VU Reason Code
+#
+# Input:
+#      reason : bytearray of the reason code
+#
+# Output: None
+def parse_vu_reason_code(reason):
+    print("\t\tReason Identifier: ")
+
+    reason_start = 384
+    err_id = int.from_bytes(reason[0:64], "little")
+    print(f"\t\t\tError ID: 0x{err_id:x}")
+
+    file_id = int.from_bytes(reason[64:72], "little")
+    print(f"\t\t\tFile ID: 0x{file_id:x}")
+
+    line_num = int.from_bytes(reason[72:74], "little")
+    print(f"\t\t\tLine Number ID: {line_num}")
+
+    flags = reason[74]
+    if (flags & 0x01) != 0:
+        print("\t\t\tLine Number is valid")
+    else:
+        print("\t\tLine Number is not valid")
+    if (flags & 0x02) != 0:
+        print("\t\t\tFile ID is valid")
+    else:
+        print("\t\t\tFile ID is not valid")
+    if (flags & 0x04) != 0:
+        print("\t\t\tError ID is valid")
+    else:
+        print("\t\tError ID is not valid")
+    if (flags & 0x08) != 0:
+        print("\t\t\tVU Reason Extension is valid")
+    else:
+        print("\t\tVU Reason Extension is not valid")
+    if (flags & 0xF0) != 0:
+        sys.exit("Reserved field in the Reason Idenifier byte 74 is not cleared to 0h")
+
+    reserved = int.from_bytes(reason[75:96], "little")
+    if reserved != 0:
+        sys.exit("Reserved bytes 75:95 are not cleared to 0h.")
+
+    vu_reason_code = int.from_bytes(reason[96:128], "little")
+    print(f"\t\t\tVU Reason Extension: 0x{vu_reason_code:x}")
+
+
+# NVMe Telemetry scopestrings
+telemetry_scope_str = [
+    "Not Reported",  # 0
+    "Controller",  # 1
+    "NVM subsystem",  # 2
+]
+
+# Parse and print the NVMe Telemetry log page header
+#
+# Input:
+#      telemetry_header : bytearray of the Telemetry log page header
+#      tel_len          : length of telemetry
+#
+# Output:
+#
+#     (Data Area 1 Last Block, Data Area 2 Last Block, Data Area 3 Last Block, Data Area 4 Last Block)
+
+
+def parse_telemetry_header(telemetry_header, tel_len):
+    # Validate the header size
+    if len(telemetry_header) != 512:
+        sys.exit(f"Invalid Telemetry log page header size: {len(telemetry_header)}.")
+
+    # Validate the telemetry header
+    log_id = telemetry_header[0]
+    if log_id != 7 and log_id != 8:
+        sys.exit(f"Telemetry Log Identifier of {log_id} is not the correct value.")
+
+    if log_id == 7:
+        print("\nParsng Telemetry Host-Initiated Log Page ... \n")
+    else:
+        print("\nParsng Telemetry Controller-Initiated Log Page ... \n")
+    print("\tLog Page Header:\n")
+
+    reserved = int.from_bytes(telemetry_header[1:5], "little")
+    if reserved != 0:
+        sys.exit("Reserved bytes 4:1 are not cleared to 0h.")
+
+    ieee = int.from_bytes(telemetry_header[5:8], "little")
+    print(f"\t\tIEEE OUI Identifier (IEEE): 0x{ieee:x}")
+
+    data_area_1_last_block = int.from_bytes(telemetry_header[8:10], "little")
+    if (512 + (data_area_1_last_block * 512)) > tel_len:
+        sys.exit(f"Data Area 1 size {data_area_1_last_block * 512} is larger than telemetry data.")
+    print(f"\t\tTelemetry Host-Initiated Data Area 1 Last Block: {data_area_1_last_block}")
+
+    if data_area_1_last_block != 32:
+        sys.exit(f"Data Area 1 size not per OCP spec of 16K bytes: {data_area_1_last_block}")
+
+    data_area_2_last_block = int.from_bytes(telemetry_header[10:12], "little")
+    if (512 + (data_area_2_last_block * 512)) > tel_len:
+        sys.exit(f"Data Area 2 size {data_area_1_last_block * 512} is larger than telemetry data.")
+    print(f"\t\tTelemetry Host-Initiated Data Area 2 Last Block: {data_area_2_last_block}")
+
+    data_area_3_last_block = int.from_bytes(telemetry_header[12:14], "little")
+    if (512 + (data_area_3_last_block * 512)) > tel_len:
+        sys.exit(f"Data Area 3 size {data_area_3_last_block * 512} is larger than telemetry data.")
+    print(f"\t\tTelemetry Host-Initiated Data Area 3 Last Block: {data_area_3_last_block}")
+
+    reserved = int.from_bytes(telemetry_header[14:16], "little")
+    if reserved != 0:
+        sys.exit("Reserved bytes 15:14 are not cleared to 0h.")
+
+    data_area_4_last_block = int.from_bytes(telemetry_header[16:20], "little")
+    if (512 + (data_area_4_last_block * 512)) > tel_len:
+        sys.exit(f"Data Area 4 size {data_area_4_last_block * 512} is larger than telemetry data.")
+    print(f"\t\tTelemetry Host-Initiated Data Area 4 Last Block: {data_area_4_last_block}")
+
+    # Parse the remaining header based on the telemtry log type
+    if log_id == 7:  # NVMe Telemetry Host-Initiated log Page
+        reserved = int.from_bytes(telemetry_header[20:380], "little")
+        if reserved != 0:
+            sys.exit("Reserved bytes 379:20 are not cleared to 0h.")
+
+        host_scope = telemetry_header[380]
+        if host_scope > 2:
+            sys.exit(f"Telemetry Host-Initiated Scope has an invalid number of : {host_scope}")
+        print(f"\t\tTelemetry Host-Initiated Scope: {telemetry_scope_str[host_scope]}")
+
+        host_gen_num = telemetry_header[381]
+        print(f"\t\tTelemetry Host-Initiated Data Generation Number: {host_gen_num}")
+
+        data_available = telemetry_header[382]
+        if data_available > 1:
+            sys.exit(f"Telemetry Controller-Initiated Data Available has an invalid number of : {data_available}")
+        print(f"\t\tTelemetry Controller-Initiated Data Available: {data_available}")
+
+        controller_gen_num = telemetry_header[383]
+        print(f"\t\tTelemetry Controller-Initiated Data Generation Number: {controller_gen_num}")
+    else:  # NVMe Telemetry Controller-Initiated log Page
+        reserved = int.from_bytes(telemetry_header[20:381], "little")
+        if reserved != 0:
+            sys.exit("Reserved bytes 380:20 are not cleared to 0h.")
+
+        controller_scope = telemetry_header[381]
+        if controller_scope > 2:
+            sys.exit(f"Telemetry Controller-Initiated Scope has an invalid number of : {controller_scope}")
+        print(f"\t\tTelemetry Controller-Initiated Scope: {telemetry_scope_str[controller_scope]}")
+
+        data_available = telemetry_header[382]
+        if data_available == 1:
+            print("\t\tTelemetry Controller-Initiated Data Available: Available")
+        elif data_available == 0:
+            sys.exit("Telemetry Controller-Initiated Data Available states no data exists")
+        else:
+            sys.exit(f"Telemetry Controller-Initiated Data Available has an invalid number of : {data_available}")
+
+        controller_gen_num = telemetry_header[383]
+        print(f"\t\tTelemetry Controller-Initiated Data Generation Number: {controller_gen_num}")
+
+    parse_vu_reason_code(telemetry_header[384:512])
+
+    return (data_area_1_last_block, data_area_2_last_block, data_area_3_last_block, data_area_4_last_block)
+
+
+# Parse and print NVMe Timestamp
+#
+# Input:
+#      timestamp  : bytearray of a NVMe timestamp
+#      pre_test   : text to print first (i.e., tabs for example)
+#
+# Output: None
+#
+def parse_nvm_timestamp(timestamp, pre_text):
+    if len(timestamp) != 8:
+        sys.exit("Timestamp byte array is not 8 bytes in length.")
+
+    print(f"{pre_text}\t\tTimestamp: ")
+    time = int.from_bytes(timestamp[0:6], "little")
+    print(f"{pre_text}\t\t\tTime: {time}")
+
+    attr = timestamp[6]
+
+    if (attr & 0xF0) != 0:
+        sys.exit("Reserved field in the timestamp byte 6 is not cleared to 0h")
+    if (attr & 0x01) != 0:
+        print(
+            f"{pre_text}\t\t\tThe controller may have stopped counting during vendor specific intervals after the Timestamp value was initialized."
+        )
+    else:
+        print(f"{pre_text}\t\t\tThe controller counted time in milliseconds continuously since the Timestamp value was initialized.")
+    timestamp_origin = attr >> 1
+    if timestamp_origin == 0:
+        print(f"{pre_text}\t\t\tThe Timestamp field was initialized to 0h by a Controller Level Reset")
+    elif timestamp_origin == 1:
+        print(f"{pre_text}\t\t\tThe Timestamp field was initialized with a Timestamp value using a Set Features command")
+    else:
+        print(f"{pre_text}\t\t\tThe Timestamp Origin field has an invalid value: {timestamp_origin}")
+
+    reserved = timestamp[7]
+    if reserved != 0:
+        sys.exit("Reserved byte 7 in the Timestamp is not cleared to 0h.")
+
+
+# Parse and print the SMART / Health Information log page (Log Identifier 02h)
+#
+# Input:
+#      smart  : bytearray of a NVMe SMART / Health Information log page
+#
+# Output: None
+#
+def parse_smart_health_info(smart):
+    if len(smart) != 512:
+        sys.exit("Size of the input bytearray for the NVMe SMART / Health Information log page is not 512 bytes.")
+
+    print("\t\tSMART / Health Information log page 02h:")
+    critical_warning = smart[0]
+    if critical_warning == 0:
+        print("\t\t\tNo critical warnings")
+    else:
+        if critical_warning & 0x01:
+            print("\t\t\tAvailable spare capacity warning.")
+        if critical_warning & 0x02:
+            print("\t\t\tCritical temperature warning.")
+        if critical_warning & 0x04:
+            print("\t\t\tCritical reliability warning.")
+        if critical_warning & 0x08:
+            print("\t\t\tMedia in read-only warning.")
+        if critical_warning & 0x10:
+            print("\t\t\tVolatile memory backup device failure warning.")
+        if critical_warning & 0x20:
+            print("\t\t\tPersistent Memory Region warning.")
+        if critical_warning & 0xC0:
+            sys.exit("Reserved bits 7:6 in byte 0 is not cleared to 0h.")
+
+    comp_temp = int.from_bytes(smart[1:3], "little")
+    print(f"\t\t\tComposite Temperature: {comp_temp} Kelvin.")
+
+    av_spare = smart[3]
+    if av_spare > 100:
+        sys.exit(f"Available Spare value of {av_spare} is invalid.")
+    print(f"\t\t\tAvailable Spare: {av_spare}%.")
+
+    av_spare = smart[4]
+    if av_spare > 100:
+        sys.exit(f"Available Spare Threshold value of {av_spare} is invalid.")
+    print(f"\t\t\tAvailable Spare Threshold: {av_spare}%.")
+
+    used = smart[5]
+    print(f"\t\t\tPercent Used: {used}%.")
+
+    critical_warning = smart[6]
+    if critical_warning == 0:
+        print("\t\t\tNo Endurance Group Summary critical warnings")
+    else:
+        if critical_warning & 0x01:
+            print("\t\t\tEndurance Group Summary available spare capacity warning.")
+        if critical_warning & 0x02:
+            sys.exit("Reserved bit 1 in byte 6 is not cleared to 0h.")
+        if critical_warning & 0x04:
+            print("\t\t\tEndurance Group Summary critical reliability warning.")
+        if critical_warning & 0x08:
+            print("\t\t\tEndurance Group Summary namespace in read-only warning.")
+        if critical_warning & 0xF0:
+            sys.exit("Reserved bits 7:4 in byte 6 is not cleared to 0h.")
+
+    reserved = int.from_bytes(smart[7:32], "little")
+    if reserved != 0:
+        sys.exit("Reserved bytes 7:31 are not cleared to 0h.")
+
+    data_units_read = int.from_bytes(smart[32:48], "little")
+    print(f"\t\t\tData Units Read: {data_units_read}")
+
+    data_units_written = int.from_bytes(smart[48:64], "little")
+    print(f"\t\t\tData Units Written: {data_units_written}")
+
+    host_read_commands = int.from_bytes(smart[64:80], "little")
+    print(f"\t\t\tHost Read Command: {host_read_commands}")
+
+    host_write_commands = int.from_bytes(smart[80:96], "little")
+    print(f"\t\t\tHost Write Command: {host_write_commands}")
+
+    busy = int.from_bytes(smart[96:112], "little")
+    print(f"\t\t\tController Busy Time: {busy}")
+
+    ps = int.from_bytes(smart[112:128], "little")
+    print(f"\t\t\tPower Cycles: {ps}")
+
+    poh = int.from_bytes(smart[128:144], "little")
+    print(f"\t\t\tPower On Hours: {poh}")
+
+    shut = int.from_bytes(smart[144:160], "little")
+    print(f"\t\t\tUnsafe Shutdowns: {shut}")
+
+    err = int.from_bytes(smart[160:176], "little")
+    print(f"\t\t\tMedia and Data Integrity Errors: {err}")
+
+    err = int.from_bytes(smart[176:192], "little")
+    print(f"\t\t\tNumber of Error Information Log Entries: {err}")
+
+    time = int.from_bytes(smart[192:196], "little")
+    print(f"\t\t\tWarning Composite Temperature Time: {time}")
+
+    time = int.from_bytes(smart[196:200], "little")
+    print(f"\t\t\tCritical Composite Temperature Time: {time}")
+
+    temp = int.from_bytes(smart[200:202], "little")
+    if temp == 0:
+        print("\t\t\tTemperature Sensor 1 is not supported.")
+    else:
+        print(f"\t\t\tTemperature Sensor 1: {temp} Kelvin.")
+
+    temp = int.from_bytes(smart[202:204], "little")
+    if temp == 0:
+        print("\t\t\tTemperature Sensor 2 is not supported.")
+    else:
+        print(f"\t\t\tTemperature Sensor 2: {temp} Kelvin.")
+
+    temp = int.from_bytes(smart[204:206], "little")
+    if temp == 0:
+        print("\t\t\tTemperature Sensor 3 is not supported.")
+    else:
+        print(f"\t\t\tTemperature Sensor 3: {temp} Kelvin.")
+
+    temp = int.from_bytes(smart[206:208], "little")
+    if temp == 0:
+        print("\t\t\tTemperature Sensor 4 is not supported.")
+    else:
+        print(f"\t\t\tTemperature Sensor 4: {temp} Kelvin.")
+
+    temp = int.from_bytes(smart[208:210], "little")
+    if temp == 0:
+        print("\t\t\tTemperature Sensor 5 is not supported.")
+    else:
+        print(f"\t\t\tTemperature Sensor 5: {temp} Kelvin.")
+
+    temp = int.from_bytes(smart[210:212], "little")
+    if temp == 0:
+        print("\t\t\tTemperature Sensor 6 is not supported.")
+    else:
+        print(f"\t\t\tTemperature Sensor 6: {temp} Kelvin.")
+
+    temp = int.from_bytes(smart[212:214], "little")
+    if temp == 0:
+        print("\t\t\tTemperature Sensor 7 is not supported.")
+    else:
+        print(f"\t\t\tTemperature Sensor 7: {temp} Kelvin.")
+
+    temp = int.from_bytes(smart[214:216], "little")
+    if temp == 0:
+        print("\t\t\tTemperature Sensor 8 is not supported.")
+    else:
+        print(f"\t\t\tTemperature Sensor 8: {temp} Kelvin.")
+
+    cnt = int.from_bytes(smart[216:220], "little")
+    print(f"\t\t\tThermal Management Temperature 1 Transition Count: {cnt}")
+
+    cnt = int.from_bytes(smart[220:224], "little")
+    print(f"\t\t\tThermal Management Temperature 2 Transition Count: {cnt}")
+
+    time = int.from_bytes(smart[224:228], "little")
+    print(f"\t\t\tTotal Time for Thermal Management Temperature 1: {time}")
+
+    time = int.from_bytes(smart[228:232], "little")
+    print(f"\t\t\tTotal Time for Thermal Management Temperature 2: {time}")
+
+    reserved = int.from_bytes(smart[232:512], "little")
+    if reserved != 0:
+        sys.exit("Reserved bytes 511:232 are not cleared to 0h.")
+
+
+# Parse and print the OCP SMART / Health Information Extension log page (Log Identifier C0h)
+#
+# Input:
+#      smart  : bytearray of a OCP SMART / Health Information Extendion log page
+#
+# Output: None
+#
+def parse_smart_health_info_extension(smart):
+    print(f"smart: {type(smart)}\n")
+    if len(smart) != 512:
+        sys.exit("Size of the input bytearray for the OCP SMART / Health Information Extension log page is not 512 bytes.")
+
+    print("\t\tSMART / Health Information Extention log page C0h")
+
+    cnt = int.from_bytes(smart[0:16], "little")
+    print(f"\t\t\tPhysical Media Units Written: {cnt}")
+
+    cnt = int.from_bytes(smart[16:32], "little")
+    print(f"\t\t\tPhysical Media Units Read: {cnt}")
+
+    cnt = int.from_bytes(smart[32:38], "little")
+    print(f"\t\t\tBad User NAND Blocks Raw Count: {cnt}")
+
+    norm = int.from_bytes(smart[38:40], "little")
+    if norm > 100:
+        sys.exit(f"Bad User NAND Blocks Normalized Value of {norm}% is invalid.")
+    print(f"\t\t\tBad User NAND Blocks Normalized Value: {norm}")
+
+    cnt = int.from_bytes(smart[40:46], "little")
+    print(f"\t\t\tBad System NAND Blocks Raw Count: {cnt}")
+
+    norm = int.from_bytes(smart[46:48], "little")
+    if norm > 100:
+        sys.exit(f"Bad System NAND Blocks Normalized Value of {norm}% is invalid.")
+    print(f"\t\t\tBad System NAND Blocks Normalized Value: {norm}")
+
+    cnt = int.from_bytes(smart[48:56], "little")
+    print(f"\t\t\tXOR Recovery Count: {cnt}")
+
+    cnt = int.from_bytes(smart[56:64], "little")
+    print(f"\t\t\tUncorrectable Read Error Count: {cnt}")
+
+    cnt = int.from_bytes(smart[64:72], "little")
+    print(f"\t\t\tSoft ECC Error Count: {cnt}")
+
+    cnt = int.from_bytes(smart[72:80], "little")
+    print(f"\t\t\tEnd to End Correction Counts: {cnt}")
+
+    used = smart[80]
+    print(f"\t\t\tSystem Data % Used: {used}%.")
+
+    cnt = int.from_bytes(smart[81:88], "little")
+    print(f"\t\t\tRefresh Counts: {cnt}")
+
+    cnt = int.from_bytes(smart[88:92], "little")
+    print(f"\t\t\tMaximum User Data Erase Count: {cnt}")
+
+    cnt = int.from_bytes(smart[92:96], "little")
+    print(f"\t\t\tMinimum User Data Erase Count: {cnt}")
+
+    cnt = smart[96]
+    print(f"\t\t\tNumber of thermal throttling events: {cnt}")
+
+    status_str = ["unthrottled", "first level throttle", "2nd level throttle", "3rd level throttle"]
+    status = smart[97]
+    if status > 4:
+        sys.exit(f"Current Throttling Status value of {status} is invalid.")
+    print(f"\t\t\tCurrent Throttling Status: {status_str[status]}")
+
+    print("\t\t\tDSSD Specification Version:")
+
+    ver = smart[98]
+    if ver != 0:
+        sys.exit(f"DSSD Specification Version - Errta Version value of {ver} is invalid.")
+    print(f"\t\t\t\tErrta Version:{ver}")
+
+    ver = int.from_bytes(smart[99:101], "little")
+    if ver != 0:
+        sys.exit(f"DSSD Specification Version - Point Version value of {ver} is invalid.")
+    print(f"\t\t\t\tPoint Version:{ver}")
+
+    ver = int.from_bytes(smart[101:103], "little")
+    if ver != 5:
+        sys.exit(f"DSSD Specification Version - Minor Version value of {ver} is invalid.")
+    print(f"\t\t\t\tMinor Version:{ver}")
+
+    ver = smart[103]
+    if ver != 2:
+        sys.exit(f"DSSD Specification Version - Major Version value of {ver} is invalid.")
+    print(f"\t\t\t\tMajor Version:{ver}")
+
+    cnt = int.from_bytes(smart[104:112], "little")
+    print(f"\t\t\tPCIe Correctable Error Count: {cnt}")
+
+    cnt = int.from_bytes(smart[112:116], "little")
+    print(f"\t\t\tIncomplete Shutdowns: {cnt}")
+
+    reserved = int.from_bytes(smart[116:120], "little")
+    if reserved != 0:
+        sys.exit("Reserved bytes 119:116 are not cleared to 0h.")
+
+    cnt = smart[120]
+    if cnt > 100:
+        sys.exit(f"% Free Blocks value of {cnt}% is invalid.")
+    print(f"\t\t\t% Free Blocks: {cnt}%.")
+
+    reserved = int.from_bytes(smart[121:128], "little")
+    if reserved != 0:
+        sys.exit("Reserved bytes 127:121 are not cleared to 0h.")
+
+    cnt = int.from_bytes(smart[128:130], "little")
+    print(f"\t\t\tCapacitor Health: {cnt}%.")
+
+    errata = smart[130]
+    print(f"\t\t\tNVMe Errata Version: {chr(errata)}.")
+
+    reserved = int.from_bytes(smart[131:136], "little")
+    if reserved != 0:
+        sys.exit("Reserved bytes 135:131 are not cleared to 0h.")
+
+    cnt = int.from_bytes(smart[136:144], "little")
+    print(f"\t\t\tUnaligned I/O: {cnt}")
+
+    cnt = int.from_bytes(smart[144:152], "little")
+    print(f"\t\t\tSecurity Version Number: 0x{cnt:x}")
+
+    cnt = int.from_bytes(smart[152:160], "little")
+    print(f"\t\t\tTotal NUSE: {cnt}")
+
+    cnt = int.from_bytes(smart[160:176], "little")
+    print(f"\t\t\tPLP Start Count: {cnt}")
+
+    cnt = int.from_bytes(smart[176:192], "little")
+    print(f"\t\t\tEndurance Estimate: {cnt}")
+
+    cnt = int.from_bytes(smart[192:200], "little")
+    print(f"\t\t\tPCIe Link Retraining Count: {cnt}")
+
+    cnt = int.from_bytes(smart[200:208], "little")
+    print(f"\t\t\tPower State Change Count: {cnt}")
+
+    ver = int.from_bytes(smart[208:224], "little")
+    print(f"\t\t\tHardware Version:{ver}")
+
+    reserved = int.from_bytes(smart[224:494], "little")
+    if reserved != 0:
+        sys.exit("Reserved bytes 493:224 are not cleared to 0h.")
+
+    ver = int.from_bytes(smart[494:496], "little")
+    if ver != 3:
+        sys.exit(f"Log Page Version value of {ver} is invalid.")
+    print(f"\t\t\tLog Page Version:{ver}")
+
+    guid = int.from_bytes(smart[496:512], "little")
+    if guid != 0xAFD514C97C6F4F9CA4F2BFEA2810AFC5:
+        sys.exit(f"GUID value is not the correct value: 0x{guid:x}")
+    print(f"\t\t\tLog Page GUID:0x{guid:x}")
+
+
+# Parse and print the FIFO information in Data Area 1
+#
+# Input:
+#      fifo_array  : bytearray of the data area 1 FIFO information specifying the data area, start and end.
+#
+# Output: A disctionary of FIFOs location within Data Area 1 & 2
+#
+#     {'<fifo #>' : {'data area' : data area number,
+#                    'start_dw'  : Dword start location for the FIFO in the data area
+#                    'end_dw'    : Dword end location for the FIFO in the data area}
+def get_fifo_data(fifo_array):
+    fifo_area_str = ["Does not exist", "Data Area 1", "Data Area 2"]
+    fifo = {}
+
+    for x in range(1, 17):
+        fifo_area = fifo_array[x - 1]
+        if fifo_area > 2:
+            sys.exit(f"Event FIFO {x} Data Area value of {fifo_area} is invalid.")
+
+        fifo[str(x)] = {"data area": fifo_area}
+
+        print(f"\t\tEvent FIFO {x}: {fifo_area_str[fifo_area]}")
+
+    for x in range(1, 17):
+        offset_fifo_start_dw = 16 + ((x - 1) * 16)
+
+        fifo_start_dw = int.from_bytes(fifo_array[offset_fifo_start_dw : offset_fifo_start_dw + 8], "little")
+        fifo_size_dw = int.from_bytes(fifo_array[offset_fifo_start_dw + 8 : offset_fifo_start_dw + 16], "little")
+
+        fifo[str(x)]["start dw"] = fifo_start_dw
+        fifo[str(x)]["size dw"] = fifo_size_dw
+
+        print(f"\t\tEvent FIFO {x} Start (Dword): 0x{fifo_start_dw:x} (0x{fifo_start_dw * 4:x})")
+        print(f"\t\tEvent FIFO {x} Size (Dword): 0x{fifo_size_dw:x} (0x{fifo_size_dw * 4:x})")
+
+    return fifo
+
+
+# Parse and print the statistics
+# fmt: off
+# OCP defined strings for identifiers 1-29
+stats_ocp_str = ["Error, this entry does not exist.",  # 0
+                 "Outstanding Admin Commands",         # 1
+                 "Host Write Bandwidth",               # 2
+                 "GC Write Bandwidth",                 # 3
+                 "Active Namespaces",                  # 4
+                 "Internal Write Workload",            # 5
+                 "Internal Read Workload",             # 6
+                 "Internal Write Queue Depth",         # 7
+                 "Internal Read Queue Depth",          # 8
+                 "Pending Trim LBA Count",             # 9
+                 "Host Trim LBA Request Count",        # 10
+                 "Current NVMe Power State",           # 11
+                 "Current DSSD Power State",           # 12
+                 "Program Fail Count",                 # 13
+                 "Erase Fail Count",                   # 14
+                 "Read Disturb Writes",                # 15
+                 "Retention Writes",                   # 16
+                 "Wear Leveling Writes",               # 17
+                 "Read Recovery Writes",               # 18
+                 "GC Writes",                          # 19
+                 "SRAM Correctable Count",             # 20
+                 "DRAM Correctable Count",             # 21
+                 "SRAM Uncorrectable Count",           # 22
+                 "DRAM Uncorrectable Count",           # 23
+                 "Data Integrity Error Count",         # 24
+                 "Read Retry Error Count",             # 25
+                 "PERST Events Count",                 # 26
+                 "Max Die Bad Block",                  # 27
+                 "Max NAND Channel Bad Block",         # 28
+                 "Minimum NAND Channel Bad Block",     # 29
+]
+
+# OCP defined behavior type definitions
+behavior_type_str = ["Error, this entry does not exist.",                                                       # 0
+                     "Saturating Counter - No  Reset Persistent - No  Power Cycle/PERST Persistent - No",       # 1
+                     "Saturating Counter - No  Reset Persistent - Yes Power Cycle/PERST Persistent - Yes",      # 2
+                     "Saturating Counter - Yes Reset Persistent - Yes Power Cycle/PERST Persistent - No",       # 3
+                     "Saturating Counter - Yes Reset Persistent - Yes Power Cycle/PERST Persistent - Yes",      # 4
+                     "Saturating Counter - Yes Reset Persistent - No  Power Cycle/PERST Persistent - No",       # 5
+                     "Saturating Counter - No  Reset Persistent - Yes Power Cycle/PERST Persistent - No",       # 6
+]
+
+# OCP defined behavior type attributes: (saturating counter, reset persistent, power cycle/PERST persistent)
+behavior_type_attributes = [None,                   # 0
+                            (False, False, False),  # 1
+                            (False, True,  True),   # 2
+                            (True,  True,  False),  # 3
+                            (True,  True,  True),   # 4
+                            (True,  False, False),  # 5
+                            (False, True,  False),  # 6
+]
+
+# OCP defined dword values for identifiers 1-29
+dw_values = [1,     # 0
+             1,     # 1
+             1,     # 2
+             1,     # 3
+             1,     # 4
+             2,     # 5
+             2,     # 6
+             1,     # 7
+             1,     # 8
+             2,     # 9
+             2,     # 10
+             1,     # 11
+             1,     # 12
+             2,     # 13
+             2,     # 14
+             4,     # 15
+             4,     # 16
+             4,     # 17
+             2,     # 18
+             2,     # 19
+             1,     # 20
+             1,     # 21
+             1,     # 22
+             1,     # 23
+             1,     # 24
+             1,     # 25
+             1,     # 26
+             2,     # 27
+             2,     # 28
+             2,     # 29
+]
+# fmt: on
+
+# Parse and print a single statistic descriptor
+#
+# Input:
+#      data area  : integer specify which data area the static was defined
+#      statistics : bytearray of the remaining statistics descriptors to parse
+#      strings    : dictionary of the parsed string log page contining the VU ASCII strings
+#      pre_string : alignment string
+#
+# Output: The length, in bytes, of the statistic descriptor at statistics[0]
+def parse_a_statistic(data_area, statistics, strings, pre_string):
+    offset = 0
+    stat_len = len(statistics)
+
+    # If the identifier is 0h, then end of the list of statistics
+    identifier = int.from_bytes(statistics[offset : offset + 2], "little")
+    if identifier == 0:
+        sys.exit(f"Data Area {data_area} statistic Identifier 0x{identifier:x} is invalid.")
+    if (identifier > 29) and (identifier < 0x8000):
+        sys.exit(f"Data Area {data_area} statistic Identifier 0x{identifier:x} is invalid.")
+
+    if identifier >= 0x8000:
+        idx = hex(identifier)
+        if (idx in strings["statistics"]) == False:
+            sys.exit(f"Data Area {data_area} statistic Identifier 0x{identifier:x} does not exist in the Strings log page.")
+
+    behavior_type = statistics[offset + 2]
+    if (behavior_type == 0) or (behavior_type > 6):
+        sys.exit(f"Data Area {data_area} statistic Identifier 0x{identifier:x} behavior type value of {behavior_type} is invalid.")
+
+    namespace = statistics[offset + 3]
+
+    dw_len = int.from_bytes(statistics[offset + 4 : offset + 6], "little")
+    if identifier < 30:
+        if dw_len != dw_values[identifier]:
+            sys.exit(f"Data Area {data_area} statistic Identifier 0x{identifier:x} dword length value of {dw_len} is invalid.")
+    if dw_len == 0:
+        sys.exit(f"Data Area {data_area} statistic Identifier 0x{identifier:x} dword length value of 0h is invalid.")
+    if (offset + 4 + dw_len * 4) > stat_len:
+        sys.exit(f"Data Area {data_area} statistic Identifier 0x{identifier:x} dword length value of {dw_len} is invalid.")
+
+    reserved = int.from_bytes(statistics[offset + 6 : offset + 8], "little")
+    if reserved != 0:
+        sys.exit(f"Data Area {data_area} statistic Identifier 0x{identifier:x} reserved bytes 7:6 are not 0h.")
+
+    # Determine the description
+    if identifier < 0x8000:
+        description = stats_ocp_str[identifier]
+    else:
+        description = strings["statistics"][hex(identifier)]["string"]
+
+    print(f"\t\t{pre_string}Identifier        : 0x{identifier:x} ({identifier})")
+    print(f"\t\t\t{pre_string}Behavior Type : {behavior_type} ({behavior_type_str[behavior_type]})")
+
+    if namespace >= 128:
+        print(f"\t\t\t{pre_string}Namespace     : {namespace & 127}")
+    else:
+        print(f"\t\t\t{pre_string}Namespace     : Not specified")
+
+    print(f"\t\t\t{pre_string}Description   : {description}")
+
+    # Special case some OCP fields
+    if identifier == 0x1B:
+        worst_per = statistics[offset + 8]
+        if worst_per > 100:
+            sys.exit(
+                f"Data Area {data_area} statistic Identifier 0x{identifier:x} worst die % of bad blocks  value of {worst_per} is invalid."
+            )
+        reserved = statistics[offset + 9]
+        if reserved != 0:
+            sys.exit(f"Data Area {data_area} statistic Identifier 0x{identifier:x} {stats_ocp_str[identifier]} reserved byte 1 is not 0h.")
+        worst_raw = int.from_bytes(statistics[offset + 10 : offset + 12], "little")
+        reserved = int.from_bytes(statistics[offset + 12 : offset + 16], "little")
+        if reserved != 0:
+            sys.exit(
+                f"Data Area {data_area} statistic Identifier 0x{identifier:x} {stats_ocp_str[identifier]} reserved bytes 7:3 are not 0h."
+            )
+
+        print(f"\t\t\t{pre_string}Worst Die % of Bad Black         : {worst_per}%")
+        print(f"\t\t\t{pre_string}Worst Die Raw Number of Bad Black: {worst_raw}")
+    elif identifier == 0x1C:
+        worst_per = statistics[offset + 8]
+        if worst_per > 100:
+            sys.exit(
+                f"Data Area {data_area} statistic Identifier 0x{identifier:x} worst NAND Channel % of bad blocks  value of {worst_per} is invalid."
+            )
+        reserved = statistics[offset + 9]
+        if reserved != 0:
+            sys.exit(f"Data Area {data_area} statistic Identifier 0x{identifier:x} {stats_ocp_str[identifier]} reserved byte 1 is not 0h.")
+        worst_raw = int.from_bytes(statistics[offset + 10 : offset + 812], "little")
+        reserved = int.from_bytes(statistics[offset + 12 : offset + 16], "little")
+        if reserved != 0:
+            sys.exit(
+                f"Data Area {data_area} statistic Identifier 0x{identifier:x} {stats_ocp_str[identifier]} reserved bytes 7:4 are not 0h."
+            )
+
+        print(f"\t\t\t{pre_string}Worst NAND Channel % of Bad Black         : {worst_per}%")
+        print(f"\t\t\t{pre_string}Worst NAND Channel Raw Number of Bad Black: {worst_raw}")
+    elif identifier == 0x1D:
+        best_per = statistics[offset + 8]
+        if best_per > 100:
+            sys.exit(
+                f"Data Area {data_area} statistic Identifier 0x{identifier:x} worst NAND Channel % of bad blocks  value of {worst_per} is invalid."
+            )
+        reserved = statistics[offset + 9]
+        if reserved != 0:
+            sys.exit(f"Data Area {data_area} statistic Identifier 0x{identifier:x} {stats_ocp_str[identifier]} reserved byte 1 is not 0h.")
+        best_raw = int.from_bytes(statistics[offset + 10 : offset + 12], "little")
+        reserved = int.from_bytes(statistics[offset + 12 : offset + 16], "little")
+        if reserved != 0:
+            sys.exit(
+                f"Data Area {data_area} statistic Identifier 0x{identifier:x} {stats_ocp_str[identifier]} reserved bytes 7:4 are not 0h."
+            )
+
+        print(f"\t\t\t{pre_string}Best NAND Channel % of Bad Black         : {best_per}%")
+        print(f"\t\t\t{pre_string}Best NAND Channel Raw Number of Bad Black: {best_raw}")
+    else:
+        value = int.from_bytes(statistics[offset + 8 : offset + 8 + (dw_len * 4)], "little")
+        print(f"\t\t\t{pre_string}Value         : {value}")
+
+    return 8 + (dw_len * 4)
+
+
+# Parse the statistics for an area
+#
+# Input:
+#      data area  : integer specify which data area the static was defined
+#      statistics : bytearray of the statistics descriptors to parse
+#      strings    : dictionary of the parsed string log page contining the VU ASCII strings
+#
+# Output: None
+def parse_statistics(data_area, statistics, strings):
+    offset = 0
+    stat_len = len(statistics)
+
+    print(f"\n\tData Area {data_area} Statistics:\n")
+    while (offset + 8) < stat_len:  # The header for the Statistics Descriptor needs to exist
+        offset += parse_a_statistic(data_area, statistics[offset:], strings, "")
+        inc_counter("ocp_telemetry_statistics_decoded", (("data_area", str(data_area)),))
+
+
+# OCP defined class types
+class_type_str = [
+    "Reserved",
+    "Timestamp",
+    "PCIe Debug",
+    "NVMe Debug",
+    "Reset Debug",
+    "Boot Sequence",
+    "Firmware Assert",
+    "Temperature",
+    "Media",
+    "Media Wear",
+    "Static Snapshot",
+]
+
+# OCP defined Timestamp Event Identifiers
+timestamp_ocp_id = [
+    "Timestamp Host Command Issued",
+    "Timestamp Snapshot",
+    "Timestamp is Power on Hours",
+]
+
+# Parse and print a timestamp debug event
+#
+# Input:
+#      data area  : integer specify which data area the static was defined
+#      fifo_num:  : integer of the FIFO containing the event
+#      identifier : integer of event identifier
+#      dw_size    : integer containing the event Dword size
+#      event      : bytearray of the remaining events to parse where the first event is a Timestamp event
+#      strings    : dictionary of the parsed string log page contining the VU ASCII strings
+#
+# Output: None
+def parse_timestamp(data_area, fifo_num, identifier, dw_size, event, strings):
+    if (identifier > 3) and (identifier < 0x8000):
+        sys.exit(f"Data Area {data_area} FIFO {fifo_num} Timestamp event Identifier value of 0x{identifier:x} is invalid.")
+
+    if dw_size < 2:
+        sys.exit(f"Data Area {data_area} FIFO {fifo_num} Timestamp event dword size value of {dw_size} is invalid.")
+
+    if dw_size > 2:
+        vu_id = int.from_bytes(event[12:14], "little")
+        idx = hex(1) + hex(vu_id)
+        if (idx in strings["vu_events"]) == False:
+            sys.exit(
+                f"Data Area {data_area} FIFO {fifo_num} Timestamp event VU Identifier 0x{vu_id:x} does not exist in the string log file"
+            )
+        else:
+            description = strings["vu_events"][idx]["string"]
+        vu_value = int.from_bytes(event[14 : 14 + ((dw_size - 2) * 4)], "little")
+
+    print("\t\t\tTimespamp Event:")
+    if identifier < 0x8000:
+        print(f"\t\t\t\tIdentifier    : 0x{identifier:x} ({timestamp_ocp_id[identifier]})")
+    else:
+        print(f"\t\t\t\tIdentifier    : 0x{identifier:x} (Vendor Unique)")
+
+    parse_nvm_timestamp(event[4:12], "\t\t")
+
+    if dw_size > 2:
+        print(f"\t\t\t\tVU Identifier : 0x{vu_id:x}")
+        print(f"\t\t\t\tVU data       : 0x{vu_value:x}")
+        print(f"\t\t\t\tVU definition : 0x{vu_value:x}")
+        print_vu_extension_fields(event, 14)
+
+
+# OCP defined PCIe event identifiers
+pcie_ocp_id = [
+    "Link Up",
+    "Link Down",
+    "PCIe Error Detected",
+    "PERST Asserted",
+    "PERST De-asserted",
+    "Refclk Stable",
+    "Vmain Stable",
+    "Link Speed and Width Negotiated",
+]
+
+# OCP defined PCIe event state changes
+pcie_ocp_state = [
+    "Unchanged",
+    "Link Speed Changed",
+    "Link Width Changed",
+]
+
+# OCP defined PCIe event link speeds
+pci_ocp_link_speed = [
+    "Reserved",
+    "PCIe Gen1",
+    "PCIe Gen2",
+    "PCIe Gen3",
+    "PCIe Gen4",
+    "PCIe Gen5",
+    "PCIe Gen6",
+    "PCIe Gen7",
+]
+
+
+# OCP defined PCIe event link widths
+pci_ocp_link_width = [
+    "Reserved",
+    "x1",
+    "x2",
+    "x4",
+    "x8",
+    "x16",
+]
+
+# Parse and print a PCIe debug event
+#
+# Input:
+#      data area  : integer specify which data area the static was defined
+#      fifo_num:  : integer of the FIFO containing the event
+#      identifier : integer of event identifier
+#      dw_size    : integer containing the event Dword size
+#      event      : bytearray of the remaining events to parse where the first event is a PCIe event
+#      strings    : dictionary of the parsed string log page contining the VU ASCII strings
+#
+# Output: None
+def parse_pcie(data_area, fifo_num, identifier, dw_size, event, strings):
+    if (identifier > 7) and (identifier < 0x8000):
+        sys.exit(f"Data Area {data_area} FIFO {fifo_num} PCIe event Identifier value of 0x{identifier:x} is invalid.")
+
+    if dw_size < 1:
+        sys.exit(f"Data Area {data_area} FIFO {fifo_num} PCIe event dword size value of {dw_size} is invalid.")
+
+    if identifier == 7:
+        state = event[4]
+        if state > 2:
+            sys.exit(f"Data Area {data_area} FIFO {fifo_num} PCIe event State Changed Flag value of {state} is invalid.")
+
+        speed = event[5]
+        if (speed == 0) or (speed > 7):
+            sys.exit(f"Data Area {data_area} FIFO {fifo_num} PCIe event Link Speed value of {speed} is invalid.")
+
+        width = event[6]
+        if (width == 0) or (width > 5):
+            sys.exit(f"Data Area {data_area} FIFO {fifo_num} PCIe event Link Width value of {width} is invalid.")
+
+        reserved = event[7]
+        if reserved != 0:
+            sys.exit(f"Data Area {data_area} statistic Identifier 0x{identifier:x} {stats_ocp_str[identifier]} reserved byte 7is not 0h.")
+    else:
+        reserved = int.from_bytes(event[4:8], "little")
+        if reserved != 0:
+            sys.exit(
+                f"Data Area {data_area} statistic Identifier 0x{identifier:x} {stats_ocp_str[identifier]} reserved bytes 7:4 are not 0h."
+            )
+
+    if dw_size > 1:
+        vu_id = int.from_bytes(event[8:10], "little")
+        idx = hex(2) + hex(vu_id)
+        if (idx in strings["vu_events"]) == False:
+            sys.exit(f"Data Area {data_area} FIFO {fifo_num} PCIe event VU Identifier 0x{vu_id:x} does not exist in the string log file")
+        else:
+            description = strings["vu_events"][idx]["string"]
+        vu_value = int.from_bytes(event[10 : 10 + ((dw_size - 1) * 4)], "little")
+
+    print("\t\t\tPCIe Event:")
+    if identifier < 0x8000:
+        print(f"\t\t\t\tIdentifier        : 0x{identifier:x} ({pcie_ocp_id[identifier]})")
+    else:
+        print(f"\t\t\t\tIdentifier        : 0x{identifier:x} (Vendor Unique)")
+
+    if identifier == 7:
+        print(f"\t\t\t\tState Change Flags: {state}({pcie_ocp_state[state]})")
+        print(f"\t\t\t\tLink Speed        : {speed}({pci_ocp_link_speed[speed]})")
+        print(f"\t\t\t\tLink Width        : {width}({pci_ocp_link_width[width]})")
+
+    if dw_size > 1:
+        print(f"\t\t\t\tVU Identifier     : 0x{vu_id:x}")
+        print(f"\t\t\t\tVU data           : 0x{vu_value:x}")
+        print(f"\t\t\t\tVU definition     : {description}")
+        print_vu_extension_fields(event, 18)
+
+
+# OCP defined NVMe event identifiers
+nvme_ocp = [
+    "CC.EN transitions from 0b to 1b",
+    "CC.EN transitions from 1b to 0b",
+    "CSTS.RDY transitions from 0b to 1b",
+    "CSTS.RDY transitions from 1b to 0b",
+    "Reserved",
+    "Create I/O Submission Queue Command or Create I/O Completion Queue Command Processed",
+    "Other Admin Queue Command Processed",
+    "An Admin Command Returned a Non-zero Status Code",
+    "An I/O Command Returned a Non-zero Status Code",
+    "CSTS.CFS Set to 1b",
+    "Admin Submission Queue Base Address Written (AQA) or Admi Completion Queue Based Address (ACQ) written",
+    "Controller Configuration Register (CC) Changed except for the cases that are covered in 0000h and 0001h.",
+    "Controller Status Register (CSTS) Changed except for the cases that are covered in 0002h and 0003h",
+]
+
+# Parse and print an NVMe debug event
+#
+# Input:
+#      data area  : integer specify which data area the static was defined
+#      fifo_num:  : integer of the FIFO containing the event
+#      identifier : integer of event identifier
+#      dw_size    : integer containing the event Dword size
+#      event      : bytearray of the remaining events to parse where the first event is a NVMe event
+#      strings    : dictionary of the parsed string log page contining the VU ASCII strings
+#
+# Output: None
+def parse_nvme(data_area, fifo_num, identifier, dw_size, event, strings):
+    if (identifier > 12) and (identifier < 0x8000):
+        sys.exit(f"Data Area {data_area} FIFO {fifo_num} NVMe event Identifier value of 0x{identifier:x} is invalid.")
+
+    if dw_size < 2:
+        sys.exit(f"Data Area {data_area} FIFO {fifo_num} NVMe event dword size value of {dw_size} is invalid.")
+
+    if (identifier == 7) or (identifier == 8):
+        opcode = event[4]
+        status = int.from_bytes(event[5:7], "little")
+        if (status & 0x8000) != 0:
+            sys.exit(f"Data Area {data_area} FIFO {fifo_num} NVMe event status value of 0x{status:x} is invalid.")
+        reserved = int.from_bytes(event[7:12], "little")
+        if reserved != 0:
+            sys.exit(f"Data Area {data_area} FIFO {fifo_num} NVMe event reserved value in bytes 11:7 are not 0h.")
+    elif identifier == 0xB:
+        cc = int.from_bytes(event[4:8], "little")
+        reserved = int.from_bytes(event[8:12], "little")
+        if reserved != 0:
+            sys.exit(f"Data Area {data_area} FIFO {fifo_num} NVMe event reserved value in bytes 11:8 are not 0h.")
+    elif identifier == 0xC:
+        csr = int.from_bytes(event[4:8], "little")
+        reserved = int.from_bytes(event[8:12], "little")
+        if reserved != 0:
+            sys.exit(f"Data Area {data_area} FIFO {fifo_num} NVMe event reserved value in bytes 11:8 are not 0h.")
+    else:
+        reserved = int.from_bytes(event[4:12], "little")
+        if reserved != 0:
+            sys.exit(f"Data Area {data_area} FIFO {fifo_num} NVMe event reserved value in bytes 11:4 are not 0h.")
+
+    if dw_size > 2:
+        vu_id = int.from_bytes(event[12:14], "little")
+        idx = hex(3) + hex(vu_id)
+        if (idx in strings["vu_events"]) == False:
+            sys.exit(f"Data Area {data_area} FIFO {fifo_num} NVMe event VU Identifier 0x{vu_id:x} does not exist in the string log file")
+        else:
+            description = strings["vu_events"][idx]["string"]
+        vu_value = int.from_bytes(event[14 : 14 + ((dw_size - 2) * 4)], "little")
+
+    print("\t\t\tNVMe Event:")
+
+    # Calculate the spacing
+    if identifier == 0xB:
+        spacing = "                 "
+    elif identifier == 0xC:
+        spacing = "           "
+    else:
+        spacing = ""
+
+    if identifier < 0x8000:
+        print(f"\t\t\t\tIdentifier     {spacing}: 0x{identifier:x} ({nvme_ocp[identifier]})")
+    else:
+        print(f"\t\t\t\tIdentifier     {spacing}: 0x{identifier:x} (Vendor Unique)")
+    if (identifier == 7) or (identifier == 8):
+        print(f"\t\t\t\tCommand Opcode {spacing}: 0x{opcode:x}")
+        print(f"\t\t\t\tStatus Code    {spacing}: 0x{status:x}")
+    elif identifier == 0xB:
+        print(f"\t\t\t\tController Configuration Register: 0x{cc:x}")
+    elif identifier == 0xC:
+        print(f"\t\t\t\tController Status Register : 0x{csr:x}")
+
+    if dw_size > 2:
+        print(f"\t\t\t\tVU Identifier  {spacing}: 0x{vu_id:x}")
+        print(f"\t\t\t\tVU data        {spacing}: 0x{vu_value:x}")
+        print(f"\t\t\t\tVU definition  {spacing}: {description}")
+        print_vu_extension_fields(event, 15 + len(spacing))
+
+
+# OCP defined reset event identifiers
+reset_ocp = ["PCIe Conventional Hot Reset", "Main Power Cycle", "PERST#", "PCIe Function Level Reset", "NVM Subsystem Reset"]
+
+# Parse and print a Reset debug event
+#
+# Input:
+#      data area  : integer specify which data area the static was defined
+#      fifo_num:  : integer of the FIFO containing the event
+#      identifier : integer of event identifier
+#      dw_size    : integer containing the event Dword size
+#      event      : bytearray of the remaining events to parse where the first event is a Reset event
+#      strings    : dictionary of the parsed string log page contining the VU ASCII strings
+#
+# Output: None
+def parse_reset(data_area, fifo_num, identifier, dw_size, event, strings):
+    if (identifier > 4) and (identifier < 0x8000):
+        sys.exit(f"Data Area {data_area} FIFO {fifo_num} Reset event Identifier value of 0x{identifier:x} is invalid.")
+
+    if dw_size > 0:
+        vu_id = int.from_bytes(event[4:6], "little")
+        idx = hex(4) + hex(vu_id)
+        if (idx in strings["vu_events"]) == False:
+            sys.exit(f"Data Area {data_area} FIFO {fifo_num} Reset event VU Identifier 0x{vu_id:x} does not exist in the string log file")
+        else:
+            description = strings["vu_events"][idx]["string"]
+        vu_value = int.from_bytes(event[6 : 6 + ((dw_size - 1) * 4)], "little")
+
+    print("\t\t\tReset Event:")
+    if identifier < 0x8000:
+        print(f"\t\t\t\tIdentifier   : 0x{identifier:x} ({reset_ocp[identifier]})")
+    else:
+        print(f"\t\t\t\tIdentifier   : 0x{identifier:x} (Vendor Unique)")
+
+    if dw_size > 1:
+        print(f"\t\t\t\tVU Identifier: 0x{vu_id:x}")
+        print(f"\t\t\t\tVU data      : 0x{vu_value:x}")
+        print(f"\t\t\t\tVU definion  : {description}")
+        print_vu_extension_fields(event, 13)
+
+
+# OCP defined Boot Sequence event identifier
+boot_ocp = [
+    "Main Firmware Boot Complete",
+    "FTL Load from NVM Complete",
+    "FTL Rebuild Started",
+    "FTL Rebuild Complete",
+]
+
+# Parse and print a Boot Sequence debug event
+#
+# Input:
+#      data area  : integer specify which data area the static was defined
+#      fifo_num:  : integer of the FIFO containing the event
+#      identifier : integer of event identifier
+#      dw_size    : integer containing the event Dword size
+#      event      : bytearray of the remaining events to parse where the first event is a Boot Sequence event
+#      strings    : dictionary of the parsed string log page contining the VU ASCII strings
+#
+# Output: None
+def parse_boot(data_area, fifo_num, identifier, dw_size, event, strings):
+    if (identifier > 3) and (identifier < 0x8000):
+        sys.exit(f"Data Area {data_area} FIFO {fifo_num} Boot Sequence event Identifier value of 0x{identifier:x} is invalid.")
+
+    if dw_size > 0:
+        vu_id = int.from_bytes(event[4:6], "little")
+        idx = hex(5) + hex(vu_id)
+        if (idx in strings["vu_events"]) == False:
+            sys.exit(
+                f"Data Area {data_area} FIFO {fifo_num} Boot Sequence event VU Identifier 0x{vu_id:x} does not exist in the string log file"
+            )
+        else:
+            description = strings["vu_events"][idx]["string"]
+        vu_value = int.from_bytes(event[6 : 6 + ((dw_size - 1) * 4)], "little")
+
+    print("\t\tBoot Event:")
+    if identifier < 0x8000:
+        print(f"\t\t\t\tIdentifier    : 0x{identifier:x} ({boot_ocp[identifier]})")
+    else:
+        print(f"\t\t\t\tIdentifier    : 0x{identifier:x} (Vendor Unique)")
+
+    if dw_size > 1:
+        print(f"\t\t\t\tVU Identifier : 0x{vu_id:x}")
+        print(f"\t\t\t\tVU data       : 0x{vu_value:x}")
+        print(f"\t\t\t\tVU definion   : {description}")
+        print_vu_extension_fields(event, 14)
+
+
+# OCP defined Firmware Assert event identifiers
+fa_assert_ocp = [
+    "Assert in NVMe Processing Code",
+    "Assert in Media Code",
+    "Assert in Security Code",
+    "Assert in Background Services Code",
+    "FTL Rebuild Failed",
+    "FTL Data Mismatch",
+    "Assert in Other Code",
+]
+
+# Parse and print a Firmware Assert debug event
+#
+# Input:
+#      data area  : integer specify which data area the static was defined
+#      fifo_num:  : integer of the FIFO containing the event
+#      identifier : integer of event identifier
+#      dw_size    : integer containing the event Dword size
+#      event      : bytearray of the remaining events to parse where the first event is a Firmware Assert event
+#      strings    : dictionary of the parsed string log page contining the VU ASCII strings
+#
+# Output: None
+def parse_fw_assert(data_area, fifo_num, identifier, dw_size, event, strings):
+    if (identifier > 6) and (identifier < 0x8000):
+        sys.exit(f"Data Area {data_area} FIFO {fifo_num} Firmware Assert event Identifier value of 0x{identifier:x} is invalid.")
+
+    if dw_size > 0:
+        vu_id = int.from_bytes(event[4:6], "little")
+        idx = hex(6) + hex(vu_id)
+        if (idx in strings["vu_events"]) == False:
+            sys.exit(
+                f"Data Area {data_area} FIFO {fifo_num} Firmware Assert event VU Identifier 0x{vu_id:x} does not exist in the string log file"
+            )
+        else:
+            description = strings["vu_events"][idx]["string"]
+        vu_value = int.from_bytes(event[6 : 6 + ((dw_size - 1) * 4)], "little")
+
+    print("\t\t\tFirmware Assert Event:")
+    if identifier < 0x8000:
+        print(f"\t\t\t\tIdentifier    : 0x{identifier:x}({fa_assert_ocp[identifier]})")
+    else:
+        print(f"\t\t\t\tIdentifier    : 0x{identifier:x} (Vendor Unique)")
+
+    if dw_size > 1:
+        print(f"\t\t\t\tVU Identifier : 0x{vu_id:x}")
+        print(f"\t\t\t\tVU data       : 0x{vu_value:x}")
+        print(f"\t\t\t\tVU definion   : {description}")
+        print_vu_extension_fields(event, 14)
+
+
+# OCP defined Temperature event identifiers
+temp_ocp = [
+    "Composite Temperature decreases to (WCTEMP - 2)",
+    "Composite Temperature increases to WCTEMP",
+    "Composite Temperature increases to reach CCTEMP",
+]
+
+# Parse and print a Temperature debug event
+#
+# Input:
+#      data area  : integer specify which data area the static was defined
+#      fifo_num:  : integer of the FIFO containing the event
+#      identifier : integer of event identifier
+#      dw_size    : integer containing the event Dword size
+#      event      : bytearray of the remaining events to parse where the first event is a Temperature event
+#      strings    : dictionary of the parsed string log page contining the VU ASCII strings
+#
+# Output: None
+def parse_temp(data_area, fifo_num, identifier, dw_size, event, strings):
+    if (identifier > 2) and (identifier < 0x8000):
+        sys.exit(f"Data Area {data_area} FIFO {fifo_num} Temperature event Identifier value of 0x{identifier:x} is invalid.")
+
+    if dw_size > 0:
+        vu_id = int.from_bytes(event[4:6], "little")
+        idx = hex(7) + hex(vu_id)
+        if (idx in strings["vu_events"]) == False:
+            sys.exit(
+                f"Data Area {data_area} FIFO {fifo_num} Temperature event VU Identifier 0x{vu_id:x} does not exist in the string log file"
+            )
+        else:
+            description = strings["vu_events"][idx]["string"]
+        vu_value = int.from_bytes(event[6 : 6 + ((dw_size - 1) * 4)], "little")
+
+    print("\t\t\tTemperature Event:")
+    if identifier < 0x8000:
+        print(f"\t\t\t\tIdentifier : 0x{identifier:x} ({temp_ocp[identifier]})")
+    else:
+        print(f"\t\t\t\tIdentifier : 0x{identifier:x} (Vendor Unique)")
+
+    if dw_size > 1:
+        print(f"\t\t\t\tVU Identifier : 0x{vu_id:x}")
+        print(f"\t\t\t\tVU data       : 0x{vu_value:x}")
+        print(f"\t\t\t\tVU definion   : {description}")
+        print_vu_extension_fields(event, 14)
+
+
+# OCP defined Media event identifiers
+media_ocp = [
+    "XOR (or equivalent) Recovery Invoked",
+    "Uncorrectable Media Error",
+    "Block Marked Bad Due to Program Error",
+    "Block Marked Bad Due to Erase Error",
+    "Block Marked Bad Due to Read Error",
+    "Plane Failure Event",
+]
+
+# Parse and print a Media debug event
+#
+# Input:
+#      data area  : integer specify which data area the static was defined
+#      fifo_num:  : integer of the FIFO containing the event
+#      identifier : integer of event identifier
+#      dw_size    : integer containing the event Dword size
+#      event      : bytearray of the remaining events to parse where the first event is a Media event
+#      strings    : dictionary of the parsed string log page contining the VU ASCII strings
+#
+# Output: None
+def parse_media(data_area, fifo_num, identifier, dw_size, event, strings):
+    if (identifier > 5) and (identifier < 0x8000):
+        sys.exit(f"Data Area {data_area} FIFO {fifo_num} Media event Identifier value of 0x{identifier:x} is invalid.")
+
+    if dw_size > 0:
+        vu_id = int.from_bytes(event[4:6], "little")
+        idx = hex(8) + hex(vu_id)
+        if (idx in strings["vu_events"]) == False:
+            sys.exit(f"Data Area {data_area} FIFO {fifo_num} Media event VU Identifier 0x{vu_id:x} does not exist in the string log file")
+        else:
+            description = strings["vu_events"][idx]["string"]
+        vu_value = int.from_bytes(event[6 : 6 + ((dw_size - 1) * 4)], "little")
+
+    print("\t\t\tMedia Event:")
+    if identifier < 0x8000:
+        print(f"\t\t\t\tIdentifier    : 0x{identifier:x} ({media_ocp[identifier]})")
+    else:
+        print(f"\t\t\t\tIdentifier    : 0x{identifier:x} (Vendor Unique)")
+
+    if dw_size > 1:
+        print(f"\t\t\t\tVU Identifier : 0x{vu_id:x}")
+        print(f"\t\t\t\tVU data       : 0x{vu_value:x}")
+        print(f"\t\t\t\tVU definion   : {description}")
+        print_vu_extension_fields(event, 14)
+
+
+# OCP defined Media Wear event identifiers
+media_wear_ocp = [
+    "Media Wear",
+]
+
+# Parse and print a Media Wear debug event
+#
+# Input:
+#      data area  : integer specify which data area the static was defined
+#      fifo_num:  : integer of the FIFO containing the event
+#      identifier : integer of event identifier
+#      dw_size    : integer containing the event Dword size
+#      event      : bytearray of the remaining events to parse where the first event is a Media Wear event
+#      strings    : dictionary of the parsed string log page contining the VU ASCII strings
+#
+# Output: None
+def parse_media_wear(data_area, fifo_num, identifier, dw_size, event, strings):
+    if (identifier > 0) and (identifier < 0x8000):
+        sys.exit(f"Data Area {data_area} FIFO {fifo_num} Media Wear Identifier value of 0x{identifier:x} is invalid.")
+
+    if dw_size < 3:
+        sys.exit(f"Data Area {data_area} FIFO {fifo_num} Media Wear dword size value of {dw_size} is invalid.")
+
+    if identifier == 0:
+        host_tr_w = int.from_bytes(event[4:8], "little")
+        media_tr_w = int.from_bytes(event[8:12], "little")
+        media_tr_e = int.from_bytes(event[12:16], "little")
+    else:
+        reserved = int.from_bytes(event[4:16], "little")
+        if reserved != 0:
+            sys.exit(f"Data Area {data_area} FIFO {fifo_num} Media Wear Identifier 0x{identifier:x} bytes 15:4 are not 0h.")
+
+    if dw_size > 3:
+        vu_id = int.from_bytes(event[16:18], "little")
+        idx = hex(9) + hex(vu_id)
+        if (idx in strings["vu_events"]) == False:
+            sys.exit(
+                f"Data Area {data_area} FIFO {fifo_num} Media Wear event VU Identifier 0x{vu_id:x} does not exist in the string log file"
+            )
+        else:
+            description = strings["vu_events"][idx]["string"]
+        vu_value = int.from_bytes(event[18 : 18 + ((dw_size - 1) * 4)], "little")
+
+    print("\t\t\tMedia Wear Event:")
+    if identifier < 0x8000:
+        print(f"\t\t\t\tIdentifier             : 0x{identifier:x} ({media_wear_ocp[identifier]})")
+    else:
+        print(f"\t\t\t\tIdentifier             : 0x{identifier:x} (Vendor Unique)")
+
+    if identifier == 0:
+        print(f"\t\t\t\tHost Terabytes Written : {host_tr_w}")
+        print(f"\t\t\t\tMedia Terabytes Written: {media_tr_w}")
+        print(f"\t\t\t\tMedia Terabytes Erased : {media_tr_e}")
+
+    if dw_size > 3:
+        print(f"\t\t\t\tVU Identifier          : 0x{vu_id:x}")
+        print(f"\t\t\t\tVU data                : 0x{vu_value:x}")
+        print(f"\t\t\t\tVU definion            : {description}")
+        print_vu_extension_fields(event, 23)
+
+
+# Parse and print Snapshot debug event
+#
+# Input:
+#      data area  : integer specify which data area the static was defined
+#      fifo_num:  : integer of the FIFO containing the event
+#      event      : bytearray of the remaining events to parse where the first event is a Snapshot event
+#      strings    : dictionary of the parsed string log page contining the VU ASCII strings
+#
+# Output: None
+def parse_snapshot(data_area, fifo_num, event, strings):
+    reserved = int.from_bytes(event[1:4], "little")
+    if reserved != 0:
+        sys.exit(f"Data Area {data_area} FIFO {fifo_num} Snapshot event bytes 3:1 are not 0h.")
+
+    print("\t\t\tSnapshot Event:")
+
+    # Ignore the offset
+    offset = parse_a_statistic(data_area, event[4:], strings, "\t")
+
+
+# Parse and print a Static Snapshot debug event with the arguments of the other event parsing functions
+#
+# Input:
+#      data area  : integer specify which data area the static was defined
+#      fifo_num:  : integer of the FIFO containing the event
+#      identifier : integer of the statistic identifier
+#      dw_size    : integer containing the statistic Dword size
+#      event      : bytearray of the remaining events to parse where the first event is a Snapshot event
+#      strings    : dictionary of the parsed string log page contining the VU ASCII strings
+#
+# Output: None
+def parse_snapshot_event(data_area, fifo_num, identifier, dw_size, event, strings):
+    parse_snapshot(data_area, fifo_num, event, strings)
+
+
+# Entry point group of the vendor unique event decoder plugins. Each entry point is a function called with
+# register_vu_event_decoder as its only argument, for example in the pyproject.toml of a plugin
+#
+#     [project.entry-points."ocp_telemetry.vu_event_decoders"]
+#     acme = "acme_telemetry:register"
+vu_event_entry_point_group = "ocp_telemetry.vu_event_decoders"
+
+# Vendor unique event decoders keyed by (class type, identifier). An identifier of None decodes every identifier of
+# the class type without its own decoder.
+vu_event_decoders = {}
+
+# True once the decoder plugins are loaded
+vu_event_plugins_loaded = False
+
+
+# Register a decoder of vendor unique events
+#
+# Input:
+#      class_type : integer of the vendor unique class type (80h to FFh)
+#      identifier : integer of the event identifier or None for every identifier of the class type
+#      decoder    : function called as decoder(class_type, identifier, payload) where payload is a memoryview of the
+#                   event data after the 4 byte event header. It returns a dictionary of {<field name> : value} or None
+#                   to print the payload as a single value.
+#
+# Output: None
+def register_vu_event_decoder(class_type, identifier, decoder):
+    if (class_type < 0x80) or (class_type > 0xFF):
+        sys.exit(f"Vendor unique event decoder class type 0x{class_type:x} is not between 80h and FFh.")
+
+    vu_event_decoders[(class_type, identifier)] = decoder
+
+
+# Load the vendor unique event decoder plugins once
+#
+# Input:
+#      None
+#
+# Output: None
+def load_vu_event_plugins():
+    global vu_event_plugins_loaded
+
+    if vu_event_plugins_loaded:
+        return
+    vu_event_plugins_loaded = True
+
+    # importlib.metadata is slow to import so it is only imported when a dump is decoded
+    import importlib.metadata
+
+    for entry_point in importlib.metadata.entry_points(group=vu_event_entry_point_group):
+        try:
+            register = entry_point.load()
+        except Exception as error:
+            sys.exit(f"Vendor unique event decoder plugin {entry_point.name} failed to load: {error}")
+        register(register_vu_event_decoder)
+
+
+# Decode the payload of a vendor unique event with the selected VU schemas or its registered decoder
+#
+# Input:
+#      class_type : integer of the vendor unique class type
+#      identifier : integer of event identifier
+#      payload    : memoryview of the event data after the 4 byte event header
+#
+# Output: dictionary of {<field name> : value} or None if there is no decoder
+def decode_vu_event(class_type, identifier, payload):
+    load_vu_event_plugins()
+
+    # The VU schemas selected for the dump take precedence over the decoders of the plugins
+    for decoders in (vu_schema_event_decoders, vu_event_decoders):
+        decoder = decoders.get((class_type, identifier))
+        if decoder is None:
+            decoder = decoders.get((class_type, None))
+        if decoder != None:
+            return decoder(class_type, identifier, payload)
+    return None
+
+
+# Offset of the VU Identifier of the VU extension data of the OCP debug event classes. An event has VU extension data
+# when it is larger than the offset.
+vu_extension_offsets = {1: 12, 2: 8, 3: 12, 4: 4, 5: 4, 6: 4, 7: 4, 8: 4, 9: 16}
+
+# struct format characters of the field widths that struct decodes as an integer. Other widths are decoded from bytes.
+vu_schema_struct_codes = {1: "B", 2: "H", 4: "I", 8: "Q"}
+
+# VU schemas loaded with load_vu_schema in the order they were loaded
+vu_schemas = []
+
+# Decoders of the VU schemas selected for each (firmware, OCP Strings log page sha256) (see select_vu_schemas)
+vu_schema_selections = {}
+
+# Decoders of the VU schemas selected for the dump being parsed keyed by (class type, identifier) for the vendor unique
+# event classes and by (class type, VU identifier) for the VU extension data of the OCP event classes. An identifier of
+# None decodes every identifier without its own decoder.
+vu_schema_event_decoders = {}
+vu_schema_extension_decoders = {}
+
+
+# Convert a schema value that is an integer or a string such as "0x1A" to an integer
+#
+# Input:
+#      value : integer or string
+#      name  : string describing the value for the error message
+#
+# Output: integer
+def get_schema_integer(value, name):
+    if isinstance(value, int):
+        return value
+    try:
+        return int(value, 0)
+    except (TypeError, ValueError):
+        sys.exit(f"VU schema {name} value of {value} is not an integer.")
+
+
+# Compile the fields of a VU schema into a decoder using one struct.Struct
+#
+# Input:
+#      fields : list of {'name' : field name, 'offset' : byte offset in the payload, 'width' : width in bytes,
+#                        <optional> 'enum' : {<value> : name, ...}}
+#      name   : string describing the fields for the error messages
+#
+# Output: function called as decoder(class_type, identifier, payload) (see register_vu_event_decoder)
+def compile_vu_schema_fields(fields, name):
+    layout = "<"
+    position = 0
+    names = []
+    wide = []
+    enums = []
+    for field in sorted(fields, key=lambda field: get_schema_integer(field["offset"], f"{name} offset")):
+        offset = get_schema_integer(field["offset"], f"{name} offset")
+        width = get_schema_integer(field["width"], f"{name} width")
+        if width < 1:
+            sys.exit(f"VU schema {name} field {field['name']} width of {width} is invalid.")
+        if offset < position:
+            sys.exit(f"VU schema {name} field {field['name']} overlaps the previous field.")
+
+        if offset > position:
+            layout += f"{offset - position}x"
+        layout += vu_schema_struct_codes.get(width, f"{width}s")
+        position = offset + width
+
+        names.append(field["name"])
+        wide.append(width not in vu_schema_struct_codes)
+        enum = field.get("enum")
+        enums.append(None if enum is None else {get_schema_integer(key, f"{name} enum"): value for key, value in enum.items()})
+
+    decoder_struct = struct.Struct(layout)
+    converters = list(zip(names, wide, enums))
+
+    # Decode a payload. Payloads smaller than the schema are not decoded.
+    def decode(class_type, identifier, payload):
+        if len(payload) < decoder_struct.size:
+            return None
+
+        decoded = {}
+        for (name, wide, enum), value in zip(converters, decoder_struct.unpack_from(payload)):
+            if wide:
+                value = int.from_bytes(value, "little")
+            if (enum != None) and (value in enum):
+                value = f"{enum[value]} ({value})"
+            decoded[name] = value
+        return decoded
+
+    return decode
+
+
+# Load and compile a VU schema file. Each file is compiled once.
+#
+# Input:
+#      filename : JSON or TOML (.toml) filename of the form
+#
+#     {<optional> 'match'         : {<optional> 'firmware'           : [firmware version, ...],
+#                                    <optional> 'string log sha256'  : [OCP Strings log page sha256, ...]},
+#      <optional> 'events'        : [{'class'                : vendor unique class type,
+#                                     <optional> 'identifier' : event identifier, all identifiers if omitted,
+#                                     'fields'               : [<see compile_vu_schema_fields>, ...]}, ...],
+#      <optional> 'vu extensions' : [{'class'                : OCP class type,
+#                                     <optional> 'vu identifier' : VU identifier, all VU identifiers if omitted,
+#                                     'fields'               : [<see compile_vu_schema_fields>, ...]}, ...]}
+#
+#                 The fields of events are offsets in the event data after the 4 byte event header and the fields of
+#                 VU extensions are offsets in the VU data after the VU Identifier.
+#
+# Output: None
+def load_vu_schema(filename):
+    with open(filename, mode="rb") as f:
+        data = f.read()
+
+    if filename.lower().endswith(".toml"):
+        # tomllib is only available in Python 3.11 and later
+        try:
+            import tomllib
+        except ImportError:
+            sys.exit(f"TOML VU schema {filename} needs Python 3.11 or later.")
+        schema = tomllib.loads(data.decode())
+    else:
+        schema = json.loads(data)
+
+    match = schema.get("match", {})
+    compiled = {
+        "sha256": hashlib.sha256(data).hexdigest(),
+        "firmware": None if "firmware" not in match else {firmware.strip() for firmware in match["firmware"]},
+        "string log sha256": None if "string log sha256" not in match else {sha.lower() for sha in match["string log sha256"]},
+        "events": {},
+        "vu extensions": {},
+    }
+
+    for key, identifier_key in (("events", "identifier"), ("vu extensions", "vu identifier")):
+        for entry in schema.get(key, []):
+            class_type = get_schema_integer(entry["class"], f"{filename} {key} class")
+            identifier = entry.get(identifier_key)
+            if identifier != None:
+                identifier = get_schema_integer(identifier, f"{filename} {key} {identifier_key}")
+            name = f"{filename} class 0x{class_type:x}"
+            compiled[key][(class_type, identifier)] = compile_vu_schema_fields(entry["fields"], name)
+
+    vu_schemas.append(compiled)
+    vu_schema_selections.clear()
+
+
+# Select the VU schemas that match a dump
+#
+# Input:
+#      telemetry : bytearray of the Telemetry log page
+#      strings   : dictionary of the parsed string log page contining the VU ASCII strings
+#
+# Output: None
+def select_vu_schemas(telemetry, strings):
+    global vu_schema_event_decoders
+    global vu_schema_extension_decoders
+
+    if len(vu_schemas) == 0:
+        return
+
+    firmware = telemetry[512 + 56 : 512 + 64].decode(errors="replace").strip(" \x00")
+    key = (firmware, strings.get("sha256"))
+    if key not in vu_schema_selections:
+        events = {}
+        extensions = {}
+        for schema in vu_schemas:
+            if (schema["firmware"] != None) and (firmware not in schema["firmware"]):
+                continue
+            if (schema["string log sha256"] != None) and (key[1] not in schema["string log sha256"]):
+                continue
+            events.update(schema["events"])
+            extensions.update(schema["vu extensions"])
+        vu_schema_selections[key] = (events, extensions)
+
+    (vu_schema_event_decoders, vu_schema_extension_decoders) = vu_schema_selections[key]
+
+
+# Decode the VU extension data of an OCP debug event with the selected VU schemas
+#
+# Input:
+#      event : bytearray or memoryview of the event
+#
+# Output: dictionary of {<field name> : value} or None if there is no VU extension data or no schema for it
+def decode_vu_extension(event):
+    if len(vu_schema_extension_decoders) == 0:
+        return None
+
+    class_type = event[0]
+    offset = vu_extension_offsets.get(class_type)
+    if (offset is None) or (len(event) <= offset):
+        return None
+
+    vu_id = int.from_bytes(event[offset : offset + 2], "little")
+    decoder = vu_schema_extension_decoders.get((class_type, vu_id))
+    if decoder is None:
+        decoder = vu_schema_extension_decoders.get((class_type, None))
+        if decoder is None:
+            return None
+    return decoder(class_type, vu_id, memoryview(event)[offset + 2 :])
+
+
+# Print the fields of the VU extension data of an OCP debug event decoded by the selected VU schemas
+#
+# Input:
+#      event : bytearray of the event
+#      width : integer width of the field names to align with the other fields of the event
+#
+# Output: None
+def print_vu_extension_fields(event, width):
+    fields = decode_vu_extension(event)
+    if fields != None:
+        for name, value in fields.items():
+            print(f"\t\t\t\t{name:<{width}}: {value}")
+
+
+# Parse and print a Vendor Unique debug event
+#
+# Input:
+#      data area  : integer specify which data area the static was defined
+#      fifo_num:  : integer of the FIFO containing the event
+#      identifier : integer of event identifier
+#      dw_size    : integer containing the event Dword size
+#      event      : memoryview of the remaining events to parse where the first event is a Vendor Unique event
+#      strings    : dictionary of the parsed string log page contining the VU ASCII strings
+#
+# Output: None
+def parse_vu_event(data_area, fifo_num, identifier, dw_size, event, strings):
+    class_type = event[0]
+
+    # make sure the VU string exists
+    idx = hex(class_type) + hex(identifier)
+
+    if (idx in strings["events"]) == False:
+        sys.exit(f"Data Area {data_area} FIFO {fifo_num} class type value of {class_type} has no String log page definition.")
+
+    description = strings["events"][idx]["string"]
+    payload = event[4 : 4 + (dw_size * 4)]
+    fields = decode_vu_event(class_type, identifier, payload)
+
+    print("\t\t\tVendor Unique Event:")
+    print(f"\t\t\t\tVendor Class: 0x{class_type:x}")
+    print(f"\t\t\t\tIdentifier  : 0x{identifier:x}")
+    print(f"\t\t\t\tDescription : {description}")
+    if fields is None:
+        print(f"\t\t\t\tValue       : {int.from_bytes(payload, 'little')}")
+    else:
+        for name, value in fields.items():
+            print(f"\t\t\t\t{name:<12}: {value}")
+
+
+# Parsing functions of the debug events indexed by class type. Class types that are reserved are None.
+parse_event = [None] * 256
+parse_event[1:11] = [
+    parse_timestamp,
+    parse_pcie,
+    parse_nvme,
+    parse_reset,
+    parse_boot,
+    parse_fw_assert,
+    parse_temp,
+    parse_media,
+    parse_media_wear,
+    parse_snapshot_event,
+]
+parse_event[0x80:0x100] = [parse_vu_event] * 0x80
+
+# Walk the event descriptors of a FIFO
+#
+# Input:
+#      data       : bytearray of the FIFO area
+#
+# Output: A generator of a tuple for each event descriptor in the FIFO, stopping at the first descriptor with a class
+#         type of 0h or that does not fit in the FIFO
+#
+#     (offset of the descriptor in data, class type, identifier, dword size, size of the descriptor in bytes)
+#
+#         The identifier and dword size of a Static Snapshot event are those of its statistic descriptor.
+def get_fifo_events(data):
+    offset = 0
+    data_len = len(data)
+
+    while (offset + 4) <= data_len:  # The header for the Event Descriptor needs to exist
+        class_type = data[offset]
+
+        if class_type == 0:
+            break
+
+        if class_type == 0x0A:
+            identifier = int.from_bytes(data[offset + 4 : offset + 6], "little")
+            dw_size = int.from_bytes(data[offset + 8 : offset + 10], "little")
+            size = 12 + (dw_size * 4)
+        else:
+            identifier = int.from_bytes(data[offset + 1 : offset + 3], "little")
+            dw_size = data[offset + 3]
+            size = 4 + (dw_size * 4)
+
+        yield (offset, class_type, identifier, dw_size, size)
+        offset += size
+
+
+# Parse and print a FIFO
+#
+# Input:
+#      data area  : integer specify which data area the static was defined
+#      fifo_num   : integer of the FIFO
+#      data       : memoryview of the FIFO area in the Telemetry log page
+#      strings    : dictionary of the parsed string log page contining the VU ASCII strings
+#
+# Output: The number of events in the FIFO
+def parse_a_fifo(data_area, fifo_num, data, strings):
+    end = 0
+    data_len = len(data)
+    event_num = 1
+
+    print(f"\n\tFIFO {fifo_num} data:\n")
+    for offset, class_type, identifier, dw_size, size in get_fifo_events(data):
+        print(f"\t\tEvent Entry {event_num}")
+        parser = parse_event[class_type]
+        if parser is None:
+            sys.exit(f"Data Area {data_area} FIFO {fifo_num} class type value of {class_type} is invalid.")
+
+        # Parse the event type. The events are views of the log page rather than copies.
+        parser(data_area, fifo_num, identifier, dw_size, data[offset : offset + size], strings)
+
+        inc_counter("ocp_telemetry_events_decoded", (("class", class_type_str[class_type] if class_type <= 10 else "Vendor Unique"),))
+
+        end = offset + size
+        event_num += 1
+        check_memory_budget()
+
+    # Validate the remaining area of the fifo is zero filled
+    if end < data_len:
+        reserved = int.from_bytes(data[end:data_len], "little")
+        if reserved != 0:
+            sys.exit(f"Data Area {data_area} FIFO {fifo_num} unused locations are not 0h.")
+
+    return event_num - 1
+
+
+# Parse and print all the FIFOs in a data area
+#
+# Input:
+#      data area  : integer specify which data area the static was defined
+#      data       : bytearray of the the data area
+#      fifo:      : disctionary of parsed FIFO information from Data Area 1
+#      strings    : dictionary of the parsed string log page contining the VU ASCII strings
+#
+# Output: None
+def parse_fifos(data_area, data, fifo, strings):
+    view = memoryview(data)
+
+    # Loop through the FIFOs
+    for x in range(1, 17):
+        # Only parse the fifo if the FIFO exist in the specified data area
+        if fifo[str(x)]["data area"] == data_area:
+            # Parse the FIFO
+            fifo_offset = fifo[str(x)]["start dw"] * 4
+            fifo_size = fifo[str(x)]["size dw"] * 4
+
+            with timed_phase(f"Data Area {data_area} FIFO {x}"):
+                fifo_data = view[fifo_offset : fifo_offset + fifo_size]
+                reuse_section(f"print Data Area {data_area} FIFO {x}", fifo_data, parse_a_fifo, data_area, x, fifo_data, strings)
+
+
+# Parse and print the header of Data Area 1
+#
+# Input:
+#      data_area_1    : bytearray of the the data area
+#      strings        : dictionary of the parsed string log page contining the VU ASCII strings
+#
+# Output: Information on the statistics and FIFOs contained in the header
+#
+#    (<fifo information from data area 1>, stats_da_1_start_dw, stats_da_1_size_dw, stats_da_2_start_dw,
+#     stats_da_2_size_dw)
+def parse_data_area_1_header(data_area_1, strings):
+    print("\n\tData Area 1:\n")
+    maj_ver = int.from_bytes(data_area_1[0:2], "little")
+    if maj_ver != 3:
+        sys.exit(f"Major Version of {maj_ver} is not the correct value.")
+    print(f"\t\tMajor Version: {maj_ver}")
+
+    min_ver = int.from_bytes(data_area_1[2:4], "little")
+    if min_ver != 1:
+        sys.exit(f"Minor Version of {min_ver} is not the correct value.")
+    print(f"\t\tMinor Version: {min_ver}")
+
+    reserved = int.from_bytes(data_area_1[4:8], "little")
+    if reserved != 0:
+        sys.exit("Reserved bytes 7:4 are not cleared to 0h.")
+
+    parse_nvm_timestamp(data_area_1[8:16], "")
+
+    guid = int.from_bytes(data_area_1[16:32], "little")
+    if guid != 0xBA560A9C3043424CBC73719D87E64EFA:
+        sys.exit(f"Guid 0x{guid:x} is not the correct value.")
+    print(f"\t\tGuid: 0x{guid:x}")
+
+    profiles = data_area_1[32] + 1  # 0's based number
+    print(f"\t\tNumber of profiles: {profiles}")
+
+    selected_profiles = data_area_1[33] + 1  # 0's based number
+    if selected_profiles > profiles:
+        sys.exit(f"Selected Profile value of {selected_profiles} is not in the range of supported profiles: {profiles}")
+    print(f"\t\tSelected Profile: {profiles}")
+
+    reserved = int.from_bytes(data_area_1[34:40], "little")
+    if reserved != 0:
+        sys.exit("Reserved bytes 39:34 are not cleared to 0h.")
+
+    str_len = int.from_bytes(data_area_1[40:48], "little")
+    if str_len != strings["length"] // 4:
+        sys.exit(f"String Log Length of {str_len} does not match the length of the string log of {strings['length']}")
+    print(f"\t\tString Log Size Dwords: {str_len}")
+
+    reserved = int.from_bytes(data_area_1[48:56], "little")
+    if reserved != 0:
+        sys.exit("Reserved bytes 55:48 are not cleared to 0h.")
+
+    fw_ver = data_area_1[56:64].decode()
+    print(f"\t\tFirmware Verison: {fw_ver}")
+
+    reserved = int.from_bytes(data_area_1[64:96], "little")
+    if reserved != 0:
+        sys.exit("Reserved bytes 95:64 are not cleared to 0h.")
+
+    stats_da_1_start_dw = int.from_bytes(data_area_1[96:104], "little")
+    stats_da_1_size_dw = int.from_bytes(data_area_1[104:111], "little")
+    if ((stats_da_1_start_dw * 4) < 1536) or ((stats_da_1_start_dw * 4) > len(data_area_1)):
+        sys.exit(f"Data Area 1 Statistics Start value of {stats_da_1_start_dw} is invalid.")
+    if ((stats_da_1_start_dw + stats_da_1_size_dw) * 4) > len(data_area_1):
+        sys.exit(f"Data Area 1 Statistics Size value of {stats_da_1_start_dw} is invalid.")
+
+    print(
+        f"\t\tData Area 1 Statistic Start (in Dwords): 0x{stats_da_1_start_dw:x} relative to the start of the Telemetry Host-Initiated log page"
+    )
+    print(f"\t\tData Area 1 Statistic Size (in Dwords): 0x{stats_da_1_size_dw:x}")
+
+    # These are checked as part of data area 2 checking
+    stats_da_2_start_dw = int.from_bytes(data_area_1[112:120], "little")
+    stats_da_2_size_dw = int.from_bytes(data_area_1[120:128], "little")
+
+    print(
+        f"\t\tData Area 2 Statistic Start (in Dwords): 0x{stats_da_2_start_dw:x} relative to the start of the Telemetry Host-Initiated log page"
+    )
+    print(f"\t\tData Area 2 Statistic Size (in Dwords): 0x{stats_da_2_size_dw:x}")
+
+    reserved = int.from_bytes(data_area_1[128:160], "little")
+    if reserved != 0:
+        sys.exit("Reserved bytes 159:128 are not cleared to 0h.")
+
+    fifo = get_fifo_data(data_area_1[160:432])
+
+    # Validate the fifo data for data area 1
+    for x in range(1, 17):
+        idx = str(x)
+        if fifo[idx]["data area"] == 1:
+            offset_in_da_1 = (fifo[idx]["start dw"] * 4) - 512
+            size_in_da_1 = fifo[idx]["size dw"] * 4
+            if offset_in_da_1 > len(data_area_1):
+                sys.exit(f"Event FIFO {idx}start is outside of data area 1.")
+            if (offset_in_da_1 + size_in_da_1 - 1) > len(data_area_1):
+                sys.exit(f"Event FIFO {idx}size is outside of data area 1.")
+
+    reserved = int.from_bytes(data_area_1[432:512], "little")
+    if reserved != 0:
+        sys.exit("Reserved bytes 432:511 are not cleared to 0h.")
+
+    return (fifo, stats_da_1_start_dw, stats_da_1_size_dw, stats_da_2_start_dw, stats_da_2_size_dw)
+
+
+# Parse and print Data Area 1
+#
+# Input:
+#      data_area_1    : bytearray of the the data area
+#      strings        : dictionary of the parsed string log page contining the VU ASCII strings
+#
+# Output: Information on data 2 containined in data area 1
+#
+#    (<fifo information from data area 1>, stats_da_2_start_dw, stats_da_2_size_dw)
+def parse_data_area_1(data_area_1, strings):
+    # The header is validated against the size of Data Area 1
+    with timed_phase("Data Area 1 header"):
+        header = bytes(data_area_1[0:512]) + len(data_area_1).to_bytes(8, "little")
+        (fifo, stats_da_1_start_dw, stats_da_1_size_dw, stats_da_2_start_dw, stats_da_2_size_dw) = reuse_section(
+            "print Data Area 1 header", header, parse_data_area_1_header, data_area_1, strings
+        )
+
+    with timed_phase("SMART / Health Information (02h)"):
+        smart = data_area_1[512:1024]
+        reuse_section("print SMART", smart, parse_smart_health_info, smart)
+    with timed_phase("SMART / Health Information Extended (C0h)"):
+        smart_extended = data_area_1[1024:1536]
+        reuse_section("print SMART extended", smart_extended, parse_smart_health_info_extension, smart_extended)
+
+    # Parse the statistics
+    with timed_phase("Data Area 1 statistics"):
+        statistics = data_area_1[(stats_da_1_start_dw * 4) - 512 : ((stats_da_1_start_dw + stats_da_1_size_dw) * 4) - 512]
+        reuse_section("print Data Area 1 statistics", statistics, parse_statistics, 1, statistics, strings)
+
+    # Parse the FIFOs
+    parse_fifos(1, data_area_1, fifo, strings)
+
+    return (fifo, stats_da_2_start_dw, stats_da_2_size_dw)
+
+
+# Parse and print Data Area 2
+#
+# Input:
+#
+#      stat_offset_dw : Dword offset to the Statistics Identifier Table in Data Area 2
+#      stat_size_dw   : Dword size to the Statistics Identifier Table in Data Area 2
+#      data_area_2    : bytearray of the the data area
+#      fifo           : dictionsary to the FIFO information contained in data area 1
+#      strings        : dictionary of the parsed string log page contining the VU ASCII strings
+#
+# Output: None
+def parse_data_area_2(stat_offset_dw, stat_size_dw, data_area_2, fifo, strings):
+    da2_len = len(data_area_2)
+
+    # Validate the fifo data for data area 2
+    for x in range(1, 17):
+        idx = str(x)
+        if fifo[idx]["data area"] == 2:
+            offset_in_da_2 = fifo[idx]["start dw"] * 4
+            size_in_da_2 = fifo[idx]["size dw"] * 4
+            if offset_in_da_2 > da2_len:
+                sys.exit(f"Event FIFO {idx}start is outside of data area 2.")
+            if (offset_in_da_2 + size_in_da_2 - 1) > da2_len:
+                sys.exit(f"Event FIFO {idx}size is outside of data area 2.")
+
+    # Parse the statistics
+    if (stat_offset_dw * 4) >= da2_len:
+        sys.exit("Statistics start is outside of data area 2.")
+    if ((stat_offset_dw + stat_size_dw) * 4) > da2_len:
+        sys.exit("Statistics size is outside of data area 2.")
+
+    with timed_phase("Data Area 2 statistics"):
+        statistics = data_area_2[(stat_offset_dw * 4) : ((stat_offset_dw + stat_size_dw) * 4)]
+        reuse_section("print Data Area 2 statistics", statistics, parse_statistics, 2, statistics, strings)
+
+    # Parse the FIFOs
+    parse_fifos(2, data_area_2, fifo, strings)
+
+
+# Byte ranges of the Last Block fields of data areas 1 to 4 in the Telemetry log page header
+data_area_last_block_fields = ((8, 10), (10, 12), (12, 14), (16, 20))
+
+# Locate the data areas, statistics tables and FIFOs of a Telemetry log page without printing or validating them
+#
+# Input:
+#
+#      telemetry      : bytearray of the telemetry data (at least the header and Data Area 1 header)
+#
+# Output: A dictionary of (start, end) byte offsets relative to the start of the Telemetry log page
+#
+#     {'data areas' : {<data area> : (start, end), ...},     # for data areas 1 to 4
+#      'statistics' : {<data area> : (start, end), ...},     # for data areas 1 and 2
+#      'fifos'      : {<fifo #>    : (data area, start, end), ...}}   # for the FIFOs that exist
+def get_telemetry_layout(telemetry):
+    layout = {"data areas": {}, "statistics": {}, "fifos": {}}
+
+    start = 512
+    for data_area, (first, last) in enumerate(data_area_last_block_fields, 1):
+        end = 512 + int.from_bytes(telemetry[first:last], "little") * 512
+        layout["data areas"][data_area] = (start, max(start, end))
+        start = max(start, end)
+
+    da1_start = layout["data areas"][1][0]
+    da2_start = layout["data areas"][2][0]
+
+    # Data Area 1 statistics are relative to the start of the log page and Data Area 2 statistics to Data Area 2
+    stats_start = int.from_bytes(telemetry[da1_start + 96 : da1_start + 104], "little") * 4
+    stats_size = int.from_bytes(telemetry[da1_start + 104 : da1_start + 111], "little") * 4
+    layout["statistics"][1] = (stats_start, stats_start + stats_size)
+
+    stats_start = da2_start + int.from_bytes(telemetry[da1_start + 112 : da1_start + 120], "little") * 4
+    stats_size = int.from_bytes(telemetry[da1_start + 120 : da1_start + 128], "little") * 4
+    layout["statistics"][2] = (stats_start, stats_start + stats_size)
+
+    # FIFOs are relative to the start of their data area
+    for x in range(1, 17):
+        data_area = telemetry[da1_start + 160 + x - 1]
+        if data_area in (1, 2):
+            entry = da1_start + 176 + ((x - 1) * 16)
+            fifo_start = layout["data areas"][data_area][0] + int.from_bytes(telemetry[entry : entry + 8], "little") * 4
+            fifo_size = int.from_bytes(telemetry[entry + 8 : entry + 16], "little") * 4
+            layout["fifos"][x] = (data_area, fifo_start, fifo_start + fifo_size)
+
+    return layout
+
+
+# Event index sidecar (.idx) written with --index so that tools can seek to the events of a dump without walking the
+# FIFOs. The file is the header followed by one little-endian array for each column, each holding one fixed-width
+# entry for every event in FIFO order.
+#
+#     header : magic, version, number of columns, number of events, sha256 of the Telemetry log page
+index_magic = b"OCPTIDX\x00"
+index_version = 1
+index_header = struct.Struct("<8sHHI32s")
+
+# (column name, array type code) of the event index columns. The offset is from the start of the Telemetry log page.
+# fmt: off
+index_columns = (
+    ("fifo",         "B"),
+    ("event number", "I"),    # starting at 1 in each FIFO
+    ("offset",       "I"),
+    ("class",        "B"),
+    ("identifier",   "H"),
+    ("dword size",   "H"),
+    ("timestamp",    "Q"),    # in ms, of the last Timestamp event before the event in its FIFO or index_no_timestamp
+)
+# fmt: on
+
+# Timestamp of the events with no Timestamp event before them in their FIFO
+index_no_timestamp = (1 << 64) - 1
+
+# Identifiers of the Timestamp events whose timestamp is in milliseconds. The timestamp of a Timestamp is Power on
+# Hours (2h) event is not.
+timestamp_ms_ids = (0x0000, 0x0001)
+
+
+# Build the event index of a Telemetry log page in one walk of each FIFO
+#
+# Input:
+#      telemetry : bytearray of the Telemetry log page
+#
+# Output: dictionary of {<column name> : array} (see index_columns)
+def get_event_index(telemetry):
+    index = {name: array.array(code) for name, code in index_columns}
+    layout = get_telemetry_layout(telemetry)
+
+    for fifo_num, (data_area, start, end) in layout["fifos"].items():
+        data = telemetry[start:end]
+        timestamp = index_no_timestamp
+        for event_num, (offset, class_type, identifier, dw_size, size) in enumerate(get_fifo_events(data), 1):
+            if (class_type == 0x01) and (identifier in timestamp_ms_ids) and (size >= 10):
+                timestamp = int.from_bytes(data[offset + 4 : offset + 10], "little")
+            index["fifo"].append(fifo_num)
+            index["event number"].append(event_num)
+            index["offset"].append(start + offset)
+            index["class"].append(class_type)
+            index["identifier"].append(identifier)
+            index["dword size"].append(dw_size)
+            index["timestamp"].append(timestamp)
+
+    return index
+
+
+# Write the event index sidecar of a Telemetry log page
+#
+# Input:
+#      filename  : event index filename
+#      telemetry : bytearray of the Telemetry log page
+#      index     : dictionary of the event index (see get_event_index)
+#
+# Output: None
+def write_event_index(filename, telemetry, index):
+    temporary = f"{filename}.{os.getpid()}.tmp"
+    with open(temporary, mode="wb") as f:
+        f.write(index_header.pack(index_magic, index_version, len(index_columns), len(index["fifo"]), hashlib.sha256(telemetry).digest()))
+        for name, code in index_columns:
+            column = index[name]
+            if sys.byteorder == "big":
+                column = array.array(code, column)
+                column.byteswap()
+            column.tofile(f)
+    os.replace(temporary, filename)
+
+
+# Read the event index sidecar of a Telemetry log page
+#
+# Input:
+#      filename  : event index filename
+#      telemetry : bytearray of the Telemetry log page to check that the index is of this log page or None
+#
+# Output: dictionary of the event index (see get_event_index) or None if the file is missing, not an event index or
+#         the index of another log page
+def read_event_index(filename, telemetry=None):
+    try:
+        with open(filename, mode="rb") as f:
+            header = f.read(index_header.size)
+            if len(header) != index_header.size:
+                return None
+            (magic, version, columns, count, sha256) = index_header.unpack(header)
+            if (magic != index_magic) or (version != index_version) or (columns != len(index_columns)):
+                return None
+            if (telemetry != None) and (sha256 != hashlib.sha256(telemetry).digest()):
+                return None
+
+            index = {}
+            for name, code in index_columns:
+                column = array.array(code)
+                column.fromfile(f, count)
+                if sys.byteorder == "big":
+                    column.byteswap()
+                index[name] = column
+    except (OSError, EOFError):
+        return None
+
+    return index
+
+
+# Get the filename of the event index sidecar of a dump. The sidecar of a bundle member is next to the bundle.
+#
+# Input:
+#      name : name of the dump (see get_dump_sources)
+#
+# Output: filename
+def get_event_index_path(name):
+    bundle = name
+    while (":" in bundle) and not os.path.isfile(bundle):
+        bundle = bundle.rsplit(":", 1)[0]
+    if bundle == name:
+        return f"{name}.idx"
+    return f"{bundle}.{re.sub(r'[^A-Za-z0-9_.-]', '_', name[len(bundle) + 1 :])}.idx"
+
+
+# SMART / Health Information log page (02h) fields: (name, byte offset, byte width, True if the field is a counter
+# that only increases)
+# fmt: off
+smart_fields = [
+    ("Critical Warning",                                    0,  1, False),
+    ("Composite Temperature",                               1,  2, False),
+    ("Available Spare",                                     3,  1, False),
+    ("Available Spare Threshold",                           4,  1, False),
+    ("Percent Used",                                        5,  1, True),
+    ("Endurance Group Critical Warning Summary",            6,  1, False),
+    ("Data Units Read",                                    32, 16, True),
+    ("Data Units Written",                                 48, 16, True),
+    ("Host Read Commands",                                 64, 16, True),
+    ("Host Write Commands",                                80, 16, True),
+    ("Controller Busy Time",                               96, 16, True),
+    ("Power Cycles",                                      112, 16, True),
+    ("Power On Hours",                                    128, 16, True),
+    ("Unsafe Shutdowns",                                  144, 16, True),
+    ("Media and Data Integrity Errors",                   160, 16, True),
+    ("Number of Error Information Log Entries",           176, 16, True),
+    ("Warning Composite Temperature Time",                192,  4, True),
+    ("Critical Composite Temperature Time",               196,  4, True),
+    ("Temperature Sensor 1",                              200,  2, False),
+    ("Temperature Sensor 2",                              202,  2, False),
+    ("Temperature Sensor 3",                              204,  2, False),
+    ("Temperature Sensor 4",                              206,  2, False),
+    ("Temperature Sensor 5",                              208,  2, False),
+    ("Temperature Sensor 6",                              210,  2, False),
+    ("Temperature Sensor 7",                              212,  2, False),
+    ("Temperature Sensor 8",                              214,  2, False),
+    ("Thermal Management Temperature 1 Transition Count", 216,  4, True),
+    ("Thermal Management Temperature 2 Transition Count", 220,  4, True),
+    ("Total Time for Thermal Management Temperature 1",   224,  4, True),
+    ("Total Time for Thermal Management Temperature 2",   228,  4, True),
+]
+
+# SMART / Health Information Extended log page (C0h) fields: (name, byte offset, byte width, True if the field is a
+# counter that only increases)
+smart_extended_fields = [
+    ("Physical Media Units Written",           0, 16, True),
+    ("Physical Media Units Read",             16, 16, True),
+    ("Bad User NAND Blocks Raw Count",        32,  6, True),
+    ("Bad User NAND Blocks Normalized Value", 38,  2, False),
+    ("Bad System NAND Blocks Raw Count",      40,  6, True),
+    ("Bad System NAND Blocks Normalized Value", 46, 2, False),
+    ("XOR Recovery Count",                    48,  8, True),
+    ("Uncorrectable Read Error Count",        56,  8, True),
+    ("Soft ECC Error Count",                  64,  8, True),
+    ("End to End Correction Counts",          72,  8, True),
+    ("System Data % Used",                    80,  1, True),
+    ("Refresh Counts",                        81,  7, True),
+    ("Maximum User Data Erase Count",         88,  4, True),
+    ("Minimum User Data Erase Count",         92,  4, True),
+    ("Number of Thermal Throttling Events",   96,  1, True),
+    ("Current Throttling Status",             97,  1, False),
+    ("PCIe Correctable Error Count",         104,  8, True),
+    ("Incomplete Shutdowns",                 112,  4, True),
+    ("% Free Blocks",                        120,  1, False),
+    ("Capacitor Health",                     128,  2, False),
+    ("Unaligned I/O",                        136,  8, True),
+    ("Security Version Number",              144,  8, False),
+    ("Total NUSE",                           152,  8, False),
+    ("PLP Start Count",                      160, 16, True),
+    ("Endurance Estimate",                   176, 16, False),
+    ("PCIe Link Retraining Count",           192,  8, True),
+    ("Power State Change Count",             200,  8, True),
+]
+# fmt: on
+
+
+# Decode the fields of a SMART log page
+#
+# Input:
+#      smart  : bytearray of the SMART log page
+#      fields : table of the fields (smart_fields or smart_extended_fields)
+#
+# Output: A dictionary of the form {<field name> : value}
+def get_smart_record(smart, fields):
+    return {name: int.from_bytes(smart[offset : offset + width], "little") for name, offset, width, _ in fields}
+
+
+# Decode the statistic descriptors of a statistics table without printing or validating them
+#
+# Input:
+#      data_area  : integer specify which data area the statistics are in
+#      statistics : bytearray of the statistics descriptors
+#      strings    : dictionary of the parsed string log page contining the VU ASCII strings
+#
+# Output: A list of dictionaries of the form
+#
+#     [{'data area' : data_area, 'identifier' : identifier, 'behavior type' : behavior type,
+#       'namespace' : namespace or 0 if not specified, 'dword size' : dword size, 'value' : value,
+#       'description' : description}, ...]
+def get_statistic_records(data_area, statistics, strings):
+    records = []
+    offset = 0
+    stat_len = len(statistics)
+
+    while (offset + 8) < stat_len:  # The header for the Statistics Descriptor needs to exist
+        identifier = int.from_bytes(statistics[offset : offset + 2], "little")
+        if identifier == 0:
+            break
+
+        namespace = statistics[offset + 3]
+        dw_len = int.from_bytes(statistics[offset + 4 : offset + 6], "little")
+        if (dw_len == 0) or ((offset + 8 + dw_len * 4) > stat_len):
+            sys.exit(f"Data Area {data_area} statistic Identifier 0x{identifier:x} dword length value of {dw_len} is invalid.")
+
+        if identifier < len(stats_ocp_str):
+            description = stats_ocp_str[identifier]
+        else:
+            description = strings["statistics"].get(hex(identifier), {"string": ""})["string"]
+
+        records.append(
+            {
+                "data area": data_area,
+                "identifier": identifier,
+                "behavior type": statistics[offset + 2],
+                "namespace": namespace & 127 if namespace >= 128 else 0,
+                "dword size": dw_len,
+                "value": int.from_bytes(statistics[offset + 8 : offset + 8 + (dw_len * 4)], "little"),
+                "description": description,
+            }
+        )
+        offset += 8 + (dw_len * 4)
+
+    return records
+
+
+# Get the records of the events in a FIFO
+#
+# Input:
+#      data_area : data area of the FIFO
+#      fifo_num  : FIFO number
+#      data      : memoryview of the FIFO in the Telemetry log page
+#
+# Output: list of event records (see get_telemetry_record)
+def get_fifo_event_records(data_area, fifo_num, data):
+    events = []
+    extensions = len(vu_schema_extension_decoders) > 0
+    for offset, class_type, identifier, dw_size, size in get_fifo_events(data):
+        event = {
+            "data area": data_area,
+            "fifo": fifo_num,
+            "class": class_type,
+            "identifier": identifier,
+            "data": data[offset : offset + size].hex(),
+        }
+        if class_type >= 0x80:
+            fields = decode_vu_event(class_type, identifier, data[offset + 4 : offset + size])
+        elif extensions:
+            fields = decode_vu_extension(data[offset : offset + size])
+        else:
+            fields = None
+        if fields != None:
+            event["fields"] = fields
+        events.append(event)
+
+    return events
+
+
+# Decode a Telemetry log page into a record without printing it. Only the checks needed to locate the data are made,
+# use parse_telemetry() to validate a log page.
+#
+# Input:
+#      telemetry      : bytearray of the Telemetry log page
+#      strings        : dictionary of the parsed string log page contining the VU ASCII strings
+#      events         : False to skip decoding the FIFO events, leaving the events list empty
+#      last_data_area : last data area read (1 or 2). The statistics and FIFOs of later data areas are skipped.
+#
+# Output: A dictionary that can be saved as JSON of the form
+#
+#     {'log identifier'    : 7 (Host-Initiated) or 8 (Controller-Initiated),
+#      'ieee'              : IEEE OUI Identifier,
+#      'generation number' : Data Generation Number of the log page type,
+#      'firmware'          : Firmware Version from Data Area 1,
+#      'timestamp'         : Timestamp from Data Area 1,
+#      'smart'             : {<field name> : value, ...},      # SMART / Health Information (02h)
+#      'smart extended'    : {<field name> : value, ...},      # SMART / Health Information Extended (C0h)
+#      'statistics'        : [<see get_statistic_records>, ...],
+#      'events'            : [{'data area' : data area, 'fifo' : fifo #, 'class' : class type, 'identifier' : identifier,
+#                              'data' : hex string of the event descriptor,
+#             <optional>       'fields' : {<field name> : value, ...} from a vendor unique event decoder or VU schema}, ...]}
+def get_telemetry_record(telemetry, strings, events=True, last_data_area=2):
+    if len(telemetry) < 512 + 1536:
+        sys.exit(f"Telemetry log is smaller than the header and Data Area 1 header: {len(telemetry)}")
+
+    log_id = telemetry[0]
+    if (log_id != 7) and (log_id != 8):
+        sys.exit(f"Telemetry Log Identifier of {log_id} is not the correct value.")
+
+    layout = get_telemetry_layout(telemetry)
+    for data_area, (start, end) in layout["data areas"].items():
+        if (data_area <= last_data_area) and (end > len(telemetry)):
+            sys.exit(f"Data Area {data_area} size {end - start} is larger than telemetry data.")
+
+    select_vu_schemas(telemetry, strings)
+
+    da1 = layout["data areas"][1][0]
+    smart = telemetry[da1 + 512 : da1 + 1024]
+    smart_extended = telemetry[da1 + 1024 : da1 + 1536]
+    record = {
+        "log identifier": log_id,
+        "ieee": int.from_bytes(telemetry[5:8], "little"),
+        "generation number": telemetry[381] if log_id == 7 else telemetry[383],
+        "firmware": telemetry[da1 + 56 : da1 + 64].decode(errors="replace"),
+        "timestamp": int.from_bytes(telemetry[da1 + 8 : da1 + 14], "little"),
+        "smart": reuse_section("record SMART", smart, get_smart_record, smart, smart_fields),
+        "smart extended": reuse_section("record SMART extended", smart_extended, get_smart_record, smart_extended, smart_extended_fields),
+        "statistics": [],
+        "events": [],
+    }
+
+    for data_area, (start, end) in layout["statistics"].items():
+        if data_area > last_data_area:
+            continue
+        data = telemetry[start:end]
+        record["statistics"] += reuse_section(
+            f"record Data Area {data_area} statistics", data, get_statistic_records, data_area, data, strings
+        )
+
+    # The FIFOs are views of the log page so the events are decoded without copying them
+    view = memoryview(telemetry)
+    for fifo_num, (data_area, start, end) in layout["fifos"].items():
+        if not events:
+            break
+        if data_area > last_data_area:
+            continue
+        data = view[start:end]
+        record["events"] += reuse_section(f"record FIFO {fifo_num}", data, get_fifo_event_records, data_area, fifo_num, data)
+
+    return record
+
+
+# Parse and print the Host-Initiated Telemetry log page
+#
+# Input:
+#
+#      telemetry      : bytearray of the telemetry data
+#      strings        : dictionary of the parsed string log page contining the VU ASCII strings
+#      last_data_area : None if the whole log page was read or the last data area read (1 or 2, see read_log)
+#
+# Output: None
+def parse_telemetry(telemetry, strings, last_data_area=None):
+    tel_len = len(telemetry)
+
+    # Validate the header exists
+    if len(telemetry) < 512:
+        sys.exit(f"Telemetry log does is smaller than the defined NVMe header of 512 byte: {tel_len}")
+
+    # When only some data areas were read, the header is validated against the largest data area and the data areas
+    # that were read are checked to be complete
+    header_len = tel_len
+    if last_data_area != None:
+        ends = [512 + int.from_bytes(telemetry[first:last], "little") * 512 for first, last in data_area_last_block_fields]
+        if ends[last_data_area - 1] > tel_len:
+            sys.exit(f"Data Area {last_data_area} size {ends[last_data_area - 1] - 512} is larger than telemetry data.")
+        header_len = max(ends)
+
+    # Parse the header, which is validated against the log page length
+    with timed_phase("parse_telemetry_header"):
+        header = bytes(telemetry[0:512]) + header_len.to_bytes(8, "little")
+        (data_area_1_last_block, data_area_2_last_block, data_area_3_last_block, data_area_4_last_block) = reuse_section(
+            "print header", header, parse_telemetry_header, telemetry[0:512], header_len
+        )
+
+    select_vu_schemas(telemetry, strings)
+
+    # Parse and print Data Area 1
+    da1_offset = 512
+    da1_size = data_area_1_last_block * 512
+
+    with timed_phase("Data Area 1 slice"):
+        data_area_1 = telemetry[da1_offset : da1_offset + da1_size]
+
+    (fifo, data_area_2_stat_start_dw, data_area_2_stat_size_dw) = parse_data_area_1(data_area_1, strings)
+    # Parse and print Data Area 2
+    if last_data_area == 1:
+        print("\n\tData Area 2: Not read\n")
+    else:
+        da2_offset = da1_offset + da1_size
+        da2_size = (data_area_2_last_block - data_area_1_last_block) * 512
+
+        with timed_phase("Data Area 2 slice"):
+            data_area_2 = telemetry[da2_offset : da2_offset + da2_size]
+
+        parse_data_area_2(data_area_2_stat_start_dw, data_area_2_stat_size_dw, data_area_2, fifo, strings)
+
+    # Ignoring data area 3 and data area 4
+    print("\n\tData Area 3: Ignored\n")
+    print("\n\tData Area 4: Ignored\n")
+
+
+# Parse and print a Telemetry log page as it is read from a stream such as a pipe. Each part is parsed as soon as its
+# bytes arrive. The length of the stream is only known when it ends so the data area sizes are validated as the data
+# areas are read.
+#
+# Input:
+#
+#      f              : binary file object of the Telemetry log page (see open_log)
+#      strings        : dictionary of the parsed string log page contining the VU ASCII strings
+#      last_data_area : None to read the whole log page or the last data area to read (1 or 2). The rest of the stream
+#                       is not read.
+#
+# Output: The number of bytes of the Telemetry log page read
+def parse_telemetry_stream(f, strings, last_data_area=None):
+    header = read_stream(f, 512)
+
+    # Validate the header exists
+    if len(header) < 512:
+        sys.exit(f"Telemetry log does is smaller than the defined NVMe header of 512 byte: {len(header)}")
+
+    # Parse the header against the largest data area as the rest of the log page has not been read
+    ends = [512 + int.from_bytes(header[first:last], "little") * 512 for first, last in data_area_last_block_fields]
+    with timed_phase("parse_telemetry_header"):
+        (data_area_1_last_block, data_area_2_last_block, data_area_3_last_block, data_area_4_last_block) = parse_telemetry_header(
+            header, max(ends)
+        )
+
+    # Parse and print Data Area 1
+    da1_size = data_area_1_last_block * 512
+    with timed_phase("Data Area 1 read"):
+        data_area_1 = read_stream(f, da1_size)
+    if len(data_area_1) < da1_size:
+        sys.exit(f"Data Area 1 size {da1_size} is larger than telemetry data.")
+
+    select_vu_schemas(header + data_area_1, strings)
+    (fifo, data_area_2_stat_start_dw, data_area_2_stat_size_dw) = parse_data_area_1(data_area_1, strings)
+
+    if last_data_area == 1:
+        print("\n\tData Area 2: Not read\n")
+        print("\n\tData Area 3: Ignored\n")
+        print("\n\tData Area 4: Ignored\n")
+        return 512 + da1_size
+
+    # Parse and print Data Area 2
+    da2_size = max(0, (data_area_2_last_block - data_area_1_last_block) * 512)
+    with timed_phase("Data Area 2 read"):
+        data_area_2 = read_stream(f, da2_size)
+    if len(data_area_2) < da2_size:
+        sys.exit(f"Data Area 2 size {data_area_2_last_block * 512} is larger than telemetry data.")
+
+    parse_data_area_2(data_area_2_stat_start_dw, data_area_2_stat_size_dw, data_area_2, fifo, strings)
+
+    tel_len = 512 + da1_size + da2_size
+    if last_data_area == 2:
+        print("\n\tData Area 3: Ignored\n")
+        print("\n\tData Area 4: Ignored\n")
+        return tel_len
+
+    # Data Areas 3 and 4 are ignored so their bytes are only counted
+    with timed_phase("Data Area 3 and 4 read"):
+        while True:
+            chunk = f.read(stream_read_size)
+            if len(chunk) == 0:
+                break
+            tel_len += len(chunk)
+            check_memory_budget()
+
+    if ends[2] > tel_len:
+        sys.exit(f"Data Area 3 size {data_area_3_last_block * 512} is larger than telemetry data.")
+    if ends[3] > tel_len:
+        sys.exit(f"Data Area 4 size {data_area_4_last_block * 512} is larger than telemetry data.")
+
+    # Ignoring data area 3 and data area 4
+    print("\n\tData Area 3: Ignored\n")
+    print("\n\tData Area 4: Ignored\n")
+
+    return tel_len
+
+
+# Metrics registry, or None when metrics are not collected
+#
+#      metrics = {<metric name> : {'type'    : 'counter' or 'histogram',
+#                                  'help'    : description of the metric,
+#                                  'buckets' : list of the histogram bucket upper bounds (histograms only),
+#                                  'samples' : {<tuple of (label, value) tuples> : counter value or
+#                                                                                  [<bucket counts>, ..., sum, count]}}}
+metrics = None
+metrics_lock = threading.Lock()
+
+# Metrics collected when the registry is initialized: <metric name> : (type, description, histogram buckets)
+metric_definitions = {
+    "ocp_telemetry_dumps": ("counter", "Telemetry log pages parsed by result.", None),
+    "ocp_telemetry_bytes_scanned": ("counter", "Bytes read from the Telemetry and OCP Strings log pages.", None),
+    "ocp_telemetry_events_decoded": ("counter", "FIFO events decoded by debug event class.", None),
+    "ocp_telemetry_statistics_decoded": ("counter", "Statistic descriptors decoded by data area.", None),
+    "ocp_telemetry_validation_failures": ("counter", "Telemetry log pages that failed a validation rule.", None),
+    "ocp_telemetry_sections": ("counter", "Dump sections decoded or reused from the previous dump of the drive.", None),
+    "ocp_telemetry_dump_duration_seconds": (
+        "histogram",
+        "Time to read and parse a Telemetry log page.",
+        [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60],
+    ),
+}
+
+
+# Initialize the metrics registry so that metrics are collected
+#
+# Input: None
+#
+# Output: None
+def init_metrics():
+    global metrics
+
+    metrics = {}
+    for name, (metric_type, description, buckets) in metric_definitions.items():
+        metrics[name] = {"type": metric_type, "help": description, "buckets": buckets, "samples": {}}
+
+
+# Increment a counter in the metrics registry
+#
+# Input:
+#      name   : name of the counter
+#      labels : tuple of (label, value) tuples
+#      value  : amount to add to the counter
+#
+# Output: None
+def inc_counter(name, labels=(), value=1):
+    if metrics is None:
+        return
+
+    with metrics_lock:
+        samples = metrics[name]["samples"]
+        samples[labels] = samples.get(labels, 0) + value
+
+
+# Add an observation to a histogram in the metrics registry
+#
+# Input:
+#      name   : name of the histogram
+#      value  : observed value
+#      labels : tuple of (label, value) tuples
+#
+# Output: None
+def observe_histogram(name, value, labels=()):
+    if metrics is None:
+        return
+
+    with metrics_lock:
+        metric = metrics[name]
+        sample = metric["samples"].setdefault(labels, [0] * (len(metric["buckets"]) + 2))
+        for x, bound in enumerate(metric["buckets"]):
+            if value <= bound:
+                sample[x] += 1
+        sample[-2] += value
+        sample[-1] += 1
+
+
+# Convert a validation error message to a rule name by removing the values from the message
+#
+# Input:
+#      message : validation error message
+#
+# Output: rule name
+def get_validation_rule(message):
+    return re.sub(r"0x[0-9a-fA-F]+|\d+", "N", str(message))
+
+
+# Render the metrics registry in the OpenMetrics text format
+#
+# Input: None
+#
+# Output: string containing the metrics
+def get_openmetrics():
+    def format_labels(labels):
+        if len(labels) == 0:
+            return ""
+        values = []
+        for label, value in labels:
+            value = value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+            values.append(f'{label}="{value}"')
+        return "{" + ",".join(values) + "}"
+
+    lines = []
+    with metrics_lock:
+        for name, metric in metrics.items():
+            lines.append(f"# TYPE {name} {metric['type']}")
+            lines.append(f"# HELP {name} {metric['help']}")
+            for labels, value in sorted(metric["samples"].items()):
+                if metric["type"] == "counter":
+                    lines.append(f"{name}_total{format_labels(labels)} {value}")
+                else:
+                    for bound, count in zip(metric["buckets"], value):
+                        lines.append(f"{name}_bucket{format_labels(labels + (('le', str(float(bound))),))} {count}")
+                    lines.append(f"{name}_bucket{format_labels(labels + (('le', '+Inf'),))} {value[-1]}")
+                    lines.append(f"{name}_sum{format_labels(labels)} {value[-2]}")
+                    lines.append(f"{name}_count{format_labels(labels)} {value[-1]}")
+    lines.append("# EOF")
+
+    return "\n".join(lines) + "\n"
+
+
+# Start serving the metrics registry on a background thread
+#
+# Input:
+#      port : TCP port to serve /metrics
+#
+# Output: The HTTP server
+def start_metrics_server(port):
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    # HTTP request handler serving the metrics registry at /metrics
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] != "/metrics":
+                self.send_error(404)
+                return
+
+            body = get_openmetrics().encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/openmetrics-text; version=1.0.0; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("", port), MetricsHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    print(f"Serving metrics at http://localhost:{server.server_address[1]}/metrics", file=sys.stderr)
+
+    return server
+
+
+# Wall and CPU time of each phase when profiling, or None when not profiling
+#
+#      phase_times = [(<phase name>, <wall seconds>, <CPU seconds>), ...]
+phase_times = None
+
+# Memory used by each phase of a dump when tracking memory, or None when not tracking memory
+#
+#      phase_memory = {'phases' : [(<phase name>, <bytes still allocated>, <peak bytes>, <RSS bytes or None>), ...],
+#                      'start'  : bytes allocated at the start of the dump,
+#                      'peak'   : peak bytes allocated by the dump,
+#                      'budget' : maximum bytes the dump can allocate or None,
+#                      'phase'  : name of the phase being run or None}
+phase_memory = None
+
+
+# Get the resident set size of the process
+#
+# Input: None
+#
+# Output: The resident set size in bytes or None if it cannot be read on this platform
+def get_rss():
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+# Get the peak resident set size of the process
+#
+# Input: None
+#
+# Output: The peak resident set size in bytes or None if it cannot be read on this platform
+def get_peak_rss():
+    if resource is None:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports bytes and Linux reports kilobytes
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+# Stop the dump if it has allocated more than the memory budget. This is called after each phase and, so a phase does
+# not run to the end past the budget, during the chunked log page reads and the FIFO walks.
+#
+# Input: None
+#
+# Output: None
+def check_memory_budget():
+    if (phase_memory is None) or (phase_memory["budget"] is None):
+        return
+
+    import tracemalloc
+
+    peak = max(phase_memory["peak"], tracemalloc.get_traced_memory()[1] - phase_memory["start"])
+    if peak > phase_memory["budget"]:
+        sys.exit(f"Memory budget of {phase_memory['budget']} bytes exceeded with {peak} bytes in phase {phase_memory['phase']}.")
+
+
+# Record the wall and CPU time of a phase in phase_times and its memory use in phase_memory
+#
+# Input:
+#      name : name of the phase
+#
+# Output: None
+@contextmanager
+def timed_phase(name):
+    if (phase_times is None) and (phase_memory is None):
+        yield
+        return
+
+    # tracemalloc is imported by main when memory is tracked
+    if phase_memory is not None:
+        import tracemalloc
+
+        tracemalloc.reset_peak()
+        memory_start = tracemalloc.get_traced_memory()[0]
+        outer_phase = phase_memory["phase"]
+        phase_memory["phase"] = name
+
+    wall_start = perf_counter()
+    cpu_start = process_time()
+    try:
+        yield
+    finally:
+        if phase_times is not None:
+            phase_times.append((name, perf_counter() - wall_start, process_time() - cpu_start))
+
+        if phase_memory is not None:
+            current, peak = tracemalloc.get_traced_memory()
+            phase_memory["phases"].append((name, current - memory_start, peak - memory_start, get_rss()))
+            phase_memory["peak"] = max(phase_memory["peak"], peak - phase_memory["start"])
+
+    # Stop the dump as soon as a phase exceeds the memory budget
+    if phase_memory is not None:
+        check_memory_budget()
+        phase_memory["phase"] = outer_phase
+
+
+# Print the wall and CPU time of each phase to stderr
+#
+# Input:
+#      total : tuple of the (wall seconds, CPU seconds) of the whole dump
+#
+# Output: None
+def print_phase_times(total):
+    print("\nProfile:", file=sys.stderr)
+    print(f"\t{'Phase':<44}{'Wall (s)':>12}{'CPU (s)':>12}{'Wall %':>8}", file=sys.stderr)
+    for name, wall, cpu in phase_times:
+        share = wall / total[0] if total[0] > 0 else 0
+        print(f"\t{name:<44}{wall:>12.6f}{cpu:>12.6f}{share:>8.1%}", file=sys.stderr)
+    print(f"\t{'Total':<44}{total[0]:>12.6f}{total[1]:>12.6f}", file=sys.stderr)
+
+
+# Print the memory used by each phase to stderr
+#
+# Input: None
+#
+# Output: None
+def print_phase_memory():
+    def format_bytes(value):
+        return "-" if value is None else str(value)
+
+    print("\nMemory:", file=sys.stderr)
+    print(f"\t{'Phase':<44}{'Allocated':>14}{'Peak':>14}{'RSS':>14}", file=sys.stderr)
+    for name, allocated, peak, rss in phase_memory["phases"]:
+        print(f"\t{name:<44}{allocated:>14}{peak:>14}{format_bytes(rss):>14}", file=sys.stderr)
+    print(f"\t{'Dump peak':<44}{'':>14}{phase_memory['peak']:>14}{format_bytes(get_peak_rss()):>14}", file=sys.stderr)
+
+
+# Get the last data area to read from the --areas value. Data Area 2 is located by the Data Area 1 header so the data
+# areas read always start at Data Area 1.
+#
+# Input:
+#      areas : string of comma separated data areas, "1" or "1,2"
+#
+# Output: The last data area to read
+def get_last_data_area(areas):
+    try:
+        numbers = sorted({int(area) for area in areas.split(",")})
+    except ValueError:
+        numbers = []
+
+    if numbers not in ([1], [1, 2]):
+        sys.exit(f"Data areas {areas} are not valid. Specify 1 or 1,2.")
+    return numbers[-1]
+
+
+# Parse the input parameters
+#
+# Input:
+#      argv : list of commandline arguments or None to use sys.argv
+#
+# Output: Input parameters
+#
+def parse_inputs(argv=None):
+    import argparse
+
+    telemetry_default = "telemetry.bin"
+    string_default = "string.bin"
+
+    # Add the agruments
+    parser = argparse.ArgumentParser(
+        prog="ocp_dump_nvme_telemtry.py",
+        description="This script parses the inputed NVMe(TM) Telemetry  log page using the inputted OCP Strings log page "
+        "to print vendor unique information. This script is based on the OCP Datacenter NVMe SSD specification " + ocp_ver + ". "
+        "The commands " + ", ".join(commands) + " are run with '<command> -h' for their help.",
+        epilog="The Telemetry Host-Initiated log page is based off of NVM Express Base SPecification 2.0c.",
+    )
+
+    parser.add_argument(
+        "-t",
+        "--telemetry",
+        type=str,
+        nargs="+",
+        dest="telemetry",
+        required=False,
+        metavar="<filename>",
+        default=[telemetry_default],
+        help="Telemetry Host-Initiated log page filename. "
+        + "Defines the input filename containing the Telemetry Host-Initiated log page. If not specified then the filename '"
+        + telemetry_default
+        + "' is used. More than one filename parses each log page in turn and a log page that fails validation is "
+        + "reported without stopping the others. A tar or zip bundle is read without extracting it and each Telemetry "
+        + "log page in it is parsed with the OCP Strings log page paired by the bundle's "
+        + bundle_manifest
+        + " or by name. '-' reads the log page from stdin and 'fd:<N>' from file descriptor N, parsing each data area "
+        + "as it arrives.",
+    )
+    parser.add_argument(
+        "-s",
+        "--string",
+        type=str,
+        nargs="+",
+        dest="string",
+        required=False,
+        metavar="<filename>",
+        default=[string_default],
+        help="OCP Strings log page (C9h) filename. "
+        + "Defines the input filename containing the OCP Strings log page. If not specified then the filename '"
+        + string_default
+        + "' is used. Either one filename used for every Telemetry log page or one filename for each Telemetry log page. "
+        + "'-' reads the log page from stdin and 'fd:<N>' from file descriptor N.",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        dest="profile",
+        required=False,
+        help="Print the wall and CPU time of each phase of the dump to stderr.",
+    )
+    parser.add_argument(
+        "--profile-output",
+        type=str,
+        dest="profile_output",
+        required=False,
+        metavar="<filename>",
+        help="Run the dump under cProfile and write the statistics to this .pstats filename. The times reported by "
+        + "--profile include the cProfile overhead when both are specified.",
+    )
+    parser.add_argument(
+        "--memory-report",
+        action="store_true",
+        dest="memory_report",
+        required=False,
+        help="Print the bytes allocated (tracemalloc) and the resident set size of each phase of the dump to stderr. "
+        + "The Allocated column is the memory still held at the end of the phase and Peak is the most held during it. "
+        + "The RSS of the Dump peak is the peak resident set size of the process.",
+    )
+    parser.add_argument(
+        "--memory-budget",
+        type=int,
+        dest="memory_budget",
+        required=False,
+        metavar="<bytes>",
+        help="Fail a dump that allocates more than this number of bytes as measured by tracemalloc. The budget is "
+        + "checked as the log pages are read, after each FIFO event and at the end of each phase.",
+    )
+    parser.add_argument(
+        "--metrics",
+        type=str,
+        dest="metrics",
+        required=False,
+        metavar="<filename>",
+        help="Write the parser metrics to this filename in the OpenMetrics text format after the log pages are parsed.",
+    )
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        dest="metrics_port",
+        required=False,
+        metavar="<port>",
+        help="Serve the parser metrics in the OpenMetrics text format at http://<host>:<port>/metrics. The script keeps "
+        + "serving after the log pages are parsed until it is interrupted.",
+    )
+    parser.add_argument(
+        "--vu-schema",
+        type=str,
+        nargs="+",
+        dest="vu_schema",
+        required=False,
+        default=[],
+        metavar="<filename>",
+        help="JSON or TOML (.toml) schemas of the fields of vendor unique event payloads and VU extension data. A schema "
+        + "can be limited to firmware versions or to the sha256 of the OCP Strings log page (see load_vu_schema).",
+    )
+    parser.add_argument(
+        "-f",
+        "--format",
+        type=str,
+        dest="format",
+        required=False,
+        choices=["text", "json", "ndjson"],
+        default="text",
+        help="Output format. json prints the record of each log page (see the record command) and ndjson prints one "
+        + "line for each log page.",
+    )
+    parser.add_argument(
+        "--cache",
+        type=str,
+        dest="cache",
+        required=False,
+        metavar="<directory>",
+        help="Parsed result cache directory. A log page parsed before with the same OCP Strings log page, script "
+        + "version and VU schemas is printed in any format from the cache without parsing it again.",
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        dest="cache_size",
+        required=False,
+        metavar="<bytes>",
+        default=1 << 30,
+        help="Maximum size of the parsed result cache. The least recently used entries are removed after the log pages "
+        + "are parsed.",
+    )
+    parser.add_argument(
+        "--drive-state",
+        type=str,
+        dest="drive_state",
+        required=False,
+        metavar="<directory>",
+        help="Directory of the decoded sections of the last dump of each drive. The header, SMART, statistics and FIFO "
+        + "sections that are unchanged since the last dump of the drive are not decoded again.",
+    )
+    parser.add_argument(
+        "--drive",
+        type=str,
+        dest="drive",
+        required=False,
+        metavar="<name>",
+        help="Drive name of the log pages for --drive-state. Default is the name of the directory of each log page.",
+    )
+    parser.add_argument(
+        "--areas",
+        type=str,
+        dest="areas",
+        required=False,
+        metavar="<areas>",
+        help="Data areas to read and parse: 1 or 1,2. The header is read first and reading stops at the end of the last "
+        + "data area, e.g. 1 only reads the header, SMART and statistics of Data Area 1 and the Data Area 1 FIFOs.",
+    )
+    parser.add_argument(
+        "--index",
+        action="store_true",
+        dest="index",
+        required=False,
+        help="Write an event index sidecar (<log page>.idx) of the class, identifier, size, offset and timestamp of each "
+        + "FIFO event. The sidecar of a log page in a bundle is written next to the bundle.",
+    )
+    parser.add_argument(
+        "-v", "--version", action="store_true", dest="list_ver", required=False, help="Specify the version of this script and exit."
+    )
+
+    # Parse the argument
+    return parser.parse_args(argv)
+
+
+# Magic bytes of the compressed formats of the log pages
+compression_magic = ((b"\x1f\x8b", "gzip"), (b"\xfd7zXZ\x00", "xz"), (b"\x28\xb5\x2f\xfd", "zstd"))
+
+# Size of the reads from a log page stream
+stream_read_size = 1 << 20
+
+
+# Check if a log page source is a stream
+#
+# Input:
+#      source : log page source (see open_source)
+#
+# Output: True for stdin and file descriptors
+def is_stream_source(source):
+    return isinstance(source, str) and ((source == "-") or source.startswith("fd:"))
+
+
+# Open a log page source without decompressing it
+#
+# Input:
+#      source : log page filename, "-" for stdin, "fd:<N>" for file descriptor N, a (bundle filename, bundle format,
+#               member name) tuple of a log page in a bundle (see get_dump_sources) or bytes of a log page
+#
+# Output: A binary file object
+@contextmanager
+def open_source(source):
+    if isinstance(source, tuple):
+        with open_bundle_member(source) as f:
+            yield f
+        return
+
+    if not isinstance(source, str):
+        f = io.BytesIO(source)
+    elif source == "-":
+        f = open(sys.stdin.fileno(), mode="rb", closefd=False)
+    elif source.startswith("fd:"):
+        try:
+            f = open(int(source[3:]), mode="rb", closefd=False)
+        except ValueError:
+            sys.exit(f"File descriptor {source[3:]} is not a number.")
+    else:
+        f = open(source, mode="rb")
+
+    with f:
+        yield f
+
+
+# Open a log page, decompressing gzip, xz and zstd log pages as a stream. The format is detected by the magic bytes.
+#
+# Input:
+#      source : log page source (see open_source)
+#
+# Output: A binary file object of the decompressed log page
+@contextmanager
+def open_log(source):
+    filename = get_source_name(source)
+    with open_source(source) as f:
+        # A pipe can not seek so its magic bytes are peeked at
+        if f.seekable():
+            magic = f.read(6)
+            f.seek(0)
+        else:
+            magic = f.peek(6)[:6]
+
+        format = None
+        for prefix, name in compression_magic:
+            if magic.startswith(prefix):
+                format = name
+
+        if format is None:
+            yield f
+        elif format == "gzip":
+            import gzip
+
+            with gzip.GzipFile(fileobj=f) as stream:
+                yield stream
+        elif format == "xz":
+            import lzma
+
+            with lzma.LZMAFile(f) as stream:
+                yield stream
+        else:
+            # zstandard is only needed to read zstd compressed log pages
+            try:
+                import zstandard
+            except ImportError:
+                sys.exit(f"{filename} is zstd compressed and the zstandard package is not installed.")
+            with zstandard.ZstdDecompressor().stream_reader(f) as stream:
+                yield stream
+
+
+# Get the number of bytes left in a log page stream
+#
+# Input:
+#      f : binary file object (see open_log)
+#
+# Output: The bytes left for an uncompressed file or bundle member, None for pipes and decompressed streams
+def get_stream_remaining(f):
+    # Seeking a decompressed stream to the end would decompress all of it
+    if not isinstance(f, (io.BufferedReader, io.BytesIO)) or not f.seekable():
+        return None
+
+    position = f.tell()
+    end = f.seek(0, io.SEEK_END)
+    f.seek(position)
+    return max(0, end - position)
+
+
+# Read bytes from a log page stream. The reads are no larger than the bytes left in the file so a small log page is
+# not read into a stream_read_size buffer.
+#
+# Input:
+#      f    : binary file object (see open_log)
+#      size : number of bytes to read or None to read to the end
+#
+# Output: bytes read, fewer than size at the end of the stream
+def read_stream(f, size=None):
+    chunks = []
+    remaining = size
+    file_remaining = get_stream_remaining(f)
+    if file_remaining != None:
+        remaining = file_remaining if remaining is None else min(remaining, file_remaining)
+    while (remaining is None) or (remaining > 0):
+        chunk = f.read(stream_read_size if remaining is None else min(remaining, stream_read_size))
+        if len(chunk) == 0:
+            break
+        chunks.append(chunk)
+        if remaining != None:
+            remaining -= len(chunk)
+        check_memory_budget()
+    return b"".join(chunks)
+
+
+# Get the name of a log page source for messages
+#
+# Input:
+#      source : log page source (see open_source)
+#
+# Output: name of the log page
+def get_source_name(source):
+    if isinstance(source, tuple):
+        return f"{source[0]}:{source[2]}"
+    return source if isinstance(source, str) else "Log page"
+
+
+# Read a log page, decompressing it if needed (see open_log)
+#
+# Input:
+#      source         : log page source (see open_source)
+#      last_data_area : None to read the whole file or, for a Telemetry log page, the last data area needed. Reading
+#                       and decompressing stop after the end of that data area.
+#
+# Output: bytes of the log page
+def read_log(source, last_data_area=None):
+    with open_log(source) as f:
+        if last_data_area is None:
+            return read_stream(f)
+
+        data = read_stream(f, 512)
+        if (len(data) < 512) or (data[0] not in (7, 8)):
+            return data + read_stream(f)
+
+        (first, last) = data_area_last_block_fields[last_data_area - 1]
+        end = 512 + int.from_bytes(data[first:last], "little") * 512
+        return data + read_stream(f, max(0, end - 512))
+
+
+# Name of the optional manifest of a bundle of the form
+#
+#     {'dumps' : [{'telemetry' : member name, 'strings' : member name}, ...]}
+#
+# where the member names are relative to the directory of the manifest
+bundle_manifest = "manifest.json"
+
+
+# Get the archive format of a bundle of log pages
+#
+# Input:
+#      filename : filename
+#
+# Output: "zip", "tar" or None if the file is not a bundle
+def get_bundle_format(filename):
+    import tarfile
+    import zipfile
+
+    try:
+        if zipfile.is_zipfile(filename):
+            return "zip"
+        if tarfile.is_tarfile(filename):
+            return "tar"
+    except OSError:
+        pass
+    return None
+
+
+# Get the names of the file members of a bundle without reading them
+#
+# Input:
+#      filename : bundle filename
+#      format   : "zip" or "tar" (see get_bundle_format)
+#
+# Output: list of member names
+def get_bundle_members(filename, format):
+    import lzma
+    import tarfile
+    import zipfile
+
+    try:
+        if format == "zip":
+            with zipfile.ZipFile(filename) as bundle:
+                return [info.filename for info in bundle.infolist() if not info.is_dir()]
+
+        # Stream mode skips over the member data, decompressing a compressed tar once
+        with tarfile.open(filename, "r|*") as bundle:
+            return [member.name for member in bundle if member.isfile()]
+    except (tarfile.TarError, zipfile.BadZipFile, EOFError, lzma.LZMAError) as error:
+        sys.exit(f"Bundle {filename} is not readable: {error}")
+
+
+# Open a member of a bundle as a stream without extracting it or reading it into memory
+#
+# Input:
+#      source : (bundle filename, "zip" or "tar", member name) (see get_dump_sources)
+#
+# Output: A binary file object of the member
+@contextmanager
+def open_bundle_member(source):
+    import lzma
+    import tarfile
+    import zipfile
+
+    (filename, format, name) = source
+    try:
+        if format == "zip":
+            with zipfile.ZipFile(filename) as bundle, bundle.open(name) as f:
+                yield f
+        else:
+            # The members are walked rather than looked up with getmember() so a compressed tar is only decompressed
+            # up to the member
+            with tarfile.open(filename, "r:*") as bundle:
+                for member in bundle:
+                    if member.name == name:
+                        with bundle.extractfile(member) as f:
+                            yield f
+                        return
+                sys.exit(f"Bundle {filename} member {name} does not exist.")
+    except (tarfile.TarError, zipfile.BadZipFile, EOFError, lzma.LZMAError) as error:
+        sys.exit(f"Bundle {filename} is not readable: {error}")
+
+
+# Check if a log page is a Telemetry log page using its header
+#
+# Input:
+#      source : log page source (see open_source)
+#
+# Output: True if the log page starts with a Telemetry log page header
+def is_telemetry_log(source):
+    with open_log(source) as f:
+        header = read_stream(f, 512)
+    return (len(header) == 512) and (header[0] in (7, 8)) and (header[1:5] == bytes(4))
+
+
+# Pair the Telemetry log pages of a bundle with their OCP Strings log pages. The pairs are listed by a manifest if the
+# bundle has one. Otherwise Telemetry log pages are found by their header and OCP Strings log pages by a name
+# containing "string". A Telemetry log page is paired with the OCP Strings log page in its directory, with the one
+# sharing the longest name prefix if there are several, or with the only one in the bundle.
+#
+# Input:
+#      filename : bundle filename
+#      format   : "zip" or "tar" (see get_bundle_format)
+#      members  : list of member names (see get_bundle_members)
+#
+# Output: list of (Telemetry log page member name, OCP Strings log page member name or None)
+def get_bundle_pairs(filename, format, members):
+    for name in members:
+        if posixpath.basename(name) == bundle_manifest:
+            try:
+                with open_bundle_member((filename, format, name)) as f:
+                    manifest = json.loads(read_stream(f))
+                directory = posixpath.dirname(name)
+                pairs = [(posixpath.join(directory, dump["telemetry"]), posixpath.join(directory, dump["strings"])) for dump in manifest["dumps"]]
+            except (ValueError, KeyError, TypeError) as error:
+                sys.exit(f"Bundle {filename} manifest {name} is not valid: {error}")
+            for pair in pairs:
+                for member in pair:
+                    if member not in members:
+                        sys.exit(f"Bundle {filename} manifest {name} member {member} does not exist.")
+            return pairs
+
+    strings = [name for name in members if "string" in posixpath.basename(name).lower()]
+    pairs = []
+    for name in sorted(members):
+        if (name in strings) or not is_telemetry_log((filename, format, name)):
+            continue
+
+        candidates = [string for string in strings if posixpath.dirname(string) == posixpath.dirname(name)]
+        if len(candidates) == 0:
+            candidates = strings if len(strings) == 1 else []
+
+        string = None
+        if len(candidates) > 0:
+            string = max(candidates, key=lambda string: len(posixpath.commonprefix([posixpath.basename(string), posixpath.basename(name)])))
+        pairs.append((name, string))
+
+    if len(pairs) == 0:
+        sys.exit(f"Bundle {filename} has no Telemetry log pages.")
+    return pairs
+
+
+# Get the log pages to dump, opening the bundles
+#
+# Input:
+#      telemetry_files : list of Telemetry log page or bundle filenames
+#      string_files    : list of the OCP Strings log page filename of each Telemetry log page. For a bundle it is used
+#                        for the Telemetry log pages without an OCP Strings log page in the bundle.
+#
+# Output: Generator of (name, Telemetry log page source, OCP Strings log page source, error message or None) (see
+#         open_source). The log pages of a bundle are read from the bundle as they are dumped. A bundle that can not be
+#         read gives one entry with the error.
+def get_dump_sources(telemetry_files, string_files):
+    for telemetry_file, string_file in zip(telemetry_files, string_files):
+        format = get_bundle_format(telemetry_file)
+        if format is None:
+            yield (telemetry_file, telemetry_file, string_file, None)
+            continue
+
+        try:
+            members = get_bundle_members(telemetry_file, format)
+            pairs = get_bundle_pairs(telemetry_file, format, members)
+        except SystemExit as error:
+            yield (telemetry_file, None, None, str(error.code))
+            continue
+        except OSError as error:
+            yield (telemetry_file, None, None, f"{error.strerror}: {error.filename}")
+            continue
+
+        for telemetry_member, string_member in pairs:
+            string_source = (telemetry_file, format, string_member) if string_member != None else string_file
+            yield (f"{telemetry_file}:{telemetry_member}", (telemetry_file, format, telemetry_member), string_source, None)
+
+
+# Parse the OCP Strings log page without printing. The most recent log pages are cached as a batch of dumps usually
+# shares one OCP Strings log page.
+#
+# Input:
+#      string_file : OCP Strings log page filename
+#
+# Output: dictionary of the parsed string log page (see parse_strings)
+@lru_cache(maxsize=16)
+def load_strings(string_file):
+    string_log = read_log(string_file)
+
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        return parse_strings(string_log)
+
+
+# Load a record of a Telemetry log page from a Telemetry log page or a record saved as JSON
+#
+# Input:
+#      filename    : Telemetry log page or JSON record filename
+#      string_file : OCP Strings log page filename or None. Required for a Telemetry log page.
+#      events      : False to skip decoding the FIFO events of a Telemetry log page
+#
+# Output: dictionary of the record (see get_telemetry_record)
+def load_record(filename, string_file, events=True):
+    # A record only uses the header and Data Areas 1 and 2
+    data = read_log(filename, 2)
+
+    # A Telemetry log page starts with a log identifier of 7h or 8h
+    if data[:1] == b"{":
+        return json.loads(data)
+
+    if string_file is None:
+        sys.exit(f"An OCP Strings log page is required to decode {filename}.")
+
+    return get_telemetry_record(data, load_strings(string_file), events)
+
+
+# Compute the delta of a statistic between two dumps of the same drive using its behavior type
+#
+# Input:
+#      old          : statistic record from the older dump
+#      new          : statistic record from the newer dump
+#      power_cycled : True if a power cycle occurred between the dumps
+#
+# Output: A tuple of (delta, status) where status is
+#
+#      'unchanged' : the value did not change
+#      'increased' : the value increased by delta
+#      'saturated' : a saturating counter is at its maximum value so delta is only a lower bound
+#      'reset'     : the value decreased and the statistic is not persistent across a reset or power cycle, delta is
+#                    the value counted since the reset
+#      'wrapped'   : the value of a persistent counter that does not saturate wrapped past its maximum value
+#      'decreased' : the value of a persistent saturating counter decreased by -delta
+def get_statistic_delta(old, new, power_cycled):
+    old_value = old["value"]
+    new_value = new["value"]
+    maximum = (1 << (32 * new["dword size"])) - 1
+
+    if 1 <= new["behavior type"] < len(behavior_type_attributes):
+        (saturating, reset_persistent, power_cycle_persistent) = behavior_type_attributes[new["behavior type"]]
+    else:
+        (saturating, reset_persistent, power_cycle_persistent) = (False, True, True)
+
+    if saturating and (new_value == maximum):
+        return (new_value - old_value, "saturated")
+    if new_value == old_value:
+        return (0, "unchanged")
+    if new_value > old_value:
+        return (new_value - old_value, "increased")
+
+    # The value decreased
+    if (not reset_persistent) or (power_cycled and not power_cycle_persistent):
+        return (new_value, "reset")
+    if not saturating:
+        return (new_value + maximum + 1 - old_value, "wrapped")
+    return (new_value - old_value, "decreased")
+
+
+# Compute the deltas of the fields of a SMART log page between two dumps
+#
+# Input:
+#      old    : dictionary of the SMART fields from the older dump
+#      new    : dictionary of the SMART fields from the newer dump
+#      fields : table of the fields (smart_fields or smart_extended_fields)
+#
+# Output: A list of dictionaries of the form
+#
+#     [{'name' : field name, 'old' : old value, 'new' : new value, 'delta' : new - old,
+#       'status' : 'unchanged', 'increased', 'changed' or 'decreased' (a counter that decreased)}, ...]
+def get_smart_deltas(old, new, fields):
+    deltas = []
+    for name, _, _, counter in fields:
+        if (name not in old) or (name not in new):
+            continue
+
+        delta = new[name] - old[name]
+        if delta == 0:
+            status = "unchanged"
+        elif not counter:
+            status = "changed"
+        elif delta > 0:
+            status = "increased"
+        else:
+            status = "decreased"
+
+        deltas.append({"name": name, "old": old[name], "new": new[name], "delta": delta, "status": status})
+
+    return deltas
+
+
+# Compute the deltas between two records of the same drive
+#
+# Input:
+#      old : record of the older dump (see get_telemetry_record)
+#      new : record of the newer dump (see get_telemetry_record)
+#
+# Output: A dictionary of the form
+#
+#     {'firmware'       : (old firmware, new firmware),
+#      'timestamp'      : (old timestamp, new timestamp),
+#      'power cycled'   : True if the SMART Power Cycles increased,
+#      'smart'          : [<see get_smart_deltas>, ...],
+#      'smart extended' : [<see get_smart_deltas>, ...],
+#      'statistics'     : [{'data area', 'identifier', 'namespace', 'behavior type', 'description', 'old', 'new', 'delta',
+#                           'status' : see get_statistic_delta or 'added' or 'removed'}, ...]}
+def diff_records(old, new):
+    power_cycled = new["smart"].get("Power Cycles", 0) > old["smart"].get("Power Cycles", 0)
+
+    # Index the older statistics so matching is a lookup rather than a search
+    index = {}
+    for stat in old["statistics"]:
+        index[(stat["data area"], stat["identifier"], stat["namespace"])] = stat
+
+    statistics = []
+    for stat in new["statistics"]:
+        old_stat = index.pop((stat["data area"], stat["identifier"], stat["namespace"]), None)
+        if old_stat is None:
+            (old_value, delta, status) = (None, None, "added")
+        else:
+            old_value = old_stat["value"]
+            (delta, status) = get_statistic_delta(old_stat, stat, power_cycled)
+
+        statistics.append({**stat, "old": old_value, "new": stat["value"], "delta": delta, "status": status})
+
+    for stat in index.values():
+        statistics.append({**stat, "old": stat["value"], "new": None, "delta": None, "status": "removed"})
+
+    for stat in statistics:
+        del stat["value"]
+
+    return {
+        "firmware": (old["firmware"], new["firmware"]),
+        "timestamp": (old["timestamp"], new["timestamp"]),
+        "power cycled": power_cycled,
+        "smart": get_smart_deltas(old["smart"], new["smart"], smart_fields),
+        "smart extended": get_smart_deltas(old["smart extended"], new["smart extended"], smart_extended_fields),
+        "statistics": statistics,
+    }
+
+
+# Print the deltas between two records
+#
+# Input:
+#      diff : dictionary of the deltas (see diff_records)
+#      all  : True to print the unchanged values
+#
+# Output: None
+def print_diff(diff, all):
+    print(f"Firmware: {diff['firmware'][0]} -> {diff['firmware'][1]}")
+    print(f"Timestamp: {diff['timestamp'][0]} -> {diff['timestamp'][1]}")
+    print(f"Power cycled: {'Yes' if diff['power cycled'] else 'No'}")
+
+    for key, title in (("smart", "SMART / Health Information (02h)"), ("smart extended", "SMART / Health Information Extended (C0h)")):
+        print(f"\n{title}:")
+        for field in diff[key]:
+            if all or (field["status"] != "unchanged"):
+                print(f"\t{field['name']}: {field['old']} -> {field['new']} ({field['delta']:+}) {field['status']}")
+
+    print("\nStatistics:")
+    for stat in diff["statistics"]:
+        if all or (stat["status"] != "unchanged"):
+            delta = "" if stat["delta"] is None else f" ({stat['delta']:+})"
+            print(
+                f"\tData Area {stat['data area']} Identifier 0x{stat['identifier']:x} Namespace {stat['namespace']}"
+                f" {stat['description']}: {stat['old']} -> {stat['new']}{delta} {stat['status']}"
+            )
+
+
+# Parse the input parameters of the diff command
+#
+# Input:
+#      argv : list of commandline arguments after the command
+#
+# Output: Input parameters
+def parse_diff_inputs(argv):
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="ocp_dump_nvme_telemtry.py diff",
+        description="Compute the deltas of the SMART (02h and C0h) fields and of every statistic between two dumps of the "
+        "same drive. The behavior type of each statistic is used to detect resets, counters that wrapped and saturated "
+        "counters. Each dump is a Telemetry log page or a record saved with the 'record' command.",
+    )
+
+    parser.add_argument("old", type=str, metavar="<old>", help="Telemetry log page or JSON record of the older dump.")
+    parser.add_argument("new", type=str, metavar="<new>", help="Telemetry log page or JSON record of the newer dump.")
+    parser.add_argument(
+        "-s",
+        "--string",
+        type=str,
+        action="append",
+        dest="string",
+        required=False,
+        metavar="<filename>",
+        help="OCP Strings log page (C9h) filename used to decode the Telemetry log pages. Specify it once for both dumps "
+        + "or twice, for the older and then the newer dump.",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=str,
+        dest="output",
+        required=False,
+        metavar="<filename>",
+        help="Write the deltas to this JSON filename instead of printing them.",
+    )
+    parser.add_argument("-a", "--all", action="store_true", dest="all", required=False, help="Print the unchanged values.")
+
+    return parser.parse_args(argv)
+
+
+# Compare two dumps of the same drive
+#
+# Input:
+#      argv : list of commandline arguments after the command
+#
+# Output: None
+def diff_command(argv):
+    args = parse_diff_inputs(argv)
+
+    if args.string is None:
+        string_files = [None, None]
+    elif len(args.string) == 1:
+        string_files = args.string * 2
+    elif len(args.string) == 2:
+        string_files = args.string
+    else:
+        sys.exit("Specify -s once for both dumps or twice, once for each dump.")
+
+    old = load_record(args.old, string_files[0])
+    new = load_record(args.new, string_files[1])
+
+    if old["ieee"] != new["ieee"]:
+        print(f"Warning: the IEEE OUI Identifiers 0x{old['ieee']:x} and 0x{new['ieee']:x} are different.", file=sys.stderr)
+    if new["timestamp"] < old["timestamp"]:
+        print("Warning: the newer dump has an earlier timestamp than the older dump.", file=sys.stderr)
+
+    diff = diff_records(old, new)
+
+    if args.output != None:
+        with open(args.output, "w") as f:
+            json.dump(diff, f, indent=4)
+    else:
+        print_diff(diff, args.all)
+
+
+# Parse the input parameters of the record command
+#
+# Input:
+#      argv : list of commandline arguments after the command
+#
+# Output: Input parameters
+def parse_record_inputs(argv):
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="ocp_dump_nvme_telemtry.py record",
+        description="Decode a Telemetry log page into a JSON record of its header, SMART fields, statistics and events "
+        "that can be used in place of the log page by the other commands.",
+    )
+
+    parser.add_argument(
+        "-t",
+        "--telemetry",
+        type=str,
+        dest="telemetry",
+        required=True,
+        metavar="<filename>",
+        help="Telemetry log page filename.",
+    )
+    parser.add_argument(
+        "-s",
+        "--string",
+        type=str,
+        dest="string",
+        required=True,
+        metavar="<filename>",
+        help="OCP Strings log page (C9h) filename.",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=str,
+        dest="output",
+        required=False,
+        metavar="<filename>",
+        help="JSON filename. If not specified then the record is printed.",
+    )
+    parser.add_argument(
+        "--vu-schema",
+        type=str,
+        nargs="+",
+        dest="vu_schema",
+        required=False,
+        default=[],
+        metavar="<filename>",
+        help="JSON or TOML (.toml) schemas of the fields of vendor unique event payloads and VU extension data. A schema "
+        + "can be limited to firmware versions or to the sha256 of the OCP Strings log page (see load_vu_schema).",
+    )
+
+    return parser.parse_args(argv)
+
+
+# Save the record of a Telemetry log page as JSON
+#
+# Input:
+#      argv : list of commandline arguments after the command
+#
+# Output: None
+def record_command(argv):
+    args = parse_record_inputs(argv)
+
+    for filename in args.vu_schema:
+        load_vu_schema(filename)
+
+    record = load_record(args.telemetry, args.string)
+
+    if args.output != None:
+        with open(args.output, "w") as f:
+            json.dump(record, f)
+    else:
+        print(json.dumps(record, indent=4))
+
+
+# Pair each Telemetry log page with its OCP Strings log page
+#
+# Input:
+#      string : list of OCP Strings log page filenames from the commandline or None
+#      count  : number of Telemetry log pages
+#
+# Output: list of OCP Strings log page filenames (or None) for each Telemetry log page
+def get_string_files(string, count):
+    if string is None:
+        return [None] * count
+    elif len(string) == 1:
+        return string * count
+    elif len(string) == count:
+        return string
+    sys.exit("Specify -s once for every Telemetry log page or once for each Telemetry log page.")
+
+
+# Get the drive name of a dump
+#
+# Input:
+#      filename : Telemetry log page or JSON record filename
+#      drive    : drive name from the commandline or None
+#
+# Output: The drive name or, if not specified, the name of the directory containing the dump
+def get_drive_name(filename, drive):
+    if drive != None:
+        return drive
+    return os.path.basename(os.path.dirname(os.path.abspath(filename)))
+
+
+# Largest value that can be stored as an SQLite integer. Larger values, such as the 16 byte SMART counters, are stored
+# as text.
+sqlite_max_integer = (1 << 63) - 1
+
+# SQLite schema of the ingest command
+sqlite_schema = """
+CREATE TABLE IF NOT EXISTS dumps (
+    id                INTEGER PRIMARY KEY,
+    drive             TEXT NOT NULL,
+    source            TEXT NOT NULL,
+    log_identifier    INTEGER,
+    ieee              INTEGER,
+    generation_number INTEGER,
+    firmware          TEXT,
+    timestamp         INTEGER,
+    UNIQUE (drive, source)
+);
+CREATE INDEX IF NOT EXISTS dumps_drive_timestamp ON dumps (drive, timestamp);
+
+CREATE TABLE IF NOT EXISTS smart_fields (
+    id   INTEGER PRIMARY KEY,
+    page INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    UNIQUE (page, name)
+);
+
+CREATE TABLE IF NOT EXISTS smart (
+    dump_id  INTEGER NOT NULL REFERENCES dumps (id),
+    field_id INTEGER NOT NULL REFERENCES smart_fields (id),
+    value
+);
+
+CREATE TABLE IF NOT EXISTS descriptions (
+    id   INTEGER PRIMARY KEY,
+    text TEXT NOT NULL UNIQUE
+);
+
+CREATE TABLE IF NOT EXISTS statistics (
+    dump_id        INTEGER NOT NULL REFERENCES dumps (id),
+    data_area      INTEGER NOT NULL,
+    identifier     INTEGER NOT NULL,
+    namespace      INTEGER NOT NULL,
+    behavior_type  INTEGER,
+    dword_size     INTEGER,
+    value,
+    description_id INTEGER REFERENCES descriptions (id)
+);
+
+CREATE TABLE IF NOT EXISTS events (
+    dump_id    INTEGER NOT NULL REFERENCES dumps (id),
+    data_area  INTEGER NOT NULL,
+    fifo       INTEGER NOT NULL,
+    sequence   INTEGER NOT NULL,
+    class      INTEGER NOT NULL,
+    identifier INTEGER NOT NULL,
+    data       BLOB
+);
+"""
+
+# SQLite indexes of the SMART field, statistic and event tables. They are created after the rows of a first ingest as
+# building an index once is faster than updating it for every row.
+sqlite_indexes = """
+CREATE INDEX IF NOT EXISTS smart_dump ON smart (dump_id);
+CREATE INDEX IF NOT EXISTS smart_field ON smart (field_id, dump_id);
+CREATE INDEX IF NOT EXISTS statistics_dump ON statistics (dump_id);
+CREATE INDEX IF NOT EXISTS statistics_identifier ON statistics (identifier, dump_id);
+CREATE INDEX IF NOT EXISTS events_dump ON events (dump_id);
+CREATE INDEX IF NOT EXISTS events_class ON events (class, identifier);
+"""
+
+
+# Convert an integer to a value that can be stored in SQLite
+#
+# Input:
+#      value : integer
+#
+# Output: The integer or, if it does not fit in a 64 bit SQLite integer, its decimal string
+def get_sqlite_value(value):
+    if (-sqlite_max_integer - 1) <= value <= sqlite_max_integer:
+        return value
+    return str(value)
+
+
+# Load the record of a dump, catching the errors so that a batch can continue. This runs in the worker processes of
+# the ingest command when --jobs is more than 1.
+#
+# Input:
+#      job : tuple of (Telemetry log page or JSON record filename, OCP Strings log page filename or None,
+#                      True to decode the FIFO events)
+#
+# Output: A tuple of (filename, record or None, error message or None)
+def get_dump_record(job):
+    (filename, string_file, events) = job
+    try:
+        return (filename, load_record(filename, string_file, events), None)
+    except SystemExit as error:
+        return (filename, None, str(error.code))
+    except OSError as error:
+        return (filename, None, f"{error.strerror}: {error.filename}")
+
+
+# Write records to an SQLite database
+#
+# Input:
+#      connection : sqlite3 connection with the ingest schema
+#      records    : iterable of (filename, record or None, error message or None) tuples (see get_dump_record)
+#      drives     : dictionary of the drive name of each filename
+#      batch      : number of dumps written in each transaction
+#      events     : True to write the events
+#
+# Output: A tuple of (dumps written, dumps that failed)
+def write_sqlite_records(connection, records, drives, batch, events):
+    field_ids = {(page, name): id for id, page, name in connection.execute("SELECT id, page, name FROM smart_fields")}
+    description_ids = {text: id for id, text in connection.execute("SELECT id, text FROM descriptions")}
+
+    # Look up the id of a row of a lookup table adding the row if needed
+    def get_id(cache, key, sql):
+        if key not in cache:
+            cache[key] = connection.execute(sql, key if isinstance(key, tuple) else (key,)).lastrowid
+        return cache[key]
+
+    rows = {"smart": [], "statistics": [], "events": []}
+    sql = {
+        "smart": "INSERT INTO smart (dump_id, field_id, value) VALUES (?, ?, ?)",
+        "statistics": "INSERT INTO statistics (dump_id, data_area, identifier, namespace, behavior_type, dword_size, value, "
+        "description_id) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+        "events": "INSERT INTO events (dump_id, data_area, fifo, sequence, class, identifier, data) VALUES (?, ?, ?, ?, ?, ?, ?)",
+    }
+
+    # Write the rows and commit the transaction
+    def flush():
+        for table, table_rows in rows.items():
+            if len(table_rows) > 0:
+                connection.executemany(sql[table], table_rows)
+                table_rows.clear()
+        connection.commit()
+
+    written = 0
+    failures = 0
+    for filename, record, error in records:
+        if record is None:
+            print(f"{filename}: {error}", file=sys.stderr)
+            failures += 1
+            continue
+
+        dump_id = connection.execute(
+            "INSERT INTO dumps (drive, source, log_identifier, ieee, generation_number, firmware, timestamp) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                drives[filename],
+                os.path.abspath(filename),
+                record["log identifier"],
+                record["ieee"],
+                record["generation number"],
+                record["firmware"],
+                record["timestamp"],
+            ),
+        ).lastrowid
+
+        for page, key in ((0x02, "smart"), (0xC0, "smart extended")):
+            for name, value in record[key].items():
+                field_id = get_id(field_ids, (page, name), "INSERT INTO smart_fields (page, name) VALUES (?, ?)")
+                rows["smart"].append((dump_id, field_id, get_sqlite_value(value)))
+
+        for stat in record["statistics"]:
+            description_id = get_id(description_ids, stat["description"], "INSERT INTO descriptions (text) VALUES (?)")
+            rows["statistics"].append(
+                (
+                    dump_id,
+                    stat["data area"],
+                    stat["identifier"],
+                    stat["namespace"],
+                    stat["behavior type"],
+                    stat["dword size"],
+                    get_sqlite_value(stat["value"]),
+                    description_id,
+                )
+            )
+
+        if events:
+            for sequence, event in enumerate(record["events"]):
+                data = bytes.fromhex(event["data"])
+                rows["events"].append((dump_id, event["data area"], event["fifo"], sequence, event["class"], event["identifier"], data))
+
+        written += 1
+        if (written % batch) == 0:
+            flush()
+
+    flush()
+
+    return (written, failures)
+
+
+# Parse the input parameters of the ingest command
+#
+# Input:
+#      argv : list of commandline arguments after the command
+#
+# Output: Input parameters
+def parse_ingest_inputs(argv):
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="ocp_dump_nvme_telemtry.py ingest",
+        description="Decode Telemetry log pages, or records saved with the 'record' command, and store the header, SMART "
+        "fields, statistics and events of each dump in normalized, indexed tables of an SQLite database for trend queries "
+        "per drive and per identifier. A dump already in the database, or listed again, for the same drive and filename "
+        "is skipped.",
+    )
+
+    parser.add_argument("telemetry", type=str, nargs="+", metavar="<filename>", help="Telemetry log page or JSON record filenames.")
+    parser.add_argument(
+        "-s",
+        "--string",
+        type=str,
+        action="append",
+        dest="string",
+        required=False,
+        metavar="<filename>",
+        help="OCP Strings log page (C9h) filename used to decode the Telemetry log pages. Specify it once for every "
+        + "Telemetry log page or once for each Telemetry log page, in the same order.",
+    )
+    parser.add_argument("--sqlite", type=str, dest="sqlite", required=True, metavar="<filename>", help="SQLite database filename.")
+    parser.add_argument(
+        "--drive",
+        type=str,
+        dest="drive",
+        required=False,
+        metavar="<name>",
+        help="Drive name of the dumps. If not specified then the name of the directory containing each dump is used.",
+    )
+    parser.add_argument(
+        "--batch",
+        type=int,
+        dest="batch",
+        required=False,
+        metavar="<value>",
+        default=1000,
+        help="Number of dumps written in each transaction.",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        dest="jobs",
+        required=False,
+        metavar="<value>",
+        default=1,
+        help="Number of processes decoding the dumps. The database is written by a single process.",
+    )
+    parser.add_argument("--no-events", action="store_true", dest="no_events", required=False, help="Do not store the FIFO events.")
+
+    return parser.parse_args(argv)
+
+
+# Store dumps in an SQLite database
+#
+# Input:
+#      argv : list of commandline arguments after the command
+#
+# Output: None
+def ingest_command(argv):
+    args = parse_ingest_inputs(argv)
+
+    if (args.batch < 1) or (args.jobs < 1):
+        sys.exit("The batch and jobs values must be at least 1.")
+
+    string_files = get_string_files(args.string, len(args.telemetry))
+
+    import sqlite3
+
+    connection = sqlite3.connect(args.sqlite)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    connection.executescript(sqlite_schema)
+    if connection.execute("SELECT 1 FROM dumps LIMIT 1").fetchone() != None:
+        connection.executescript(sqlite_indexes)
+
+    # Skip the dumps already in the database and the dumps listed more than once
+    drives = {}
+    jobs = []
+    skipped = 0
+    sources = set()
+    for filename, string_file in zip(args.telemetry, string_files):
+        drive = get_drive_name(filename, args.drive)
+        source = (drive, os.path.abspath(filename))
+        if (source in sources) or (connection.execute("SELECT 1 FROM dumps WHERE drive = ? AND source = ?", source).fetchone() != None):
+            skipped += 1
+            continue
+
+        sources.add(source)
+        drives[filename] = drive
+        jobs.append((filename, string_file, not args.no_events))
+
+    start = perf_counter()
+    if args.jobs > 1:
+        import multiprocessing
+
+        with multiprocessing.Pool(args.jobs) as pool:
+            records = pool.imap(get_dump_record, jobs, chunksize=16)
+            (written, failures) = write_sqlite_records(connection, records, drives, args.batch, not args.no_events)
+    else:
+        records = map(get_dump_record, jobs)
+        (written, failures) = write_sqlite_records(connection, records, drives, args.batch, not args.no_events)
+    connection.executescript(sqlite_indexes)
+    elapsed = perf_counter() - start
+
+    connection.close()
+
+    rate = written / elapsed * 60 if elapsed > 0 else 0
+    print(f"Ingested {written} dumps in {elapsed:.2f}s ({rate:.0f} dumps/minute), {skipped} already ingested or repeated, {failures} failed.")
+
+    if failures > 0:
+        sys.exit(f"{failures} of {len(jobs)} dumps failed to ingest.")
+
+
+# Columns of the export command. Statistics leave fifo and class empty and events leave namespace and description_id
+# empty. The value is the decimal value of a statistic or the hexadecimal data of an event as statistic values can be
+# wider than 64 bits.
+export_columns = ("drive", "dump_ts", "data_area", "fifo", "class", "identifier", "namespace", "value", "description_id")
+
+# Columns of the descriptions written next to the export
+export_description_columns = ("description_id", "description")
+
+# Export formats by filename extension
+export_extensions = {".parquet": "parquet", ".arrow": "arrow", ".csv": "csv"}
+
+
+# Import pyarrow for the Parquet and Arrow exports
+#
+# Input:
+#      None
+#
+# Output: True if pyarrow is installed
+def import_pyarrow():
+    global pyarrow
+
+    try:
+        import pyarrow as module
+        import pyarrow.ipc
+        import pyarrow.parquet
+    except ImportError:
+        return False
+
+    pyarrow = module
+    return True
+
+
+# Get the pyarrow schema of the export
+#
+# Input:
+#      None
+#
+# Output: pyarrow schema
+def get_export_schema():
+    return pyarrow.schema(
+        [
+            ("drive", pyarrow.string()),
+            ("dump_ts", pyarrow.int64()),
+            ("data_area", pyarrow.uint8()),
+            ("fifo", pyarrow.uint8()),
+            ("class", pyarrow.uint8()),
+            ("identifier", pyarrow.uint16()),
+            ("namespace", pyarrow.uint8()),
+            ("value", pyarrow.string()),
+            ("description_id", pyarrow.uint32()),
+        ]
+    )
+
+
+# Open a batched export writer
+#
+# Input:
+#      filename   : output filename
+#      format     : "parquet", "arrow" or "csv"
+#      columns    : column names
+#      schema     : pyarrow schema for the parquet and arrow formats
+#      batch_rows : number of rows buffered before each write
+#
+# Output: dictionary of the writer state
+def open_export_writer(filename, format, columns, schema, batch_rows):
+    writer = {"format": format, "columns": columns, "schema": schema, "batch rows": batch_rows, "rows": [], "count": 0}
+    if format == "parquet":
+        writer["writer"] = pyarrow.parquet.ParquetWriter(filename, schema)
+    elif format == "arrow":
+        writer["file"] = pyarrow.OSFile(filename, "wb")
+        writer["writer"] = pyarrow.ipc.new_file(writer["file"], schema)
+    else:
+        import csv
+
+        writer["file"] = open(filename, "w", newline="")
+        writer["writer"] = csv.writer(writer["file"])
+        writer["writer"].writerow(columns)
+    return writer
+
+
+# Write the buffered rows of an export writer as one record batch
+#
+# Input:
+#      writer : export writer (see open_export_writer)
+#
+# Output: None
+def flush_export_writer(writer):
+    rows = writer["rows"]
+    if len(rows) == 0:
+        return
+
+    if writer["format"] == "csv":
+        writer["writer"].writerows(rows)
+    else:
+        arrays = [pyarrow.array(column, type=field.type) for column, field in zip(zip(*rows), writer["schema"])]
+        writer["writer"].write_batch(pyarrow.RecordBatch.from_arrays(arrays, schema=writer["schema"]))
+
+    writer["count"] += len(rows)
+    rows.clear()
+
+
+# Add a row to an export writer, writing a record batch every batch rows rows
+#
+# Input:
+#      writer : export writer (see open_export_writer)
+#      row    : tuple of column values
+#
+# Output: None
+def add_export_row(writer, row):
+    writer["rows"].append(row)
+    if len(writer["rows"]) >= writer["batch rows"]:
+        flush_export_writer(writer)
+
+
+# Write the remaining rows and close an export writer
+#
+# Input:
+#      writer : export writer (see open_export_writer)
+#
+# Output: Number of rows written
+def close_export_writer(writer):
+    flush_export_writer(writer)
+    if writer["format"] != "csv":
+        writer["writer"].close()
+    if "file" in writer:
+        writer["file"].close()
+    return writer["count"]
+
+
+# Close an export writer after an error without writing its buffered rows and delete its partial output file
+#
+# Input:
+#      writer   : export writer (see open_export_writer)
+#      filename : output filename
+#
+# Output: None
+def discard_export_writer(writer, filename):
+    writer["rows"].clear()
+    try:
+        close_export_writer(writer)
+    except Exception:
+        pass
+    if os.path.exists(filename):
+        os.remove(filename)
+
+
+# Parse the input parameters of the export command
+#
+# Input:
+#      argv : list of commandline arguments after the command
+#
+# Output: Input parameters
+def parse_export_inputs(argv):
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="ocp_dump_nvme_telemtry.py export",
+        description="Decode Telemetry log pages, or records saved with the 'record' command, and export the statistics and "
+        "FIFO events as rows of a fixed schema (" + ", ".join(export_columns) + "). Parquet and Arrow need pyarrow; "
+        "without it CSV is written. The descriptions referenced by description_id are written to a second file named "
+        "<output>_descriptions with the same extension.",
+    )
+
+    parser.add_argument("telemetry", type=str, nargs="+", metavar="<filename>", help="Telemetry log page or JSON record filenames.")
+    parser.add_argument(
+        "-s",
+        "--string",
+        type=str,
+        action="append",
+        dest="string",
+        required=False,
+        metavar="<filename>",
+        help="OCP Strings log page (C9h) filename used to decode the Telemetry log pages. Specify it once for every "
+        + "Telemetry log page or once for each Telemetry log page, in the same order.",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=str,
+        dest="output",
+        required=True,
+        metavar="<filename>",
+        help="Output filename. The format is selected by the extension (.parquet, .arrow or .csv) unless --format is specified.",
+    )
+    parser.add_argument(
+        "-f",
+        "--format",
+        type=str,
+        dest="format",
+        required=False,
+        choices=sorted(set(export_extensions.values())),
+        help="Output format.",
+    )
+    parser.add_argument(
+        "--drive",
+        type=str,
+        dest="drive",
+        required=False,
+        metavar="<name>",
+        help="Drive name of the dumps. If not specified then the name of the directory containing each dump is used.",
+    )
+    parser.add_argument(
+        "--batch-rows",
+        type=int,
+        dest="batch_rows",
+        required=False,
+        metavar="<value>",
+        default=65536,
+        help="Number of rows in each record batch (Parquet row group).",
+    )
+    parser.add_argument("--no-events", action="store_true", dest="no_events", required=False, help="Do not export the FIFO events.")
+    parser.add_argument(
+        "--vu-schema",
+        type=str,
+        nargs="+",
+        dest="vu_schema",
+        required=False,
+        default=[],
+        metavar="<filename>",
+        help="JSON or TOML (.toml) schemas of the fields of vendor unique event payloads and VU extension data. A schema "
+        + "can be limited to firmware versions or to the sha256 of the OCP Strings log page (see load_vu_schema).",
+    )
+
+    return parser.parse_args(argv)
+
+
+# Export statistics and events as record batches
+#
+# Input:
+#      argv : list of commandline arguments after the command
+#
+# Output: None
+def export_command(argv):
+    args = parse_export_inputs(argv)
+
+    if args.batch_rows < 1:
+        sys.exit("The batch rows value must be at least 1.")
+
+    string_files = get_string_files(args.string, len(args.telemetry))
+
+    for filename in args.vu_schema:
+        load_vu_schema(filename)
+
+    (stem, extension) = os.path.splitext(args.output)
+    format = args.format if args.format != None else export_extensions.get(extension.lower(), "csv")
+    if (format != "csv") and not import_pyarrow():
+        print(f"pyarrow is not installed, writing CSV instead of {format}.", file=sys.stderr)
+        format = "csv"
+        if extension.lower() not in export_extensions:
+            stem = args.output
+        args.output = stem + ".csv"
+    descriptions_file = f"{stem}_descriptions{os.path.splitext(args.output)[1]}"
+
+    schema = get_export_schema() if format != "csv" else None
+    writer = open_export_writer(args.output, format, export_columns, schema, args.batch_rows)
+
+    # A failed export closes and deletes its output files rather than leaving them truncated
+    description_ids = {}
+    failures = 0
+    try:
+        for filename, string_file in zip(args.telemetry, string_files):
+            (filename, record, error) = get_dump_record((filename, string_file, not args.no_events))
+            if record is None:
+                print(f"{filename}: {error}", file=sys.stderr)
+                failures += 1
+                continue
+
+            drive = get_drive_name(filename, args.drive)
+            timestamp = record["timestamp"]
+            for stat in record["statistics"]:
+                description_id = description_ids.setdefault(stat["description"], len(description_ids))
+                add_export_row(
+                    writer,
+                    (
+                        drive,
+                        timestamp,
+                        stat["data area"],
+                        None,
+                        None,
+                        stat["identifier"],
+                        stat["namespace"],
+                        str(stat["value"]),
+                        description_id,
+                    ),
+                )
+
+            if not args.no_events:
+                for event in record["events"]:
+                    row = (drive, timestamp, event["data area"], event["fifo"], event["class"], event["identifier"], None, event["data"], None)
+                    add_export_row(writer, row)
+        rows = close_export_writer(writer)
+    except BaseException:
+        discard_export_writer(writer, args.output)
+        raise
+
+    description_schema = None
+    if format != "csv":
+        description_schema = pyarrow.schema([("description_id", pyarrow.uint32()), ("description", pyarrow.string())])
+    description_writer = None
+    try:
+        description_writer = open_export_writer(descriptions_file, format, export_description_columns, description_schema, args.batch_rows)
+        for description, description_id in description_ids.items():
+            add_export_row(description_writer, (description_id, description))
+        close_export_writer(description_writer)
+    except BaseException:
+        if description_writer != None:
+            discard_export_writer(description_writer, descriptions_file)
+        os.remove(args.output)
+        raise
+
+    print(f"Exported {rows} rows to {args.output} and {len(description_ids)} descriptions to {descriptions_file}.")
+
+    if failures > 0:
+        sys.exit(f"{failures} of {len(args.telemetry)} dumps failed to export.")
+
+
+# Version of the aggregate state saved by the aggregate command
+aggregate_state_version = 1
+
+# Ratio of the capacity of a KLL sketch compactor to the compactor above it
+sketch_capacity_ratio = 2 / 3
+
+
+# Create an empty KLL quantile sketch. The sketch is a dictionary that can be saved as JSON and merged with sketches
+# from other runs. Its size is O(k log(count)) so memory does not grow with the number of values.
+#
+# Input:
+#      k : accuracy parameter, the capacity of the top compactor. The rank error is about 1.7 / k.
+#
+# Output: dictionary of the sketch
+def new_sketch(k):
+    return {"k": k, "count": 0, "min": None, "max": None, "sum": 0, "compactors": [[]]}
+
+
+# Get the capacity of a compactor of a KLL sketch
+#
+# Input:
+#      sketch : KLL sketch (see new_sketch)
+#      level  : compactor level, 0 is the level values are added to
+#
+# Output: Capacity of the compactor
+def get_sketch_capacity(sketch, level):
+    depth = len(sketch["compactors"]) - level - 1
+    return int(sketch["k"] * sketch_capacity_ratio**depth) + 2
+
+
+# Compact full compactors of a KLL sketch. Half of the sorted values of a full compactor, chosen at random from the
+# odd or even positions, move up a level where each value has twice the weight.
+#
+# Input:
+#      sketch : KLL sketch (see new_sketch)
+#
+# Output: None
+def compress_sketch(sketch):
+    compactors = sketch["compactors"]
+    max_size = sum(get_sketch_capacity(sketch, level) for level in range(len(compactors)))
+    size = sum(len(compactor) for compactor in compactors)
+
+    level = 0
+    while (size >= max_size) and (level < len(compactors)):
+        compactor = compactors[level]
+        if len(compactor) >= get_sketch_capacity(sketch, level):
+            if level + 1 == len(compactors):
+                compactors.append([])
+                max_size = sum(get_sketch_capacity(sketch, level) for level in range(len(compactors)))
+
+            compactor.sort()
+            odd = len(compactor) % 2
+            compactors[level + 1] += compactor[odd + random.getrandbits(1) :: 2]
+            del compactor[odd:]
+            size = sum(len(compactor) for compactor in compactors)
+        level += 1
+
+
+# Add a value to a KLL sketch
+#
+# Input:
+#      sketch : KLL sketch (see new_sketch)
+#      value  : integer value
+#
+# Output: None
+def add_sketch_value(sketch, value):
+    sketch["count"] += 1
+    sketch["sum"] += value
+    if (sketch["min"] is None) or (value < sketch["min"]):
+        sketch["min"] = value
+    if (sketch["max"] is None) or (value > sketch["max"]):
+        sketch["max"] = value
+
+    compactors = sketch["compactors"]
+    compactors[0].append(value)
+    if len(compactors[0]) >= get_sketch_capacity(sketch, 0):
+        compress_sketch(sketch)
+
+
+# Merge a KLL sketch into another sketch
+#
+# Input:
+#      sketch : KLL sketch that is updated (see new_sketch)
+#      other  : KLL sketch merged into sketch
+#
+# Output: None
+def merge_sketches(sketch, other):
+    if other["count"] == 0:
+        return
+
+    sketch["k"] = min(sketch["k"], other["k"])
+    sketch["count"] += other["count"]
+    sketch["sum"] += other["sum"]
+    sketch["min"] = other["min"] if sketch["min"] is None else min(sketch["min"], other["min"])
+    sketch["max"] = other["max"] if sketch["max"] is None else max(sketch["max"], other["max"])
+
+    compactors = sketch["compactors"]
+    for level, compactor in enumerate(other["compactors"]):
+        if level == len(compactors):
+            compactors.append([])
+        compactors[level] += compactor
+    compress_sketch(sketch)
+
+
+# Get approximate quantiles of the values added to a KLL sketch
+#
+# Input:
+#      sketch    : KLL sketch (see new_sketch)
+#      quantiles : list of quantiles between 0 and 1
+#
+# Output: list of the value at each quantile or None if the sketch is empty
+def get_sketch_quantiles(sketch, quantiles):
+    if sketch["count"] == 0:
+        return [None] * len(quantiles)
+
+    items = sorted((value, 1 << level) for level, compactor in enumerate(sketch["compactors"]) for value in compactor)
+    total = sum(weight for value, weight in items)
+
+    results = []
+    for quantile in quantiles:
+        target = quantile * total
+        rank = 0
+        result = items[-1][0]
+        for value, weight in items:
+            rank += weight
+            if rank >= target:
+                result = value
+                break
+        results.append(result)
+    return results
+
+
+# Create an empty aggregate of the statistics and SMART fields of many dumps
+#
+# Input:
+#      k : accuracy parameter of the sketches (see new_sketch)
+#
+# Output: dictionary of the aggregate that can be saved as JSON of the form
+#
+#     {'version'        : aggregate_state_version,
+#      'k'              : k,
+#      'dumps'          : number of dumps aggregated,
+#      'statistics'     : {<identifier> : {'description' : description, 'sketch' : sketch}, ...},
+#      'smart'          : {<field name> : sketch, ...},      # SMART / Health Information (02h)
+#      'smart extended' : {<field name> : sketch, ...}}      # SMART / Health Information Extended (C0h)
+def new_aggregate(k):
+    return {"version": aggregate_state_version, "k": k, "dumps": 0, "statistics": {}, "smart": {}, "smart extended": {}}
+
+
+# Add the statistics and SMART fields of a dump to an aggregate
+#
+# Input:
+#      aggregate : aggregate (see new_aggregate)
+#      record    : record of the dump (see get_telemetry_record)
+#
+# Output: None
+def add_aggregate_record(aggregate, record):
+    aggregate["dumps"] += 1
+
+    for key in ("smart", "smart extended"):
+        sketches = aggregate[key]
+        for name, value in record[key].items():
+            if name not in sketches:
+                sketches[name] = new_sketch(aggregate["k"])
+            add_sketch_value(sketches[name], value)
+
+    statistics = aggregate["statistics"]
+    for stat in record["statistics"]:
+        identifier = str(stat["identifier"])
+        if identifier not in statistics:
+            statistics[identifier] = {"description": stat["description"], "sketch": new_sketch(aggregate["k"])}
+        add_sketch_value(statistics[identifier]["sketch"], stat["value"])
+
+
+# Merge an aggregate into another aggregate
+#
+# Input:
+#      aggregate : aggregate that is updated (see new_aggregate)
+#      other     : aggregate merged into aggregate
+#
+# Output: None
+def merge_aggregates(aggregate, other):
+    if other.get("version") != aggregate_state_version:
+        sys.exit(f"Aggregate state version {other.get('version')} is not supported.")
+
+    aggregate["dumps"] += other["dumps"]
+
+    for key in ("smart", "smart extended"):
+        for name, sketch in other[key].items():
+            aggregate[key].setdefault(name, new_sketch(aggregate["k"]))
+            merge_sketches(aggregate[key][name], sketch)
+
+    for identifier, stat in other["statistics"].items():
+        aggregate["statistics"].setdefault(identifier, {"description": stat["description"], "sketch": new_sketch(aggregate["k"])})
+        merge_sketches(aggregate["statistics"][identifier]["sketch"], stat["sketch"])
+
+
+# Find the dumps in a list of files and directories
+#
+# Input:
+#      paths   : list of filenames and directory names. Directories are walked recursively.
+#      pattern : filename pattern of the dumps in the directories
+#      exclude : set of absolute filenames to skip, such as the OCP Strings log page
+#
+# Output: Generator of the dump filenames
+def find_dumps(paths, pattern, exclude):
+    for path in paths:
+        if not os.path.isdir(path):
+            yield path
+            continue
+
+        for directory, directories, files in os.walk(path):
+            directories.sort()
+            for filename in sorted(fnmatch.filter(files, pattern)):
+                filename = os.path.join(directory, filename)
+                if os.path.abspath(filename) not in exclude:
+                    yield filename
+
+
+# Print the summary of an aggregate
+#
+# Input:
+#      aggregate   : aggregate (see new_aggregate)
+#      percentiles : list of percentiles to print
+#
+# Output: None
+def print_aggregate(aggregate, percentiles):
+    quantiles = [percentile / 100 for percentile in percentiles]
+    columns = ["Count", "Min", "Max", "Mean"] + [f"p{percentile:g}" for percentile in percentiles]
+
+    def print_row(name, sketch):
+        values = [sketch["count"], sketch["min"], sketch["max"], sketch["sum"] / sketch["count"]]
+        values += get_sketch_quantiles(sketch, quantiles)
+        text = "".join(f"{value:>14}" if isinstance(value, int) and abs(value) < 10**13 else f"{value:>14.6g}" for value in values)
+        print(f"  {name[:48]:<48}{text}")
+
+    print(f"Dumps aggregated : {aggregate['dumps']}")
+
+    titles = (("smart", "SMART / Health Information (02h)"), ("smart extended", "SMART / Health Information Extended (C0h)"))
+    for key, title in titles:
+        print()
+        print(f"{title:<50}" + "".join(f"{column:>14}" for column in columns))
+        for name, sketch in aggregate[key].items():
+            print_row(name, sketch)
+
+    print()
+    print(f"{'Statistics':<50}" + "".join(f"{column:>14}" for column in columns))
+    for identifier in sorted(aggregate["statistics"], key=int):
+        stat = aggregate["statistics"][identifier]
+        print_row(f"0x{int(identifier):04X} {stat['description']}", stat["sketch"])
+
+
+# Parse the input parameters of the aggregate command
+#
+# Input:
+#      argv : list of commandline arguments after the command
+#
+# Output: Input parameters
+def parse_aggregate_inputs(argv):
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="ocp_dump_nvme_telemtry.py aggregate",
+        description="Aggregate the statistics and SMART fields of many dumps into count, min, max, mean and approximate "
+        "percentiles per statistic identifier and per SMART field. The percentiles come from mergeable KLL sketches so "
+        "memory does not grow with the number of dumps, and the state saved with --state by separate runs can be "
+        "combined with --merge.",
+    )
+
+    parser.add_argument(
+        "paths",
+        type=str,
+        nargs="*",
+        metavar="<path>",
+        help="Telemetry log page or JSON record filenames, or directories that are searched recursively.",
+    )
+    parser.add_argument(
+        "-s",
+        "--string",
+        type=str,
+        dest="string",
+        required=False,
+        metavar="<filename>",
+        help="OCP Strings log page (C9h) filename used to decode the Telemetry log pages.",
+    )
+    parser.add_argument(
+        "--pattern",
+        type=str,
+        dest="pattern",
+        required=False,
+        metavar="<pattern>",
+        default="*.bin",
+        help="Filename pattern of the dumps in the directories.",
+    )
+    parser.add_argument(
+        "-m",
+        "--merge",
+        type=str,
+        nargs="+",
+        dest="merge",
+        required=False,
+        default=[],
+        metavar="<filename>",
+        help="Aggregate state files saved by other runs to merge.",
+    )
+    parser.add_argument("--state", type=str, dest="state", required=False, metavar="<filename>", help="Save the aggregate state as JSON.")
+    parser.add_argument(
+        "-p",
+        "--percentiles",
+        type=float,
+        nargs="+",
+        dest="percentiles",
+        required=False,
+        default=[50, 90, 99],
+        metavar="<value>",
+        help="Percentiles to print.",
+    )
+    parser.add_argument(
+        "-k",
+        type=int,
+        dest="k",
+        required=False,
+        default=200,
+        metavar="<value>",
+        help="Accuracy of the sketches. The rank error is about 1.7 / k.",
+    )
+
+    return parser.parse_args(argv)
+
+
+# Aggregate the statistics and SMART fields of many dumps
+#
+# Input:
+#      argv : list of commandline arguments after the command
+#
+# Output: None
+def aggregate_command(argv):
+    args = parse_aggregate_inputs(argv)
+
+    if (len(args.paths) == 0) and (len(args.merge) == 0):
+        sys.exit("Specify the dumps to aggregate or the aggregate states to merge.")
+    if args.k < 8:
+        sys.exit("The k value must be at least 8.")
+    if any((percentile < 0) or (percentile > 100) for percentile in args.percentiles):
+        sys.exit("The percentiles must be between 0 and 100.")
+
+    aggregate = new_aggregate(args.k)
+    for state_file in args.merge:
+        with open(state_file) as f:
+            merge_aggregates(aggregate, json.load(f))
+
+    exclude = set() if args.string is None else {os.path.abspath(args.string)}
+    failures = 0
+    for filename in find_dumps(args.paths, args.pattern, exclude):
+        (filename, record, error) = get_dump_record((filename, args.string, False))
+        if record is None:
+            print(f"{filename}: {error}", file=sys.stderr)
+            failures += 1
+            continue
+        add_aggregate_record(aggregate, record)
+
+    if args.state != None:
+        with open(args.state, "w") as f:
+            json.dump(aggregate, f)
+
+    print_aggregate(aggregate, args.percentiles)
+
+    if failures > 0:
+        sys.exit(f"{failures} dumps failed to aggregate.")
+
+
+# Offset and size of the SMART / Health Information (02h) and SMART / Health Information Extended (C0h) log pages in a
+# Telemetry log page. They are at offsets 512 and 1024 of Data Area 1, which starts after the 512 byte header.
+smart_scan_offset = 512 + 512
+smart_scan_size = 1024
+
+# Output formats of the smart-scan command
+smart_scan_formats = ("csv", "parquet", "arrow")
+
+
+# Import numpy for the smart-scan command
+#
+# Input:
+#      None
+#
+# Output: True if numpy is installed
+def import_numpy():
+    global numpy
+
+    try:
+        import numpy as module
+    except ImportError:
+        return False
+
+    numpy = module
+    return True
+
+
+# Get the fields of the SMART log pages scanned by the smart-scan command
+#
+# Input:
+#      None
+#
+# Output: list of (field name, byte offset in the 1024 bytes of the two pages, byte width)
+def get_smart_scan_fields():
+    fields = [(name, offset, width) for name, offset, width, _ in smart_fields]
+    fields += [(name, 512 + offset, width) for name, offset, width, _ in smart_extended_fields]
+    return fields
+
+
+# Get the NumPy structured dtype of the two SMART log pages. Each field is a little endian unsigned integer except the
+# 16 byte fields, which are a (low, high) pair of 64 bit integers, and the 6 and 7 byte fields, which are bytes.
+#
+# Input:
+#      fields : fields of the two pages (see get_smart_scan_fields)
+#
+# Output: numpy.dtype with an itemsize of smart_scan_size
+def get_smart_scan_dtype(fields):
+    formats = []
+    for name, offset, width in fields:
+        if width in (1, 2, 4, 8):
+            formats.append(f"<u{width}")
+        elif width == 16:
+            formats.append("(2,)<u8")
+        else:
+            formats.append(f"({width},)u1")
+
+    return numpy.dtype(
+        {
+            "names": [name for name, _, _ in fields],
+            "formats": formats,
+            "offsets": [offset for _, offset, _ in fields],
+            "itemsize": smart_scan_size,
+        }
+    )
+
+
+# Read the two SMART log pages of each dump into one buffer
+#
+# Input:
+#      filenames : iterable of Telemetry log page filenames, which may be compressed (see open_log)
+#
+# Output: (list of the filenames read, bytearray of smart_scan_size bytes for each filename read, number of failures)
+def read_smart_pages(filenames):
+    names = []
+    pages = bytearray()
+    failures = 0
+    for filename in filenames:
+        try:
+            with open_log(filename) as f:
+                data = read_stream(f, smart_scan_offset + smart_scan_size)
+        except OSError as error:
+            print(f"{filename}: {error}", file=sys.stderr)
+            failures += 1
+            continue
+
+        if (len(data) < 512) or (data[0] not in (7, 8)):
+            print(f"{filename}: Not a Telemetry log page.", file=sys.stderr)
+            failures += 1
+        elif (len(data) < smart_scan_offset + smart_scan_size) or (int.from_bytes(data[8:10], "little") < 3):
+            print(f"{filename}: Data Area 1 does not contain the SMART log pages.", file=sys.stderr)
+            failures += 1
+        else:
+            names.append(filename)
+            pages += data[smart_scan_offset:]
+    return (names, pages, failures)
+
+
+# Decode the SMART log pages of all of the dumps at once with a NumPy structured dtype
+#
+# Input:
+#      pages        : bytearray of the SMART log pages (see read_smart_pages)
+#      fields       : fields to decode (see get_smart_scan_fields)
+#      critical     : True to keep only the dumps with a Critical Warning
+#      percent_used : minimum Percent Used of the dumps kept or None
+#
+# Output: (NumPy array of the indexes of the dumps kept, dictionary of {<field name> : NumPy array of the values}).
+#         The values of the 16 byte fields are Python integers.
+def decode_smart_pages(pages, fields, critical, percent_used):
+    records = numpy.frombuffer(pages, dtype=get_smart_scan_dtype(get_smart_scan_fields()))
+
+    keep = numpy.ones(len(records), dtype=bool)
+    if critical:
+        keep &= records["Critical Warning"] != 0
+    if percent_used != None:
+        keep &= records["Percent Used"] >= percent_used
+    indexes = numpy.flatnonzero(keep)
+    records = records[indexes]
+
+    columns = {}
+    for name, _, width in fields:
+        values = records[name]
+        if width == 16:
+            values = (values[:, 1].astype(object) << 64) | values[:, 0].astype(object)
+        elif width not in (1, 2, 4, 8):
+            values = values.astype(numpy.uint64) @ (numpy.uint64(1) << numpy.arange(0, width * 8, 8, dtype=numpy.uint64))
+        columns[name] = values
+    return (indexes, columns)
+
+
+# Decode the SMART log pages one dump at a time, used when numpy is not installed
+#
+# Input:
+#      See decode_smart_pages
+#
+# Output: See decode_smart_pages, with lists instead of NumPy arrays
+def decode_smart_pages_slowly(pages, fields, critical, percent_used):
+    table = [(name, offset, width, False) for name, offset, width in get_smart_scan_fields()]
+    indexes = []
+    columns = {name: [] for name, _, _ in fields}
+    for index in range(len(pages) // smart_scan_size):
+        record = get_smart_record(pages[index * smart_scan_size : (index + 1) * smart_scan_size], table)
+        if critical and (record["Critical Warning"] == 0):
+            continue
+        if (percent_used != None) and (record["Percent Used"] < percent_used):
+            continue
+        indexes.append(index)
+        for name, values in columns.items():
+            values.append(record[name])
+    return (indexes, columns)
+
+
+# Write the table of the smart-scan command
+#
+# Input:
+#      f       : text file object for the CSV format
+#      output  : output filename for the Parquet and Arrow formats
+#      format  : "csv", "parquet" or "arrow"
+#      columns : dictionary of {<column name> : list or NumPy array of the values}
+#      fields  : fields of the two pages (see get_smart_scan_fields)
+#
+# Output: None
+def write_smart_scan(f, output, format, columns, fields):
+    if format == "csv":
+        import csv
+
+        writer = csv.writer(f)
+        writer.writerow(columns.keys())
+        writer.writerows(zip(*[values.tolist() if hasattr(values, "tolist") else values for values in columns.values()]))
+        return
+
+    # The 16 byte fields do not fit in an Arrow integer so they are written as text like the export command values
+    widths = {name: width for name, _, width in fields}
+    arrays = []
+    for name, values in columns.items():
+        if name not in widths:
+            arrays.append(pyarrow.array(values, type=pyarrow.string()))
+        elif widths[name] == 16:
+            arrays.append(pyarrow.array([str(value) for value in values], type=pyarrow.string()))
+        else:
+            types = {1: pyarrow.uint8(), 2: pyarrow.uint16(), 4: pyarrow.uint32()}
+            arrays.append(pyarrow.array(values, type=types.get(widths[name], pyarrow.uint64())))
+    table = pyarrow.Table.from_arrays(arrays, names=list(columns.keys()))
+
+    if format == "parquet":
+        pyarrow.parquet.write_table(table, output)
+    else:
+        with pyarrow.OSFile(output, "wb") as sink:
+            with pyarrow.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+
+
+# Parse the input parameters of the smart-scan command
+#
+# Input:
+#      argv : list of commandline arguments after the command
+#
+# Output: Input parameters
+def parse_smart_scan_inputs(argv):
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="ocp_dump_nvme_telemtry.py smart-scan",
+        description="Read only the SMART / Health Information (02h) and SMART / Health Information Extended (C0h) log "
+        "pages of many dumps and write their fields as one table with a row for each dump. The pages of all of the "
+        "dumps are decoded at once with NumPy when it is installed. The OCP Strings log page is not needed.",
+    )
+
+    parser.add_argument(
+        "paths",
+        type=str,
+        nargs="+",
+        metavar="<path>",
+        help="Telemetry log page filenames, or directories that are searched recursively.",
+    )
+    parser.add_argument(
+        "--pattern",
+        type=str,
+        dest="pattern",
+        required=False,
+        metavar="<pattern>",
+        default="*.bin",
+        help="Filename pattern of the dumps in the directories.",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=str,
+        dest="output",
+        required=False,
+        metavar="<filename>",
+        help="Output filename. The format is selected by the extension (.parquet, .arrow or .csv) unless --format is "
+        + "specified. If not specified then CSV is written to stdout.",
+    )
+    parser.add_argument("-f", "--format", type=str, dest="format", required=False, choices=smart_scan_formats, help="Output format.")
+    parser.add_argument(
+        "--fields",
+        type=str,
+        nargs="+",
+        dest="fields",
+        required=False,
+        metavar="<name>",
+        help="SMART fields to write, by their names in the record command output. All of the fields are written if not "
+        + "specified.",
+    )
+    parser.add_argument(
+        "--drive",
+        type=str,
+        dest="drive",
+        required=False,
+        metavar="<name>",
+        help="Drive name of the dumps. If not specified then the name of the directory containing each dump is used.",
+    )
+    parser.add_argument(
+        "--critical-warning",
+        action="store_true",
+        dest="critical",
+        required=False,
+        help="Only write the dumps with a non-zero Critical Warning.",
+    )
+    parser.add_argument(
+        "--percent-used",
+        type=int,
+        dest="percent_used",
+        required=False,
+        metavar="<value>",
+        help="Only write the dumps with a Percent Used of at least this value.",
+    )
+
+    return parser.parse_args(argv)
+
+
+# Scan the SMART log pages of many dumps into one table
+#
+# Input:
+#      argv : list of commandline arguments after the command
+#
+# Output: None
+def smart_scan_command(argv):
+    args = parse_smart_scan_inputs(argv)
+
+    fields = get_smart_scan_fields()
+    if args.fields != None:
+        names = {name: (name, offset, width) for name, offset, width in fields}
+        for name in args.fields:
+            if name not in names:
+                sys.exit(f"{name} is not a SMART field.")
+        fields = [names[name] for name in args.fields]
+
+    format = args.format
+    if format is None:
+        format = "csv" if args.output is None else export_extensions.get(os.path.splitext(args.output)[1].lower(), "csv")
+    if (format != "csv") and (args.output is None):
+        sys.exit(f"The {format} format needs an output filename.")
+    if (format != "csv") and not import_pyarrow():
+        sys.exit(f"pyarrow is not installed, {format} can not be written.")
+
+    (filenames, pages, failures) = read_smart_pages(find_dumps(args.paths, args.pattern, set()))
+    scanned = len(filenames) + failures
+
+    if import_numpy():
+        (indexes, values) = decode_smart_pages(pages, fields, args.critical, args.percent_used)
+    else:
+        (indexes, values) = decode_smart_pages_slowly(pages, fields, args.critical, args.percent_used)
+
+    filenames = [filenames[index] for index in indexes]
+    columns = {"drive": [get_drive_name(filename, args.drive) for filename in filenames], "filename": filenames}
+    columns.update(values)
+
+    if args.output is None:
+        write_smart_scan(sys.stdout, None, format, columns, fields)
+    else:
+        with open(args.output, "w", newline="") if format == "csv" else nullcontext() as f:
+            write_smart_scan(f, args.output, format, columns, fields)
+        print(f"Scanned {scanned} dumps and wrote {len(filenames)} rows to {args.output}.")
+
+    if failures > 0:
+        sys.exit(f"{failures} dumps failed to scan.")
+
+
+# Get the events of a FIFO with the estimated time of each event. The time of an event is the time of the nearest
+# Timestamp event before it in the FIFO. Events before the first Timestamp event are given its time and the events of a
+# FIFO with no Timestamp event are given the Data Area 1 timestamp. Timestamp is Power on Hours events are not in
+# milliseconds so they do not set the time (see timestamp_ms_ids).
+#
+# Input:
+#      telemetry : bytearray or memoryview of the Telemetry log page
+#      fifo_num  : FIFO number
+#      data_area : data area of the FIFO
+#      start     : offset of the FIFO in the Telemetry log page
+#      end       : offset of the end of the FIFO in the Telemetry log page
+#      dump_time : Data Area 1 timestamp in milliseconds
+#
+# Output: A generator of a tuple for each event, in FIFO order
+#
+#     (time in milliseconds, fifo #, event number, data area, offset in the Telemetry log page, class type, identifier,
+#      size of the descriptor in bytes, source of the time: "event", "next" or "dump")
+def get_fifo_timeline(telemetry, fifo_num, data_area, start, end, dump_time):
+    data = telemetry[start:end]
+
+    # Find the first Timestamp event without keeping the events before it
+    time = dump_time
+    source = "dump"
+    for offset, class_type, identifier, dw_size, size in get_fifo_events(data):
+        if (class_type == 0x01) and (identifier in timestamp_ms_ids):
+            time = int.from_bytes(data[offset + 4 : offset + 10], "little")
+            source = "next"
+            break
+
+    for event_num, (offset, class_type, identifier, dw_size, size) in enumerate(get_fifo_events(data), 1):
+        if (class_type == 0x01) and (identifier in timestamp_ms_ids):
+            time = int.from_bytes(data[offset + 4 : offset + 10], "little")
+            source = "event"
+        yield (time, fifo_num, event_num, data_area, start + offset, class_type, identifier, size, source)
+
+
+# Merge the events of all of the FIFOs of a Telemetry log page into one stream ordered by estimated time. Only one
+# event of each FIFO is held at a time. The events of a FIFO whose Timestamp events go back in time are kept in FIFO
+# order.
+#
+# Input:
+#      telemetry : bytearray or memoryview of the Telemetry log page
+#
+# Output: A generator of the events of all of the FIFOs (see get_fifo_timeline) ordered by time, FIFO and event number
+def get_timeline(telemetry):
+    layout = get_telemetry_layout(telemetry)
+    da1 = layout["data areas"][1][0]
+    dump_time = int.from_bytes(telemetry[da1 + 8 : da1 + 14], "little")
+
+    fifos = [
+        get_fifo_timeline(telemetry, fifo_num, data_area, start, min(end, len(telemetry)), dump_time)
+        for fifo_num, (data_area, start, end) in layout["fifos"].items()
+    ]
+    return heapq.merge(*fifos)
+
+
+# Get the name of the class type of a debug event
+#
+# Input:
+#      class_type : class type of the debug event
+#
+# Output: string
+def get_class_name(class_type):
+    if class_type < len(class_type_str):
+        return class_type_str[class_type]
+    elif class_type >= 0x80:
+        return "Vendor Unique"
+    return "Reserved"
+
+
+# OCP defined identifier names of each debug event class type
+event_identifier_names = {
+    0x01: timestamp_ocp_id,
+    0x02: pcie_ocp_id,
+    0x03: nvme_ocp,
+    0x04: reset_ocp,
+    0x05: boot_ocp,
+    0x06: fa_assert_ocp,
+    0x07: temp_ocp,
+    0x08: media_ocp,
+    0x09: media_wear_ocp,
+}
+
+# Debug events paired into duration slices in a Chrome trace. A slice is ended by its end event in the same FIFO.
+#
+#     (slice name, begin class type, begin identifiers or None for any identifier, end class type, end identifier)
+# fmt: off
+trace_slices = (
+    ("Reset to Boot Complete", 0x04, None,      0x05, 0x0000),
+    ("FTL Rebuild",            0x05, (0x0002,), 0x05, 0x0003),
+)
+# fmt: on
+
+
+# Get the name of a debug event from its class type and identifier
+#
+# Input:
+#      class_type : class type of the debug event
+#      identifier : identifier of the debug event
+#
+# Output: string
+@lru_cache(maxsize=4096)
+def get_event_name(class_type, identifier):
+    names = event_identifier_names.get(class_type, [])
+    if identifier < len(names):
+        return names[identifier]
+    return f"{get_class_name(class_type)} 0x{identifier:x}"
+
+
+# End an open duration slice of a Chrome trace track and the slices opened after it
+#
+# Input:
+#      f          : text file the trace is written to
+#      stack      : list of the names of the open slices of the track from the outermost
+#      slice_name : name of the slice to end
+#      fifo_num   : FIFO number of the track
+#      ts         : time of the end in microseconds
+#
+# Output: None
+def end_trace_slice(f, stack, slice_name, fifo_num, ts):
+    while True:
+        name = stack.pop()
+        f.write(f',\n{{"name":{json.dumps(name)},"ph":"E","pid":1,"tid":{fifo_num},"ts":{ts}}}')
+        if name == slice_name:
+            break
+
+
+# Write the merged timeline of a Telemetry log page in the Chrome Trace Event Format, which can be loaded in Perfetto
+# and chrome://tracing. Each FIFO is a track of instant events and the events of trace_slices are also paired into
+# duration slices. A slice that is not ended before the end of its FIFO is ended at the last event of the FIFO so
+# that every B event has its E event. The trace is written as the timeline is merged so that it is never held in
+# memory.
+#
+# Input:
+#      f         : text file to write the trace to
+#      telemetry : bytearray or memoryview of the Telemetry log page
+#      name      : name of the trace process, e.g. the Telemetry log page filename
+#
+# Output: None
+def write_chrome_trace(f, telemetry, name):
+    f.write('{"displayTimeUnit":"ms","traceEvents":[\n')
+    f.write(json.dumps({"name": "process_name", "ph": "M", "pid": 1, "tid": 0, "args": {"name": name}}))
+
+    for fifo_num, (data_area, start, end) in get_telemetry_layout(telemetry)["fifos"].items():
+        track = {"name": f"Data Area {data_area} FIFO {fifo_num}"}
+        f.write(",\n" + json.dumps({"name": "thread_name", "ph": "M", "pid": 1, "tid": fifo_num, "args": track}))
+        f.write(",\n" + json.dumps({"name": "thread_sort_index", "ph": "M", "pid": 1, "tid": fifo_num, "args": {"sort_index": fifo_num}}))
+
+    # The names of the open slices of each FIFO from the outermost and the time of the last event of each FIFO
+    open_slices = {}
+    last_ts = {}
+
+    for time, fifo_num, event_num, data_area, offset, class_type, identifier, size, source in get_timeline(telemetry):
+        ts = time * 1000
+        stack = open_slices.setdefault(fifo_num, [])
+        last_ts[fifo_num] = ts
+
+        # Slices ended by this event, closing the slices opened after them first
+        for slice_name, begin_class, begin_ids, end_class, end_id in trace_slices:
+            if (class_type == end_class) and (identifier == end_id) and (slice_name in stack):
+                end_trace_slice(f, stack, slice_name, fifo_num, ts)
+
+        f.write(
+            f',\n{{"name":{json.dumps(get_event_name(class_type, identifier))},"cat":{json.dumps(get_class_name(class_type))},'
+            f'"ph":"i","s":"t","pid":1,"tid":{fifo_num},"ts":{ts},"args":{{"event":{event_num},"offset":{offset},'
+            f'"identifier":{identifier},"time source":"{source}","data":"{telemetry[offset : offset + size].hex()}"}}}}'
+        )
+
+        # Slices begun by this event. A slice begun again ends the open one.
+        for slice_name, begin_class, begin_ids, end_class, end_id in trace_slices:
+            if (class_type == begin_class) and ((begin_ids is None) or (identifier in begin_ids)):
+                if slice_name in stack:
+                    end_trace_slice(f, stack, slice_name, fifo_num, ts)
+                stack.append(slice_name)
+                f.write(f',\n{{"name":{json.dumps(slice_name)},"ph":"B","pid":1,"tid":{fifo_num},"ts":{ts}}}')
+
+    # Slices still open at the end of their FIFO
+    for fifo_num, stack in open_slices.items():
+        if len(stack) > 0:
+            end_trace_slice(f, stack, stack[0], fifo_num, last_ts[fifo_num])
+
+    f.write("\n]}\n")
+
+
+# Parse the input parameters of the timeline command
+#
+# Input:
+#      argv : list of commandline arguments after the command
+#
+# Output: Input parameters
+def parse_timeline_inputs(argv):
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="ocp_dump_nvme_telemtry.py timeline",
+        description="Print the events of all of the FIFOs of a Telemetry log page as one timeline. Each event is given "
+        "the time of the nearest Timestamp event before it in its FIFO (event), of the first Timestamp event of its FIFO "
+        "(next) or, for a FIFO without Timestamp events, the Data Area 1 timestamp (dump).",
+    )
+
+    parser.add_argument(
+        "-t",
+        "--telemetry",
+        type=str,
+        dest="telemetry",
+        required=True,
+        metavar="<filename>",
+        help="Telemetry log page filename.",
+    )
+    parser.add_argument(
+        "-f",
+        "--format",
+        type=str,
+        dest="format",
+        required=False,
+        choices=["text", "ndjson", "chrome"],
+        default="text",
+        help="Output format. ndjson prints one JSON line for each event and chrome writes a Chrome Trace Event Format "
+        + "JSON trace, with a track for each FIFO, that can be loaded in Perfetto.",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=str,
+        dest="output",
+        required=False,
+        metavar="<filename>",
+        help="Output filename. If not specified then the timeline is printed.",
+    )
+
+    return parser.parse_args(argv)
+
+
+# Write the merged timeline of the FIFO events of a Telemetry log page
+#
+# Input:
+#      argv : list of commandline arguments after the command
+#
+# Output: None
+def timeline_command(argv):
+    args = parse_timeline_inputs(argv)
+
+    # FIFOs are only in Data Areas 1 and 2
+    telemetry = memoryview(read_log(args.telemetry, 2))
+    if len(telemetry) < 512 + 512:
+        sys.exit(f"Telemetry log is smaller than the header and Data Area 1 header: {len(telemetry)}")
+
+    f = open(args.output, "w") if args.output != None else sys.stdout
+    try:
+        if args.format == "chrome":
+            write_chrome_trace(f, telemetry, os.path.basename(args.telemetry))
+            return
+
+        if args.format == "text":
+            f.write(f"{'Time (ms)':>16}  {'Source':6}  {'Data Area':9}  {'FIFO':4}  {'Event':>6}  {'Class':16}  {'Identifier':10}  Data\n")
+        for time, fifo_num, event_num, data_area, offset, class_type, identifier, size, source in get_timeline(telemetry):
+            data = telemetry[offset : offset + size].hex()
+            if args.format == "text":
+                f.write(
+                    f"{time:>16}  {source:6}  {data_area:>9}  {fifo_num:>4}  {event_num:>6}  {get_class_name(class_type):16}  "
+                    f"0x{identifier:<8x}  {data}\n"
+                )
+            else:
+                event = {
+                    "time": time,
+                    "time source": source,
+                    "data area": data_area,
+                    "fifo": fifo_num,
+                    "event": event_num,
+                    "offset": offset,
+                    "class": class_type,
+                    "identifier": identifier,
+                    "data": data,
+                }
+                f.write(json.dumps(event, separators=(",", ":")) + "\n")
+    finally:
+        if f is not sys.stdout:
+            f.close()
+
+
+# Commands selected by the first commandline argument. Without a command the Telemetry log page is parsed and printed.
+commands = {
+    "aggregate": aggregate_command,
+    "diff": diff_command,
+    "export": export_command,
+    "ingest": ingest_command,
+    "record": record_command,
+    "smart-scan": smart_scan_command,
+    "timeline": timeline_command,
+}
+
+
+# Version of the format of the parsed result cache entries
+cache_format_version = 1
+
+
+# Get the part of the parsed result cache key that depends on how the log pages are decoded: the script version, the
+# cache format, the loaded VU schemas and the installed vendor unique event decoder plugins
+#
+# Input:
+#      None
+#
+# Output: bytes
+def get_cache_salt():
+    import importlib.metadata
+
+    load_vu_event_plugins()
+
+    parts = [f"version {version}", f"cache format {cache_format_version}"]
+    parts += [f"schema {schema['sha256']}" for schema in vu_schemas]
+    for entry_point in importlib.metadata.entry_points(group=vu_event_entry_point_group):
+        plugin_version = entry_point.dist.version if entry_point.dist != None else ""
+        parts.append(f"plugin {entry_point.name} {entry_point.value} {plugin_version}")
+    return "\n".join(parts).encode()
+
+
+# Open the parsed result cache
+#
+# Input:
+#      directory : cache directory, created if needed
+#      size      : maximum size of the cache in bytes
+#
+# Output: dictionary of the cache of the form {'directory' : directory, 'size' : size, 'salt' : get_cache_salt()}
+def open_cache(directory, size):
+    os.makedirs(directory, exist_ok=True)
+    return {"directory": directory, "size": size, "salt": get_cache_salt()}
+
+
+# Get the filename of the parsed result cache entry of a dump. The key is the SHA-256 of the Telemetry log page, the
+# OCP Strings log page and the cache salt.
+#
+# Input:
+#      cache         : parsed result cache (see open_cache)
+#      telemetry_log  : bytes of the Telemetry log page
+#      string_log     : bytes of the OCP Strings log page
+#      last_data_area : None if the whole log page was read or the last data area read (see read_log)
+#
+# Output: filename of the cache entry
+def get_cache_path(cache, telemetry_log, string_log, last_data_area=None):
+    digest = hashlib.sha256()
+    parts = (cache["salt"], telemetry_log, string_log)
+    if last_data_area != None:
+        parts += (f"areas {last_data_area}".encode(),)
+    for part in parts:
+        digest.update(len(part).to_bytes(8, "little"))
+        digest.update(part)
+    key = digest.hexdigest()
+    return os.path.join(cache["directory"], key[:2], key + ".bin")
+
+
+# Read a parsed result cache entry, marking it as recently used
+#
+# Input:
+#      path : filename of the cache entry (see get_cache_path)
+#
+# Output: dictionary of the entry (see get_dump_entry) or None if the entry does not exist or is not valid
+def read_cache_entry(path):
+    try:
+        with open(path, mode="rb") as f:
+            entry = marshal.loads(zlib.decompress(f.read()))
+        os.utime(path)
+    except (OSError, ValueError, EOFError, TypeError, zlib.error):
+        return None
+
+    if (not isinstance(entry, dict)) or (entry.get("cache format") != cache_format_version):
+        return None
+    return entry
+
+
+# Write a parsed result cache entry
+#
+# Input:
+#      path  : filename of the cache entry (see get_cache_path)
+#      entry : dictionary of the entry (see get_dump_entry)
+#
+# Output: None
+def write_cache_entry(path, entry):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    # Write to a temporary file first so a reader never sees a partial entry
+    temporary = f"{path}.{os.getpid()}.tmp"
+    with open(temporary, mode="wb") as f:
+        f.write(zlib.compress(marshal.dumps(entry), 1))
+    os.replace(temporary, path)
+
+
+# Remove the least recently used parsed result cache entries until the cache fits in its size
+#
+# Input:
+#      cache : parsed result cache (see open_cache)
+#
+# Output: None
+def prune_cache(cache):
+    entries = []
+    total = 0
+    for directory in os.scandir(cache["directory"]):
+        if not directory.is_dir():
+            continue
+        for entry in os.scandir(directory.path):
+            if entry.name.endswith(".bin"):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total += stat.st_size
+
+    entries.sort()
+    for mtime, size, path in entries:
+        if total <= cache["size"]:
+            break
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        total -= size
+
+
+# Decoded sections of the previous dump of the drive being parsed, or None when sections are not reused (see
+# load_section_state). A section is keyed on the hash of its context, name and bytes. The state only holds the keys of
+# the sections. The printed text and result of each section are kept in a file of the sections directory named by its
+# key, which is written when the section is first decoded and read when it is reused.
+#
+#     {'context'   : string of what the decoding depends on besides the section bytes,
+#      'directory' : directory of the decoded sections,
+#      'previous'  : {<section name> : key},    # from the previous dump
+#      'sections'  : {<section name> : key},    # from this dump
+#      'new'       : {<key> : (printed text, result)}}    # decoded sections not in the sections directory
+section_state = None
+
+
+# Call the function decoding a section of a dump or, if the section bytes are the same as in the previous dump of the
+# drive, print the text and return the result of the previous decoding
+#
+# Input:
+#      name     : string naming the section and how it is decoded
+#      data     : bytes the function result and printed text depend on
+#      function : function decoding the section
+#      args     : arguments of the function
+#
+# Output: The result of the function
+def reuse_section(name, data, function, *args):
+    if section_state is None:
+        return function(*args)
+
+    hash = hashlib.blake2b(f"{section_state['context']}\0{name}\0".encode(), digest_size=16)
+    hash.update(data)
+    key = hash.hexdigest()
+
+    section = None
+    if section_state["previous"].get(name) == key:
+        section = read_section(key)
+
+    if section != None:
+        (text, result) = section
+        sys.stdout.write(text)
+        inc_counter("ocp_telemetry_sections", (("result", "reused"),))
+    else:
+        # The text up to a validation error is still printed
+        buffer = io.StringIO()
+        try:
+            with redirect_stdout(buffer):
+                result = function(*args)
+        finally:
+            text = buffer.getvalue()
+            sys.stdout.write(text)
+        inc_counter("ocp_telemetry_sections", (("result", "decoded"),))
+        section_state["new"][key] = (text, result)
+
+    section_state["sections"][name] = key
+    return result
+
+
+# Read a decoded section of the previous dump of the drive
+#
+# Input:
+#      key : key of the section (see reuse_section)
+#
+# Output: (printed text, result) or None if the section can not be read
+def read_section(key):
+    try:
+        with open(os.path.join(section_state["directory"], key), mode="rb") as f:
+            section = marshal.loads(zlib.decompress(f.read()))
+    except (OSError, ValueError, EOFError, TypeError, zlib.error):
+        return None
+    return section if isinstance(section, tuple) and (len(section) == 2) else None
+
+
+# Get the filename of the decoded sections of a drive. Host-Initiated and Controller-Initiated log pages are kept
+# separately.
+#
+# Input:
+#      directory     : drive state directory
+#      drive         : drive name
+#      telemetry_log : bytes of the Telemetry log page
+#
+# Output: filename
+def get_section_state_path(directory, drive, telemetry_log):
+    log_id = telemetry_log[0] if len(telemetry_log) > 0 else 0
+    return os.path.join(directory, f"{re.sub(r'[^A-Za-z0-9_.-]', '_', drive)}-{log_id}.state")
+
+
+# Start reusing the decoded sections of the previous dump of a drive
+#
+# Input:
+#      path    : filename of the decoded sections (see get_section_state_path)
+#      context : string of what the decoding depends on besides the section bytes
+#
+# Output: None
+def load_section_state(path, context):
+    global section_state
+
+    previous = {}
+    try:
+        with open(path) as f:
+            state = json.load(f)
+        if isinstance(state, dict) and (state.get("context") == context) and isinstance(state.get("sections"), dict):
+            previous = state["sections"]
+    except (OSError, ValueError):
+        pass
+
+    directory = f"{os.path.splitext(path)[0]}.sections"
+    section_state = {"context": context, "directory": directory, "previous": previous, "sections": {}, "new": {}}
+
+
+# Save the decoded sections of the dump for the next dump of the drive and stop reusing sections. Only the sections
+# that changed are written, compressed like the parsed result cache entries, and the sections of the previous dump
+# that are not in this dump are removed. Nothing is saved when no section was parsed, e.g. for a parsed result cache
+# hit.
+#
+# Input:
+#      path : filename of the decoded sections (see get_section_state_path) or None to only stop reusing sections
+#
+# Output: None
+def save_section_state(path):
+    global section_state
+
+    if (path != None) and (len(section_state["sections"]) > 0):
+        directory = section_state["directory"]
+        os.makedirs(directory, exist_ok=True)
+        for key, section in section_state["new"].items():
+            temporary = os.path.join(directory, f"{key}.{os.getpid()}.tmp")
+            with open(temporary, mode="wb") as f:
+                f.write(zlib.compress(marshal.dumps(section), 1))
+            os.replace(temporary, os.path.join(directory, key))
+
+        temporary = f"{path}.{os.getpid()}.tmp"
+        with open(temporary, "w") as f:
+            json.dump({"context": section_state["context"], "sections": section_state["sections"]}, f, indent=4)
+        os.replace(temporary, path)
+
+        keys = set(section_state["sections"].values())
+        for filename in os.listdir(directory):
+            if (filename not in keys) and not filename.endswith(".tmp"):
+                try:
+                    os.remove(os.path.join(directory, filename))
+                except FileNotFoundError:
+                    pass
+
+    section_state = None
+
+
+# Parse a dump into a parsed result cache entry
+#
+# Input:
+#      telemetry_log : bytes of the Telemetry log page
+#      string_log    : bytes of the OCP Strings log page
+#      text          : StringIO receiving the printed dump, which holds the output up to the error if the parse fails
+#      last_data_area : None if the whole log page was read or the last data area read (see read_log)
+#
+# Output: dictionary of the form {'cache format' : cache_format_version, 'text' : printed dump,
+#                                 'record' : record of the dump (see get_telemetry_record)}
+def get_dump_entry(telemetry_log, string_log, text, last_data_area=None):
+    with redirect_stdout(text):
+        with timed_phase("parse_strings"):
+            strings = parse_strings(string_log)
+        parse_telemetry(telemetry_log, strings, last_data_area)
+
+    with timed_phase("record"):
+        record = get_telemetry_record(telemetry_log, strings, last_data_area=last_data_area or 2)
+
+    return {"cache format": cache_format_version, "text": text.getvalue(), "record": record}
+
+
+# Print a dump in an output format
+#
+# Input:
+#      entry  : dictionary of the dump (see get_dump_entry)
+#      format : "text", "json" or "ndjson"
+#      name   : name of the dump included in the NDJSON lines
+#
+# Output: None
+def print_dump_entry(entry, format, name):
+    if format == "text":
+        sys.stdout.write(entry["text"])
+    elif format == "json":
+        print(json.dumps(entry["record"], indent=4))
+    else:
+        print(json.dumps({"source": name, **entry["record"]}, separators=(",", ":")))
+
+
+# Read and parse a Telemetry log page
+#
+# Input:
+#      telemetry_file : Telemetry log page source (see open_source)
+#      string_file    : OCP Strings log page source
+#      format         : output format "text", "json" or "ndjson" (see print_dump_entry)
+#      cache          : parsed result cache (see open_cache) or None
+#      name           : name of the dump included in the NDJSON lines
+#      drive_state    : directory of the decoded sections of the last dump of each drive or None
+#      drive          : drive name of the dump for drive_state
+#      index          : event index sidecar filename (see get_event_index) or None
+#      last_data_area : None to read the whole Telemetry log page or the last data area to read (1 or 2)
+#
+# Output: None
+def dump_log(
+    telemetry_file, string_file, format="text", cache=None, name=None, drive_state=None, drive=None, index=None, last_data_area=None
+):
+    # A Telemetry log page from a stream is parsed as it arrives unless the whole log page is needed
+    if is_stream_source(telemetry_file) and (format == "text") and (cache is None) and (drive_state is None) and (index is None):
+        with timed_phase("read"):
+            string_log = read_log(string_file)
+
+        with timed_phase("parse_strings"):
+            strings = parse_strings(string_log)
+        with open_log(telemetry_file) as f:
+            tel_len = parse_telemetry_stream(f, strings, last_data_area)
+
+        inc_counter("ocp_telemetry_bytes_scanned", (), len(string_log) + tel_len)
+        return
+
+    with timed_phase("read"):
+        string_log = read_log(string_file)
+        telemetry_log = read_log(telemetry_file, last_data_area)
+
+    inc_counter("ocp_telemetry_bytes_scanned", (), len(string_log) + len(telemetry_log))
+
+    # Sections decoded with other strings, VU schemas or VU schema selection (by firmware version) are not reused
+    state_path = None
+    if drive_state != None:
+        state_path = get_section_state_path(drive_state, drive, telemetry_log)
+        firmware = telemetry_log[512 + 56 : 512 + 64].hex()
+        load_section_state(state_path, f"{get_cache_salt().hex()} {hashlib.sha256(string_log).hexdigest()} {firmware}")
+
+    # The decoded sections are saved only if the dump is parsed
+    try:
+        if (format == "text") and (cache is None):
+            with timed_phase("parse_strings"):
+                strings = parse_strings(string_log)
+            parse_telemetry(telemetry_log, strings, last_data_area)
+        else:
+            entry = None
+            if cache != None:
+                path = get_cache_path(cache, telemetry_log, string_log, last_data_area)
+                with timed_phase("cache read"):
+                    entry = read_cache_entry(path)
+
+            if entry is None:
+                # The text up to a validation error is still printed
+                text = io.StringIO()
+                try:
+                    entry = get_dump_entry(telemetry_log, string_log, text, last_data_area)
+                finally:
+                    if (entry is None) and (format == "text"):
+                        sys.stdout.write(text.getvalue())
+
+                if cache != None:
+                    with timed_phase("cache write"):
+                        write_cache_entry(path, entry)
+
+            print_dump_entry(entry, format, name)
+
+        if index != None:
+            with timed_phase("event index"):
+                write_event_index(index, telemetry_log, get_event_index(telemetry_log))
+
+        if state_path != None:
+            save_section_state(state_path)
+    finally:
+        if section_state != None:
+            save_section_state(None)
+
+
+# Main part of the script
+#
+# Input:
+#      argv : list of commandline arguments or None to use sys.argv
+#
+# Output: None
+def main(argv=None):
+    global phase_times
+    global phase_memory
+
+    if argv is None:
+        argv = sys.argv[1:]
+
+    if (len(argv) > 0) and (argv[0] in commands):
+        commands[argv[0]](argv[1:])
+        return
+
+    # The version is printed without parsing the commandline as it is checked before each dump by some tools
+    if argv in (["-v"], ["--version"]):
+        print(f"{os.path.basename(sys.argv[0])} version: {version}")
+        return
+
+    args = parse_inputs(argv)
+    if args.list_ver:
+        print(f"{os.path.basename(sys.argv[0])} version: {version}")
+    else:
+        if len(args.string) == 1:
+            string_files = args.string * len(args.telemetry)
+        elif len(args.string) == len(args.telemetry):
+            string_files = args.string
+        else:
+            sys.exit("Specify one OCP Strings log page or one for each Telemetry log page.")
+        if sum(1 for filename in args.telemetry + args.string if filename == "-") > 1:
+            sys.exit("Only one log page can be read from stdin.")
+        if args.index and any(is_stream_source(filename) for filename in args.telemetry):
+            sys.exit("--index needs the filename of each Telemetry log page.")
+
+        last_data_area = None
+        if args.areas != None:
+            last_data_area = get_last_data_area(args.areas)
+            if args.index:
+                sys.exit("--index needs all of the FIFOs so it can not be used with --areas.")
+
+        # An OCP Strings log page from a stream can only be read once
+        streams = {filename: read_log(filename) for filename in set(string_files) if is_stream_source(filename)}
+        string_files = [streams.get(filename, filename) for filename in string_files]
+
+        bundle = any(get_bundle_format(filename) != None for filename in args.telemetry if not is_stream_source(filename))
+        batch = (len(args.telemetry) > 1) or bundle
+
+        for filename in args.vu_schema:
+            load_vu_schema(filename)
+
+        # The cache key depends on the VU schemas
+        cache = None
+        if args.cache != None:
+            cache = open_cache(args.cache, args.cache_size)
+
+        server = None
+        if (args.metrics != None) or (args.metrics_port != None):
+            init_metrics()
+        if args.metrics_port != None:
+            server = start_metrics_server(args.metrics_port)
+
+        if args.profile_output != None:
+            import cProfile
+
+            profiler = cProfile.Profile()
+            profiler.enable()
+
+        track_memory = args.memory_report or (args.memory_budget != None)
+        if track_memory:
+            import tracemalloc
+
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+
+        dumps = 0
+        failures = 0
+        try:
+            for name, telemetry_source, string_source, error in get_dump_sources(args.telemetry, string_files):
+                dumps += 1
+                if batch and (args.format == "text"):
+                    print(f"\nTelemetry log page: {name}")
+                if args.profile:
+                    phase_times = []
+                if track_memory:
+                    phase_memory = {
+                        "phases": [],
+                        "start": tracemalloc.get_traced_memory()[0],
+                        "peak": 0,
+                        "budget": args.memory_budget,
+                        "phase": None,
+                    }
+
+                wall_start = perf_counter()
+                cpu_start = process_time()
+
+                # The profile is reported even if the dump stops on a validation error. A batch reports the error, or
+                # any other exception such as one raised by a VU event decoder plugin, and continues with the next log
+                # page.
+                try:
+                    if error != None:
+                        sys.exit(error)
+                    index = get_event_index_path(name) if args.index else None
+                    dump_log(
+                        telemetry_source,
+                        string_source,
+                        args.format,
+                        cache,
+                        name,
+                        args.drive_state,
+                        get_drive_name(name, args.drive),
+                        index,
+                        last_data_area,
+                    )
+                    inc_counter("ocp_telemetry_dumps", (("result", "ok"),))
+                except (SystemExit, Exception) as error:
+                    if isinstance(error, SystemExit):
+                        message = error.code
+                        rule = get_validation_rule(message)
+                    elif isinstance(error, OSError):
+                        message = f"{error.strerror}: {error.filename}"
+                        rule = error.strerror
+                    else:
+                        message = f"{type(error).__name__}: {error}"
+                        rule = type(error).__name__
+                    inc_counter("ocp_telemetry_dumps", (("result", "failed"),))
+                    inc_counter("ocp_telemetry_validation_failures", (("rule", rule),))
+                    if not batch:
+                        raise
+                    print(f"{name}: {message}", file=sys.stderr)
+                    failures += 1
+                finally:
+                    total = (perf_counter() - wall_start, process_time() - cpu_start)
+                    observe_histogram("ocp_telemetry_dump_duration_seconds", total[0])
+
+                    if args.profile:
+                        if batch:
+                            print(f"\n{name}", file=sys.stderr)
+                        print_phase_times(total)
+                        phase_times = None
+
+                    if track_memory:
+                        if args.memory_report:
+                            if batch and not args.profile:
+                                print(f"\n{name}", file=sys.stderr)
+                            print_phase_memory()
+                        phase_memory = None
+        finally:
+            if track_memory:
+                tracemalloc.stop()
+
+            if args.profile_output != None:
+                profiler.disable()
+                profiler.dump_stats(args.profile_output)
+
+            if args.metrics != None:
+                with open(args.metrics, "w") as f:
+                    f.write(get_openmetrics())
+
+            if cache != None:
+                prune_cache(cache)
+
+        if server != None:
+            try:
+                threading.Event().wait()
+            except KeyboardInterrupt:
+                server.shutdown()
+
+        if failures > 0:
+            sys.exit(f"{failures} of {dumps} Telemetry log pages failed to parse.")
+
+
+if __name__ == "__main__":
+    main()
+
@@ -0,0 +1,2435 @@
+# *****************************************************************************
+#
+#          COPYRIGHT 2022-2023 SAMSUNG ELECTRONICS CO., LTD.
+#                          ALL RIGHTS RESERVED
+#
+#   Permission is hereby granted to licensees of Samsung Electronics
+#   Co., Ltd. products to use or abstract this computer program for the
+#   sole purpose of implementing a product based on Samsung
+#   Electronics Co., Ltd. products. No other rights to reproduce, use,
+#   or disseminate this computer program, whether in part or in whole,
+#   are granted.
+#
+#   Samsung Electronics Co., Ltd. makes no representation or warranties
+#   with respect to the performance of this computer program, and
+#   specifically disclaims any responsibility for any damages,
+#   special or consequential, connected with the use of this program.
+#
+# *****************************************************************************
+#
+# History:
+#
+# 1/4/2023 - Initial script based on OCP Datacenter NVMe SSD SPecification v2.5 with comments from Mike Allison
+# 1/5/2023 - Added the -v commandline option to version of this script
+#          - The Data Area 1 FIFO information was changed start/end to start/size
+# 1/6/2023 - Put <spaces> in the ASCI table for unused locations
+#          - Sorted the tables in the Strings table to meet requirements
+# 4/9/2023 - Conversion to f-strings
+#          - Remove superfluous syntax
+#          - Reduce dictionary lookups
+#          - Deduplicate code
+#          - Reformat code with Black
+# 10/19/2026 - Stream the data areas to the output file in chunks and write zero filled regions as sparse holes
+#            - Added FIFO occupancy fill mode and a target log page size
+#            - Added the optional "Event Mix" JSON section to weight the event classes, identifiers and VU extensions
+#            - Moved the main part of the script into main() so the script can be imported
+#            - Added the --benchmark option to report the time and allocations of each generation phase
+#            - Added the optional "Random Data Area" for the random vendor defined statistics
+#            - Removed the quadratic selection and duplicate checking of the random vendor defined statistic identifiers
+#            - Moved into the ocp_telemetry package with an ocp-generate-telemetry entry point. The sample JSON file is
+#              read from sample_ocp_debug.json when it is needed.
+#            - The benchmark allocations are only measured with --allocations. argparse, statistics and tracemalloc are
+#              imported when they are needed.
+
+import json
+import sys
+import random
+from random import choice
+from random import randbytes
+from itertools import accumulate
+from bisect import bisect_left
+from contextlib import contextmanager, redirect_stdout
+from time import perf_counter
+import os
+
+# Modules only needed by the benchmark and the commandline, such as argparse, statistics and tracemalloc, are imported
+# by the functions that use them so that importing the module stays fast.
+
+# global variables
+
+version = 2.2
+
+# Fake time incremented by get_time. It starts at a random time, which does not use the seeded random numbers, when
+# it is first used.
+time = None
+
+ocp_ver = "2.5r24"
+
+# Sample JSON file written with -g and used when a JSON file is not specified
+sample_json_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sample_ocp_debug.json")
+
+
+# Get the sample JSON file
+#
+# Input: None
+#
+# Output: string of the sample JSON file
+def get_sample_json():
+    with open(sample_json_file, "r") as f:
+        return f.read()
+
+
+# Get a time and make sure time is always incrementing
+#
+# Input: None
+#
+# Output: A integer time that is more than the time last time this function was invoked.
+def get_time():
+    global time
+
+    if time is None:
+        time = random.Random().randint(0, (2 ** 48) - 1)
+
+    time += 1
+    if time > 2 ** 48:
+        time = 0
+
+    return time
+
+
+# This function generates a NVMe Host- or Controller-Initiated Telemetry 512 byte header
+#
+# Input:
+#         da1_size  : Size in bytes of Data Area 1
+#         da2_size  : Size in bytes of Data Area 2
+#         da3_size  : Size in bytes of Data Area 3
+#         da4_size  : Size in bytes of Data Area 4
+#         host      : Host-initiated if True else Controller-initiated
+#
+# Output: A bytearray of an NVMe Host- or Controller-Initiated log page header
+def nvme_telemetry_host_controller_initiated_header(da1_size, da2_size, da3_size, da4_size, host):
+    # Compute the data area last blocks
+    if (da1_size % 512) != 0:
+        sys.exit("Data Area 1 size not a multiple of 512")
+    else:
+        da1_last_block = da1_size // 512
+        if da1_last_block >= 2 ** 16:
+            sys.exit("Data Area 1 last block is to big")
+
+    if (da2_size % 512) != 0:
+        sys.exit("Data Area 2 size not a multiple of 512")
+    else:
+        da2_last_block = da1_last_block + da2_size // 512
+        if da2_last_block >= 2 ** 16:
+            sys.exit("Data Area 2 last block is to big")
+
+    if (da3_size % 512) != 0:
+        sys.exit("Data Area 3 size not a multiple of 512")
+    else:
+        da3_last_block = da2_last_block + da3_size // 512
+        if da3_last_block >= 2 ** 16:
+            sys.exit("Data Area 3 last block is to big")
+
+    if (da4_size % 512) != 0:
+        sys.exit("Data Area 4 size not a multiple of 512")
+    else:
+        da4_last_block = da3_last_block + da4_size // 512
+        if da4_last_block >= 2 ** 32:
+            sys.exit("Data Area 4 last block is to big")
+
+    reserved = 0
+    if host:
+        reason_str = "This is the reason for the host initiated dump"
+        header = (7).to_bytes(1, "little")                      #      00  Log Identifier
+    else:
+        reason_str = "This is the reason for the controller initiated dump"
+        header = (8).to_bytes(1, "little")                      #      00  Log Identifier
+
+    header += reserved.to_bytes(4, "little")                    #   04:01  Reserved
+    header += bytearray([1, 2, 3])                              #   07:05  IEEE OUI Identifier
+    header += da1_last_block.to_bytes(2, "little")              #   09:08  Data Area 1 Last Block
+    header += da2_last_block.to_bytes(2, "little")              #   11:10  Data Area 2 Last Block
+    header += da3_last_block.to_bytes(2, "little")              #   13:12  Data Area 3 Last Block
+    header += reserved.to_bytes(2, "little")                    #   15:14  Reserved
+    header += da4_last_block.to_bytes(4, "little")              #   19:16  Data Area 4 Last Block
+
+    if host:
+        header += reserved.to_bytes((379 - 20 + 1), "little")   #  379:20  Reserved
+        header += random.randint(0, 2).to_bytes(1, "little")    #  380     Telemetry Host-Initiated Scope
+        header += random.randint(0, 255).to_bytes(1, "little")  #  381     Telemetry Host Initiated Generation Number
+        header += random.randint(0, 1).to_bytes(1, "little")    #  382     Telemetry Controller Initiated Data Available
+    else:
+        header += reserved.to_bytes((380 - 20 + 1), "little")   #  380:20  Reserved
+        header += random.randint(0, 2).to_bytes(1, "little")    #  381     Telemetry Controller-Initiated Scope
+        header += (1).to_bytes(1, "little")                     #  382     Telemetry Controller-Initiated Data Available
+
+    header += random.randint(0, 255).to_bytes(1, "little")      #  383     Telemetry Controller Initiated Generation Number
+    header += reason_str.encode()                               #  511:384 Reason string
+    header += reserved.to_bytes((511 - 384 + 1) - len(reason_str), "little")
+    return header
+
+
+# Generate a NVMe Timestamp
+#
+# Input: bytearrary to add time to
+#
+# Output: NVMe Timestamp added to byte arrary
+def nvme_timestamp(data_struct):
+    local_time = get_time()
+    data_struct += local_time.to_bytes(6, "little")  # 05:00 Timestamp
+    data_struct += (2).to_bytes(1, "little")         # 06    Attributes
+    data_struct += (0).to_bytes(1, "little")         # 07    Reserved
+
+
+# Size in bytes of each write when streaming random data to the output file
+chunk_size = 1024 * 1024
+
+# Write a data area made of segments to the output file
+#
+# Input:
+#         f        : File opened for binary writing
+#         segments : List of (data, size) tuples where size is the number of bytes the segment occupies. Any bytes
+#                    of the segment after data are zero and are skipped over to leave a sparse hole in the file.
+#
+# Output: None
+def write_segments(f, segments):
+    for data, size in segments:
+        f.write(data)
+        if size > len(data):
+            f.seek(size - len(data), os.SEEK_CUR)
+
+
+# Generate random data for data area and stream it to the output file
+#
+# Input:
+#         f         : File opened for binary writing
+#         data_area : Data Area being created
+#         size      : Size, in bytes of the data area to be created
+#
+# Output: None
+def write_random_data_area(f, data_area, size):
+    print(f"Generating Data Area {data_area}:")
+    remaining = size
+    while remaining > 0:
+        length = min(remaining, chunk_size)
+        f.write(randbytes(length))
+        remaining -= length
+
+
+# Generate a statistics descriptor
+#
+# Input:
+#         statistic  : A dictiuonary for a specific statistic
+#         name       : ASCII string name of the statistic
+#         namespaces : Number of namespaces allowed
+#
+# Output: Bytearray contabing a statics descriptor with random data generated for the data
+def generate_statistic(statistic, name, namespaces):
+
+    # Validate the statistic identifier
+    identifier = statistic["Identifier"]
+    if (identifier < 0) or (identifier >= 2 ** 16):
+        sys.exit(f"Statistic {name}has an invalid Identifier value{identifier}")
+
+    # Validate the behavior type
+    behavior_type = statistic["Behavior Type"]
+    if (behavior_type < 1) or (behavior_type >= 7):
+        sys.exit(f"Statistic {name}has an invalid Behavior Type value{behavior_type}")
+
+    # Validate the namespace - a Namespace of 0h means no namespace is specified
+    namespace = statistic["Namespace"]
+
+    if namespace > namespaces:
+        sys.exit(f"Statistic {name}has an invalid namespace value as {namespace}")
+    if namespace > 127:
+        sys.exit(f"Statistic {name}has namespace value that does not fit into 7 bits {namespace}")
+    if namespace != 0:
+        namespace |= 0x80
+
+    # Validate the Dword Size type
+    # Only supporting 32 byte sized statistics
+    dw_size = statistic["Dword Size"]
+    if (dw_size < 1) or (dw_size >= 9):
+        sys.exit(f"Statistic {name}has an invalid Dword size value{dw_size}")
+
+    # Validate the min/max values
+    maximum = statistic["Value Max"]
+    minimum = statistic["Value Min"]
+    if maximum < minimum:
+        sys.exit("Statistic " + name + "has an invalid Min/Max values Max: " + maximum + " Min : " + minimum)
+
+    descriptor = bytearray()
+    descriptor += identifier.to_bytes(2, "little")     # 1:0 Static Identifier
+    descriptor += behavior_type.to_bytes(1, "little")  #   2 Statistic Info
+    descriptor += namespace.to_bytes(1, "little")      #   3 NS Info
+    descriptor += dw_size.to_bytes(2, "little")        # 5:4 Statistic Data Size
+    descriptor += bytearray(2)                         # 7:6 Reserved
+
+    # Generate the value  - special case a few OCP defined values
+    if identifier in (0x1B, 0x1C, 0x1D):
+        if dw_size != 2:
+            sys.exit(f"Statistic {name} has an invalid dword size value: {dw_size}")
+
+        descriptor += random.randint(0, 100).to_bytes(1, "little")
+        descriptor += (0).to_bytes(1, "little")
+        descriptor += random.randint(0, (2 ** 16) - 1).to_bytes(2, "little")
+        descriptor += (0).to_bytes(4, "little")
+    else:
+        descriptor += random.randint(minimum, maximum).to_bytes((dw_size * 4), "little")
+
+    # Validate the Dword Size type
+    if (dw_size < 1) or (dw_size >= 9):
+        sys.exit(f"Statistic {name} has an invalid Behavior Type value {dw_size}")
+
+    return_data = {"Identifier": identifier, "Descriptor": descriptor, "String": statistic["Definition"]}
+
+    return return_data
+
+
+# Generate the statistics information
+#
+# Input:
+#         ocp_data : A dictiuonary containing ther JSON input data and the set of statistics
+#
+# Output: A dictionary containing all of the statistics with the format:
+#
+#      statistics = {'Data Area 1'              : {'<hex(identifier)> : {'Identifier' : identifier,      # This is a list of identifiers
+#                                                                        'Descriptor' : statistics descriptor,
+#                                                                        'String'     : definition to go into Stings log page}
+#                    'Data Area 2'              : {'<hex(identifier)> : {'Identifier' : identifier,      # This is a list of identifiers
+#                                                                        'Descriptor' : statistics descriptor,
+#                                                                        'String'     : definition to go into Stings log page}}
+#                     'Data Area 1 Table'       : Data Area 1 Table
+#                     'Data Area 2 Table'       : Data Area 2 Table
+#                     'Data Area 1 Identifiers' : array of identifier for random snapshot selections
+#                     'Data Area 2 Identifiers' : array of identifier for random snapshot selections
+#
+def get_statistics(ocp_data):
+
+    statistics = {
+        "Namespaces": (0),
+        "Data Area 1": {},
+        "Data Area 2": {},
+        "Data Area 1 Table": bytearray(),
+        "Data Area 2 Table": bytearray(),
+        "Data Area 1 Identifiers": [],
+        "Data Area 2 Identifiers": [],
+    }
+
+    # Keep track of the number of namespaces supported
+    namespaces = ocp_data["Namespaces"]["number"]
+    statistics["Namespaces"] = namespaces
+
+    # Loop through the OCP Defined statistics
+    for stat, stat_value in ocp_data["Statistics"]["OCP Defined"].items():
+        if stat_value["Data Area"] == 1:
+            _area = "Data Area 1"
+        elif stat_value["Data Area"] == 2:
+            _area = "Data Area 2"
+        else:
+            sys.exit(f"Statistics {stat} has an invalid Data Area value of {stat_value['Data Area']}")
+
+        stat_data = generate_statistic(stat_value, stat, namespaces)
+
+        # Validate the Identifier is not already used.
+        identifier = stat_data["Identifier"]
+        if hex(identifier) in statistics[_area]:
+            sys.exit(f"Statistic '{stat}' and '{hex(identifier)}' have the same identifier value of {stat_data['Identifier']}")
+
+        # Validate the Identifier value - Just checking range
+        if (identifier < 1) or (identifier > 29):
+            sys.exit(f"Statistic '{stat}' has an invalid identifier value of {stat_data['Identifier']}")
+
+        statistics[_area][hex(identifier)] = stat_data
+        statistics[f"{_area} Identifiers"].append(hex(identifier))
+
+    # Generate the random statistics
+
+    # Create the sorted list of the identifiers not already used
+    used_values = set()
+    for stat, stat_value in ocp_data["Statistics"]["Vendor Defined"]["Specific Fields"].items():
+        used_values.add(stat_value["Identifier"])
+    unused_values = [identifier for identifier in range(0x8000, 0xFFFF) if identifier not in used_values]
+
+    # An optional Random Data Area places all of the random statistics in one data area
+    random_data_area = ocp_data["Statistics"]["Vendor Defined"].get("Random Data Area")
+    if random_data_area not in (None, 1, 2):
+        sys.exit(f"Statistics 'Random Data Area' has an invalid value of {random_data_area}")
+
+    # Loop through the number of random statistics
+    for x in range(ocp_data["Statistics"]["Vendor Defined"]["Random Fields"]):
+
+        if len(unused_values) == 0:
+            sys.exit(f"Statistics 'Random Fields' value of {x + 1} or more exceeds the number of unused vendor identifiers")
+
+        # Pick the fields for the random statistic
+        identifier = choice(unused_values)
+        behavior_type = random.randint(1, 6)
+        namespace = random.randint(0, namespaces)
+        dword_size = random.randint(1, 8)
+        max_value = random.randint(0, (2 ** (dword_size * 4)) - 1)
+        min_value = random.randint(0, max_value)
+        if random_data_area is None:
+            data_area = random.randint(1, 2)
+        else:
+            data_area = random_data_area
+        definition = f"Random Statistic Variable number {x} {identifier}"
+        del unused_values[bisect_left(unused_values, identifier)]
+
+        ocp_data["Statistics"]["Vendor Defined"]["Specific Fields"][definition] = {
+            "Identifier": identifier,
+            "Value Max": max_value,
+            "Value Min": min_value,
+            "Dword Size": dword_size,
+            "Behavior Type": behavior_type,
+            "Namespace": namespace,
+            "Requirement": "STATI-31",
+            "Definition": definition,
+            "Data Area": data_area,
+        }
+    # Loop through the Vendor Defined statistics
+    for stat, stat_value in ocp_data["Statistics"]["Vendor Defined"]["Specific Fields"].items():
+        if stat_value["Data Area"] == 1:
+            _area = "Data Area 1"
+        elif stat_value["Data Area"] == 2:
+            _area = "Data Area 2"
+        else:
+            sys.exit(f"Statistics {stat} has an invalid Data Area value of {stat_value['Data Area']}")
+
+        stat_data = generate_statistic(stat_value, stat, namespaces)
+
+        # Validate the Identifier is not already used.
+        if hex(stat_data["Identifier"]) in statistics[_area]:
+            key = hex(stat_data["Identifier"])
+            sys.exit(f"Statistic '{stat}' and '{key}' have the same identifier value of {stat_data['Identifier']}")
+
+        # Validate the Identifier value - Just checking range
+        if (stat_data["Identifier"] < 0x8000) or (stat_data["Identifier"] > 0xFFFF):
+            sys.exit(f"Statistic '{stat}' has an invalid identifier value of {stat_data['Identifier']}")
+
+        identifier = stat_data["Identifier"]
+        statistics[_area][hex(identifier)] = stat_data
+        statistics[f"{_area} Identifiers"].append(hex(identifier))
+
+    # Build the tables
+    data_area_1_stat_table = bytearray()
+    for _, value in statistics["Data Area 1"].items():
+        data_area_1_stat_table += value["Descriptor"]
+
+    data_area_2_stat_table = bytearray()
+    for _, value in statistics["Data Area 2"].items():
+        data_area_2_stat_table += value["Descriptor"]
+
+    statistics["Data Area 1 Table"] = data_area_1_stat_table
+    statistics["Data Area 2 Table"] = data_area_2_stat_table
+
+    return statistics
+
+
+debug_class_size = 1
+event_id_size = 2
+
+# Generate a Vendor Unique Identifier
+#
+# Input:
+#         fifo_number  : FIFO that the event is to exist
+#         event_number : number of event in the FIFO
+#         vu_strings   : Information to generate vu string
+#
+# Output: A tuple containing
+#
+#      (<vu string name for identifier>, <identifier>)
+
+
+def get_vu_id_event_info(fifo_number, event_number, vu_strings):
+
+    vu_event_id = random.randint(0x0000, 0xFFFF)
+
+    idx = hex(vu_event_id)
+    name = f"Vendor Unique Identifier {fifo_number} {event_number} 0x{vu_event_id:x}"
+
+    # Create the event if one does not already exist
+    if idx not in vu_strings:
+        vu_strings[idx] = {
+            "name": name,
+            "identifier": vu_event_id,
+        }
+
+    return (vu_strings[idx]["name"], vu_strings[idx]["identifier"])
+
+
+# Select the identifier of an OCP defined debug event
+#
+# Input:
+#         mix          : Event mix for the FIFO (see get_event_mix)
+#         debug_class  : Debug class of the event
+#         last_ocp_id  : Last OCP defined identifier for the debug class
+#
+# Output: An OCP defined or a vendor unique identifier. Without identifier weights for the debug class each is
+#         equally likely.
+#
+def get_event_id(mix, debug_class, last_ocp_id):
+    if debug_class in mix["identifiers"]:
+        (identifiers, cum_weights) = mix["identifiers"][debug_class]
+        return random.choices(identifiers, cum_weights=cum_weights)[0]
+
+    if random.randint(0, 1) == 0:
+        if last_ocp_id == 0:
+            return 0
+        return random.randint(0, last_ocp_id)
+    return random.randint(0x8000, 0xFFFF)
+
+
+# Select the size of the VU extension data of an OCP defined debug event
+#
+# Input:
+#         mix          : Event mix for the FIFO (see get_event_mix)
+#         debug_class  : Debug class of the event
+#         max_dwords   : Maximum number of dwords of VU extension data
+#
+# Output: Number of dwords of VU extension data, 0 when the event has no VU extension. Without a VU extension
+#         probability for the debug class half of the events have a VU extension.
+#
+def get_vu_dwordsize(mix, debug_class, max_dwords):
+    if debug_class in mix["vu probability"]:
+        if random.random() < mix["vu probability"][debug_class]:
+            return random.randint(1, max_dwords)
+        return 0
+
+    return random.randint(0, 1) * random.randint(1, max_dwords)
+
+
+# Generate a Vendor Unique Debug Event
+#
+# Input:
+#         fifo_number  : FIFO that the event is to exist
+#         event_number : number of event in the FIFO
+#         statistics   : Dictionary of statistics
+#         vu_strings   : Information to generate vu strings in the string log
+#         mix          : Event mix for the FIFO (see get_event_mix)
+#
+# Output: A dictionary entry for a vendor unique event
+#
+#      {'name'        : string to identify the event,
+#       'class'       : VU debug class,
+#       'event id'    : vendor unique identifier,
+#       'descriptor'  : event descriptot}
+#
+def vendor_unique_event(fifo_number, event_number, statistics, vu_strings, mix):
+
+    global debug_class_size
+    debug_class = random.randint(0x80, 0xFF)
+    event = bytearray()
+    event += debug_class.to_bytes(debug_class_size, "little")                                       #    00 Debug VU Class
+
+    (vu_name, vu_event) = get_vu_id_event_info(fifo_number, event_number, vu_strings)
+    event += vu_event.to_bytes(event_id_size, "little")                                             # 02:01 Debug VU Event
+
+    vu_dwordsize = random.randint(1, 8)
+    event += vu_dwordsize.to_bytes(1, "little")                                                     #    03 Event Data Size
+
+    event += random.randint(0, (2 ** (vu_dwordsize * 4)) - 1).to_bytes(vu_dwordsize * 4, "little")  # **:04 Event Data
+
+    return_data = {
+        "name": f"Vendor Unique Event {fifo_number} {event_number} 0x{vu_event:x}",
+        "class": debug_class,
+        "event id": vu_event,
+        "descriptor": event,
+    }
+    return return_data
+
+
+# Generate a Static Snapshot Debug Event
+#
+# Input:
+#         fifo_number  : FIFO that the event is to exist
+#         event_number : number of event in the FIFO
+#         statistics   : Dictionary of statistics
+#         vu_strings   : Information to generate vu strings in the string log
+#         mix          : Event mix for the FIFO (see get_event_mix)
+#
+# Output: A dictionary entry for a Static Snapshot event
+#
+#      'name'        : string to identify the event,
+#      'class'       : debug class,
+#      'descriptor'  : event descriptor}
+#
+def static_snapshot_event(fifo_number, event_number, statistics, vu_strings, mix):
+
+    global debug_class_size
+    global event_id_size
+    debug_class = 10
+    event = bytearray()
+    event += debug_class.to_bytes(debug_class_size, "little")  #    00  Debug Event Class Code
+    event += (0).to_bytes(3, "little")                         # 03:01 Reserved
+
+    # Need to select a statistic identifier that is defined.
+
+    # Select a data area to choose form
+
+    if (len(statistics["Data Area 1 Identifiers"]) == 0) and (len(statistics["Data Area 2 Identifiers"]) == 0):
+        sys.exit("Cannot randomly select a snapshot event, please define an event")
+    elif (len(statistics["Data Area 1 Identifiers"]) > 0) and (len(statistics["Data Area 2 Identifiers"]) == 0):
+        data_area = 1
+    elif (len(statistics["Data Area 1 Identifiers"]) == 0) and (len(statistics["Data Area 2 Identifiers"]) > 0):
+        data_area = 2
+    else:
+        data_area = random.randint(1, 2)
+
+    # Select a statistics to snapshot - with the same data
+    data_area_str = f"Data Area {data_area}"
+    ran_idx = random.randint(0, len(statistics[f"{data_area_str} Identifiers"]) - 1)
+
+    statistics[f"{data_area_str} Identifiers"]
+
+    element = statistics[f"{data_area_str} Identifiers"][ran_idx]
+
+    event += statistics[data_area_str][element]["Descriptor"]  # XX:04 Descriptor
+
+    return_data = {
+        "name": f"Static Snapshot Event {fifo_number} {event_number}",
+        "class": debug_class,
+        "descriptor": event,
+    }
+    return return_data
+
+
+# Generate a Media Wear Debug Event
+#
+# Input:
+#         fifo_number  : FIFO that the event is to exist
+#         event_number : number of event in the FIFO
+#         statistics   : Dictionary of statistics
+#         vu_strings   : Information to generate vu strings in the string log
+#         mix          : Event mix for the FIFO (see get_event_mix)
+#
+# Output: A dictionary entry for a Media Wear event
+#
+#                    {'name'        : string to identify the event,
+#                     'class'       : debug class,
+#                     'descriptor'  : event descriptor,
+#      <optional>     'vu_event'    : Unique Vendor ID,
+#      <optional>     'vu_string'   : String for vendor id}
+#
+def media_wear_event(fifo_number, event_number, statistics, vu_strings, mix):
+
+    global debug_class_size
+    global event_id_size
+    debug_class = 9
+    non_vu_size = 3
+    event = bytearray()
+    event += debug_class.to_bytes(debug_class_size, "little")        #     00  Debug Event Class
+    event_id = get_event_id(mix, debug_class, 0)
+    event += event_id.to_bytes(event_id_size, "little")              #  02:01 Event Id
+
+    vu_dwordsize = get_vu_dwordsize(mix, debug_class, 8) + non_vu_size
+    event += vu_dwordsize.to_bytes(1, "little")                      #     03 Event Id
+
+    event += random.randint(0, 2 ** (32 - 1)).to_bytes(4, "little")  #  07:04 Host Terabytes Written
+    event += random.randint(0, 2 ** (32 - 1)).to_bytes(4, "little")  #  11:08 Media Terabytes Written
+    event += random.randint(0, 2 ** (32 - 1)).to_bytes(4, "little")  #  15:12 Host Terabytes Erased
+
+    if vu_dwordsize > non_vu_size:
+        (vu_name, vu_event_id) = get_vu_id_event_info(fifo_number, event_number, vu_strings)
+        event += vu_event_id.to_bytes(2, "little")
+        vu_data_size_bytes = ((vu_dwordsize - non_vu_size) * 4) - 2
+        event += random.randint(0, 2 ** (vu_data_size_bytes * 8) - 1).to_bytes(vu_data_size_bytes, "little")
+
+    # Build the return data
+    return_data = {
+        "name": f"Media Wear Event {fifo_number} {event_number}",
+        "class": debug_class,
+        "event id": event_id,
+        "descriptor": event,
+    }
+
+    if vu_dwordsize > non_vu_size:
+        return_data["vu_event"] = vu_event_id
+        return_data["vu_string"] = vu_name
+
+    return return_data
+
+
+# Generate a Media Debug Event
+#
+# Input:
+#         fifo_number  : FIFO that the event is to exist
+#         event_number : number of event in the FIFO
+#         statistics   : Dictionary of statistics
+#         vu_strings   : Information to generate vu strings in the string log
+#         mix          : Event mix for the FIFO (see get_event_mix)
+#
+# Output: A dictionary entry for a Media event
+#
+#                    {'name'        : string to identify the event,
+#                     'class'       : debug class,
+#                     'descriptor'  : event descriptor,
+#      <optional>     'vu_event'    : Unique Vendor ID,
+#      <optional>     'vu_string'   : String for vendor id}
+#
+def media_event(fifo_number, event_number, statistics, vu_strings, mix):
+
+    global debug_class_size
+    global event_id_size
+    debug_class = 8
+    non_vu_size = 0
+    event = bytearray()
+    event += debug_class.to_bytes(debug_class_size, "little")  #     00 Debug Event Class
+    event_id = get_event_id(mix, debug_class, 5)
+    event += event_id.to_bytes(event_id_size, "little")        #  02:01 Event Id
+
+    vu_dwordsize = get_vu_dwordsize(mix, debug_class, 8) + non_vu_size
+    event += vu_dwordsize.to_bytes(1, "little")                #     03 Dword size
+
+    if vu_dwordsize > non_vu_size:
+        (vu_name, vu_event_id) = get_vu_id_event_info(fifo_number, event_number, vu_strings)
+        event += vu_event_id.to_bytes(2, "little")
+        vu_data_size_bytes = ((vu_dwordsize - non_vu_size) * 4) - 2
+        event += random.randint(0, (2 ** (vu_data_size_bytes * 8)) - 1).to_bytes(vu_data_size_bytes, "little")
+
+    return_data = {
+        "name": f"Media Event {fifo_number} {event_number}",
+        "class": debug_class,
+        "event id": event_id,
+        "descriptor": event,
+    }
+
+    if vu_dwordsize > non_vu_size:
+        return_data["vu_event"] = vu_event_id
+        return_data["vu_string"] = vu_name
+
+    return return_data
+
+
+# Generate a Temperature Debug Event
+#
+# Input:
+#         fifo_number  : FIFO that the event is to exist
+#         event_number : number of event in the FIFO
+#         statistics   : Dictionary of statistics
+#         vu_strings   : Information to generate vu strings in the string log
+#         mix          : Event mix for the FIFO (see get_event_mix)
+#
+# Output: A dictionary entry for a Temperature event
+#
+#      return_data = {'name'        : string to identify the event,
+#                     'class'       : debug class,
+#                     'descriptor'  : event descriptor,
+#      <optional>     'vu_event'    : Unique Vendor ID,
+#      <optional>     'vu_string'   : String for vendor id}
+#
+def temperature_event(fifo_number, event_number, statistics, vu_strings, mix):
+
+    global debug_class_size
+    global event_id_size
+    debug_class = 7
+    non_vu_size = 0
+    event = bytearray()
+    event += debug_class.to_bytes(debug_class_size, "little")  #     00 Debug Event Class
+    event_id = get_event_id(mix, debug_class, 2)
+    event += event_id.to_bytes(event_id_size, "little")        #  02:01 Event Id
+
+    vu_dwordsize = get_vu_dwordsize(mix, debug_class, 8) + non_vu_size
+    event += vu_dwordsize.to_bytes(1, "little")                #     03 Dword size
+
+    if vu_dwordsize > non_vu_size:
+        (vu_name, vu_event_id) = get_vu_id_event_info(fifo_number, event_number, vu_strings)
+        event += vu_event_id.to_bytes(2, "little")
+        vu_data_size_bytes = ((vu_dwordsize - non_vu_size) * 4) - 2
+        event += random.randint(0, (2 ** (vu_data_size_bytes * 8)) - 1).to_bytes(vu_data_size_bytes, "little")
+
+    return_data = {
+        "name": f"Temperature Event {fifo_number} {event_number}",
+        "class": debug_class,
+        "event id": event_id,
+        "descriptor": event,
+    }
+
+    if vu_dwordsize > non_vu_size:
+        return_data["vu_event"] = vu_event_id
+        return_data["vu_string"] = vu_name
+
+    return return_data
+
+
+# Generate a Firmware Assert Debug Event
+#
+# Input:
+#         fifo_number  : FIFO that the event is to exist
+#         event_number : number of event in the FIFO
+#         statistics   : Dictionary of statistics
+#         vu_strings   : Information to generate vu strings in the string log
+#         mix          : Event mix for the FIFO (see get_event_mix)
+#
+# Output: A dictionary entry for a Firmware Assert event
+#
+#                    {'name'        : string to identify the event,
+#                     'class'       : debug class,
+#                     'descriptor'  : event descriptor,
+#      <optional>     'vu_event'    : Unique Vendor ID,
+#      <optional>     'vu_string'   : String for vendor id}
+#
+def fw_assert_event(fifo_number, event_number, statistics, vu_strings, mix):
+
+    global debug_class_size
+    global event_id_size
+    debug_class = 6
+    non_vu_size = 0
+    event = bytearray()
+    event += debug_class.to_bytes(debug_class_size, "little")  #     00 Debug Event Class
+    event_id = get_event_id(mix, debug_class, 6)
+    event += event_id.to_bytes(event_id_size, "little")        #  02:01 Event Id
+
+    vu_dwordsize = get_vu_dwordsize(mix, debug_class, 8) + non_vu_size
+    event += vu_dwordsize.to_bytes(1, "little")                #     03 Dword size
+
+    if vu_dwordsize > non_vu_size:
+        (vu_name, vu_event_id) = get_vu_id_event_info(fifo_number, event_number, vu_strings)
+        event += vu_event_id.to_bytes(2, "little")
+        vu_data_size_bytes = ((vu_dwordsize - non_vu_size) * 4) - 2
+        event += random.randint(0, (2 ** (vu_data_size_bytes * 8)) - 1).to_bytes(vu_data_size_bytes, "little")
+
+    return_data = {
+        "name": f"FW Assert Event {fifo_number} {event_number}",
+        "class": debug_class,
+        "event id": event_id,
+        "descriptor": event,
+    }
+
+    if vu_dwordsize > non_vu_size:
+        return_data["vu_event"] = vu_event_id
+        return_data["vu_string"] = vu_name
+
+    return return_data
+
+
+# Generate a Boot Debug Event
+#
+# Input:
+#         fifo_number  : FIFO that the event is to exist
+#         event_number : number of event in the FIFO
+#         statistics   : Dictionary of statistics
+#         vu_strings   : Information to generate vu strings in the string log
+#         mix          : Event mix for the FIFO (see get_event_mix)
+#
+# Output: A dictionary entry for a Boot Sequence event
+#
+#                    {'name'        : string to identify the event,
+#                     'class'       : debug class,
+#                     'descriptor'  : event descriptor,
+#      <optional>     'vu_event'    : Unique Vendor ID,
+#      <optional>     'vu_string'   : String for vendor id}
+#
+def boot_event(fifo_number, event_number, statistics, vu_strings, mix):
+
+    global debug_class_size
+    global event_id_size
+    debug_class = 5
+    non_vu_size = 0
+    event = bytearray()
+    event += debug_class.to_bytes(debug_class_size, "little")  #     00 Debug Event Class
+    event_id = get_event_id(mix, debug_class, 3)
+    event += event_id.to_bytes(event_id_size, "little")        #  02:01 Event Id
+
+    vu_dwordsize = get_vu_dwordsize(mix, debug_class, 8) + non_vu_size
+    event += vu_dwordsize.to_bytes(1, "little")                #     03 Dword size
+
+    if vu_dwordsize > non_vu_size:
+        (vu_name, vu_event_id) = get_vu_id_event_info(fifo_number, event_number, vu_strings)
+        event += vu_event_id.to_bytes(2, "little")
+        vu_data_size_bytes = ((vu_dwordsize - non_vu_size) * 4) - 2
+        event += random.randint(0, (2 ** (vu_data_size_bytes * 8)) - 1).to_bytes(vu_data_size_bytes, "little")
+
+    return_data = {
+        "name": f"Boot Event {fifo_number} {event_number}",
+        "class": debug_class,
+        "event id": event_id,
+        "descriptor": event,
+    }
+
+    if vu_dwordsize > non_vu_size:
+        return_data["vu_event"] = vu_event_id
+        return_data["vu_string"] = vu_name
+
+    return return_data
+
+
+# Generate a Reset Debug Event
+#
+# Input:
+#         fifo_number  : FIFO that the event is to exist
+#         event_number : number of event in the FIFO
+#         statistics   : Dictionary of statistics
+#         vu_strings   : Information to generate vu strings in the string log
+#         mix          : Event mix for the FIFO (see get_event_mix)
+#
+# Output: A dictionary entry for a Reset event
+#
+#                    {'name'        : string to identify the event,
+#                     'class'       : debug class,
+#                     'descriptor'  : event descriptor,
+#      <optional>     'vu_event'    : Unique Vendor ID,
+#      <optional>     'vu_string'   : String for vendor id}
+#
+def reset_event(fifo_number, event_number, statistics, vu_strings, mix):
+
+    global debug_class_size
+    global event_id_size
+    debug_class = 4
+    non_vu_size = 0
+    event = bytearray()
+    event += debug_class.to_bytes(debug_class_size, "little")  #     00 Debug Event Class
+    event_id = get_event_id(mix, debug_class, 4)
+    event += event_id.to_bytes(event_id_size, "little")        #  02:01 Event Id
+
+    vu_dwordsize = get_vu_dwordsize(mix, debug_class, 8) + non_vu_size
+    event += vu_dwordsize.to_bytes(1, "little")                #     03 Dword size
+
+    if vu_dwordsize > non_vu_size:
+        (vu_name, vu_event_id) = get_vu_id_event_info(fifo_number, event_number, vu_strings)
+        event += vu_event_id.to_bytes(2, "little")
+        vu_data_size_bytes = ((vu_dwordsize - non_vu_size) * 4) - 2
+        event += random.randint(0, (2 ** (vu_data_size_bytes * 8)) - 1).to_bytes(vu_data_size_bytes, "little")
+
+    return_data = {
+        "name": f"Reset Event {fifo_number} {event_number}",
+        "class": debug_class,
+        "event id": event_id,
+        "descriptor": event,
+    }
+
+    if vu_dwordsize > non_vu_size:
+        return_data["vu_event"] = vu_event_id
+        return_data["vu_string"] = vu_name
+
+    return return_data
+
+
+# NVMe valid opcode
+nvme_admin_opcodes = [
+    0x00,
+    0x01,
+    0x02,
+    0x04,
+    0x05,
+    0x06,
+    0x08,
+    0x09,
+    0x0A,
+    0x0C,
+    0x0D,
+    0x10,
+    0x11,
+    0x14,
+    0x15,
+    0x18,
+    0x19,
+    0x1A,
+    0x1C,
+    0x1D,
+    0x1E,
+    0x20,
+    0x24,
+    0x7C,
+    0x7F,
+    0x80,
+    0x81,
+    0x82,
+    0x84,
+    0x86,
+]
+
+nvme_io_opcodes = [0x00, 0x01, 0x02, 0x04, 0x05, 0x08, 0x09, 0x0C, 0x0D, 0x0E, 0x11, 0x12, 0x15, 0x18, 0x19, 0x1D]
+
+
+# Generate a NVMe Debug Event
+#
+# Input:
+#         fifo_number  : FIFO that the event is to exist
+#         event_number : number of event in the FIFO
+#         statistics   : Dictionary of statistics
+#         vu_strings   : Information to generate vu strings in the string log
+#         mix          : Event mix for the FIFO (see get_event_mix)
+#
+# Output: A dictionary entry for a NVMe event
+#
+#                    {'name'        : string to identify the event,
+#                     'class'       : debug class,
+#                     'descriptor'  : event descriptor,
+#      <optional>     'vu_event'    : Unique Vendor ID,
+#      <optional>     'vu_string'   : String for vendor id}
+#
+def nvme_event(fifo_number, event_number, statistics, vu_strings, mix):
+
+    global debug_class_size
+    global event_id_size
+    debug_class = 3
+    non_vu_size = 2
+    event = bytearray()
+    event += debug_class.to_bytes(debug_class_size, "little")                                        #     00 Debug Event Class
+    event_id = get_event_id(mix, debug_class, 12)
+    event += event_id.to_bytes(event_id_size, "little")                                              #  02:01 Event Id
+
+    vu_dwordsize = get_vu_dwordsize(mix, debug_class, 8) + non_vu_size
+    event += vu_dwordsize.to_bytes(1, "little")                                                      #     03 Dword size
+
+    if event_id == 7:
+        event += nvme_admin_opcodes[random.randint(0, len(nvme_admin_opcodes) - 1)].to_bytes(1, "little")
+        event += random.randint(1, 5).to_bytes(2, "little")                                          #  status #fix me can be more precise
+        event += (0).to_bytes(5, "little")
+    elif event_id == 8:
+        event += nvme_io_opcodes[random.randint(0, len(nvme_io_opcodes) - 1)].to_bytes(1, "little")  #  opcode for I/O command
+        event += random.randint(1, 5).to_bytes(2, "little")                                          #  status #fix me can be more precise
+        event += (0).to_bytes(5, "little")
+    elif event_id == 0xB:
+        event += random.randint(0, (2 ** 32) - 1).to_bytes(4, "little")                              #  CC #fix me can be more precise
+        event += (0).to_bytes(4, "little")
+    elif event_id == 0xC:
+        event += random.randint(0, (2 ** 32) - 1).to_bytes(4, "little")                              #  CSTS #fix me can be more precise
+        event += (0).to_bytes(4, "little")
+    else:
+        event += (0).to_bytes(8, "little")
+
+    if vu_dwordsize > non_vu_size:
+        (vu_name, vu_event_id) = get_vu_id_event_info(fifo_number, event_number, vu_strings)
+        event += vu_event_id.to_bytes(2, "little")
+        vu_data_size_bytes = ((vu_dwordsize - non_vu_size) * 4) - 2
+        event += random.randint(0, (2 ** (vu_data_size_bytes * 8)) - 1).to_bytes(vu_data_size_bytes, "little")
+
+    return_data = {
+        "name": f"NVMe Event {fifo_number} {event_number}",
+        "class": debug_class,
+        "event id": event_id,
+        "descriptor": event,
+    }
+
+    if vu_dwordsize > non_vu_size:
+        return_data["vu_event"] = vu_event_id
+        return_data["vu_string"] = vu_name
+
+    return return_data
+
+
+# Generate a PCIe Debug Event
+#
+# Input:
+#         fifo_number  : FIFO that the event is to exist
+#         event_number : number of event in the FIFO
+#         statistics   : Dictionary of statistics
+#         vu_strings   : Information to generate vu strings in the string log
+#         mix          : Event mix for the FIFO (see get_event_mix)
+#
+# Output: A dictionary entry for a PCIe event
+#
+#                    {'name'        : string to identify the event,
+#                     'class'       : debug class,
+#                     'descriptor'  : event descriptor,
+#      <optional>     'vu_event'    : Unique Vendor ID,
+#      <optional>     'vu_string'   : String for vendor id}
+#
+def pcie_event(fifo_number, event_number, statistics, vu_strings, mix):
+
+    global debug_class_size
+    global event_id_size
+    debug_class = 2
+    non_vu_size = 1
+    event = bytearray()
+    event += debug_class.to_bytes(debug_class_size, "little")  #     00 Debug Event Class
+    event_id = get_event_id(mix, debug_class, 7)
+    event += event_id.to_bytes(event_id_size, "little")        #  02:01 Event Id
+
+    vu_dwordsize = get_vu_dwordsize(mix, debug_class, 4) + non_vu_size
+    event += vu_dwordsize.to_bytes(1, "little")                #     03 Dword size
+
+    if event_id == 7:
+        event += random.randint(0, 2).to_bytes(1, "little")    #  state changed
+        event += random.randint(1, 7).to_bytes(1, "little")    #  link speed
+        event += random.randint(1, 5).to_bytes(1, "little")    #  link width
+        event += (0).to_bytes(1, "little")                     #  reserved
+    else:
+        event += (0).to_bytes(4, "little")
+
+    if vu_dwordsize > non_vu_size:
+        (vu_name, vu_event_id) = get_vu_id_event_info(fifo_number, event_number, vu_strings)
+        event += vu_event_id.to_bytes(2, "little")
+        vu_data_size_bytes = ((vu_dwordsize - non_vu_size) * 4) - 2
+        event += random.randint(0, (2 ** (vu_data_size_bytes * 8)) - 1).to_bytes(vu_data_size_bytes, "little")
+
+    return_data = {
+        "name": f"PCIe Event {fifo_number} {event_number}",
+        "class": debug_class,
+        "event id": event_id,
+        "descriptor": event,
+    }
+
+    if vu_dwordsize > non_vu_size:
+        return_data["vu_event"] = vu_event_id
+        return_data["vu_string"] = vu_name
+
+    return return_data
+
+
+# Generate a Timestamp Debug Event
+#
+# Input:
+#         fifo_number  : FIFO that the event is to exist
+#         event_number : number of event in the FIFO
+#         statistics   : Dictionary of statistics
+#         vu_strings   : Information to generate vu strings in the string log
+#         mix          : Event mix for the FIFO (see get_event_mix)
+#
+# Output: A dictionary entry for a Timestamp
+#
+#                    {'name'        : string to identify the event,
+#                     'class'       : debug class,
+#                     'descriptor'  : event descriptor,
+#      <optional>     'vu_event'    : Unique Vendor ID,
+#      <optional>     'vu_string'   : String for vendor id}
+#
+def timestamp_event(fifo_number, event_number, statistics, vu_strings, mix):
+    global debug_class_size
+    global event_id_size
+    debug_class = 1
+    non_vu_size = 2
+    event = bytearray()
+    event += debug_class.to_bytes(debug_class_size, "little")  #     00 Debug Event Class
+    event_id = get_event_id(mix, debug_class, 2)
+    event += event_id.to_bytes(event_id_size, "little")        #  02:01 Event Id
+
+    vu_dwordsize = get_vu_dwordsize(mix, debug_class, 4) + non_vu_size
+
+    event += vu_dwordsize.to_bytes(1, "little")                #     03 Dword size
+    nvme_timestamp(event)
+
+    if vu_dwordsize > non_vu_size:
+        (vu_name, vu_event_id) = get_vu_id_event_info(fifo_number, event_number, vu_strings)
+        event += vu_event_id.to_bytes(2, "little")
+        vu_data_size_bytes = ((vu_dwordsize - non_vu_size) * 4) - 2
+        event += random.randint(0, (2 ** (vu_data_size_bytes * 8)) - 1).to_bytes(vu_data_size_bytes, "little")
+
+    return_data = {
+        "name": f"Timestamp Event {fifo_number} {event_number}",
+        "class": debug_class,
+        "event id": event_id,
+        "descriptor": event,
+    }
+
+    if vu_dwordsize > non_vu_size:
+        return_data["vu_event"] = vu_event_id
+        return_data["vu_string"] = vu_name
+
+    return return_data
+
+
+event_functions = [
+    timestamp_event,
+    pcie_event,
+    nvme_event,
+    reset_event,
+    boot_event,
+    fw_assert_event,
+    temperature_event,
+    static_snapshot_event,
+    vendor_unique_event,
+]
+
+# Debug classes that can be named in the "Event Mix" JSON section
+#
+#      {<class name> : (<debug class or None for vendor unique classes>, <event generator>)}
+event_classes = {
+    "Timestamp": (1, timestamp_event),
+    "PCIe Debug": (2, pcie_event),
+    "NVMe Debug": (3, nvme_event),
+    "Reset Debug": (4, reset_event),
+    "Boot Sequence": (5, boot_event),
+    "Firmware Assert": (6, fw_assert_event),
+    "Temperature": (7, temperature_event),
+    "Static Snapshot": (10, static_snapshot_event),
+    "Vendor Unique": (None, vendor_unique_event),
+}
+
+# Build the event mix of a FIFO from the "Event Mix" JSON section
+#
+# Input:
+#         mix_data     : Dictionary of the "Event Mix" JSON section of the form:
+#
+#      {"Class Weights"            : {<class name> : weight, ...},
+#       "Identifier Weights"       : {<class name> : {<identifier> : weight, ...}, ...},
+#       "VU Extension Probability" : probability for all classes or {<class name> : probability, ...}}
+#
+#         Every entry is optional. The identifiers are strings of a decimal or 0x prefixed hex value.
+#
+# Output: Event mix used to generate the events
+#
+#      {'functions'      : list of event generators to select from,
+#       'cum weights'    : cumulative weights of the event generators or None for a uniform selection,
+#       'identifiers'    : {<debug class> : (list of identifiers, cumulative weights), ...},
+#       'vu probability' : {<debug class> : probability of a VU extension, ...}}
+#
+def get_event_mix(mix_data):
+    mix = {"functions": event_functions, "cum weights": None, "identifiers": {}, "vu probability": {}}
+
+    class_weights = mix_data.get("Class Weights", {})
+    if len(class_weights) > 0:
+        for name, weight in class_weights.items():
+            if name not in event_classes:
+                sys.exit(f"Event Mix class '{name}' is not one of: {', '.join(event_classes)}")
+            if weight < 0:
+                sys.exit(f"Event Mix class '{name}' has an invalid weight of {weight}")
+
+        if sum(class_weights.values()) <= 0:
+            sys.exit("Event Mix class weights must not all be zero")
+
+        mix["functions"] = [event_classes[name][1] for name in class_weights]
+        mix["cum weights"] = list(accumulate(class_weights.values()))
+
+    for name, weights in mix_data.get("Identifier Weights", {}).items():
+        if (name not in event_classes) or (name in ("Static Snapshot", "Vendor Unique")):
+            sys.exit(f"Event Mix identifier weights are not supported for class '{name}'")
+        if sum(weights.values()) <= 0:
+            sys.exit(f"Event Mix identifier weights for class '{name}' must not all be zero")
+
+        identifiers = [int(identifier, 0) for identifier in weights]
+        mix["identifiers"][event_classes[name][0]] = (identifiers, list(accumulate(weights.values())))
+
+    probability = mix_data.get("VU Extension Probability", {})
+    if not isinstance(probability, dict):
+        probability = {name: probability for name, value in event_classes.items() if value[0] not in (None, 10)}
+    for name, value in probability.items():
+        if (name not in event_classes) or (name in ("Static Snapshot", "Vendor Unique")):
+            sys.exit(f"Event Mix VU extension probability is not supported for class '{name}'")
+        if (value < 0) or (value > 1):
+            sys.exit(f"Event Mix VU extension probability for class '{name}' has an invalid value of {value}")
+
+        mix["vu probability"][event_classes[name][0]] = value
+
+    return mix
+
+
+# Genertate an event
+#
+# Input:
+#         fifo_number  : FIFO that the event is to exist
+#         event_number : number of event in the FIFO
+#         statistics   : Dictionary of statistics
+#         vu_strings   : Information to generate vu strings in the string log
+#         mix          : Event mix for the FIFO (see get_event_mix)
+#
+# Output: A dictionary entry for an event
+#
+#      return_data = {'name'        : string to identify the event,
+#                     'class'       : debug class,
+#                     'descriptor'  : event descriptor,
+#      <optional>     'vu_event'    : Unique Vendor ID,
+#      <optional>     'vu_string'   : String for vendor id}
+#
+def get_event(fifo_number, event_number, statistics, vu_event, mix):
+    if mix["cum weights"] is None:
+        function = event_functions[random.randint(0, len(event_functions) - 1)]
+    else:
+        function = random.choices(mix["functions"], cum_weights=mix["cum weights"])[0]
+
+    return function(fifo_number, event_number, statistics, vu_event, mix)
+
+
+# Number of events in a row that may not fit in a FIFO before an occupancy fill stops
+fill_attempts = 64
+
+# Save an event of a FIFO if it provides a string for the String log page
+#
+# Input:
+#         events      : Dictionary of the events saved for the FIFO
+#         string_keys : Set of the strings already provided by a saved event in the data area
+#         number      : Event number
+#         event       : Dictionary entry for the event
+#
+# Output: None
+#
+def add_fifo_event(events, string_keys, number, event):
+    keys = []
+    if event["class"] >= 0x80:
+        keys.append((event["class"], event["event id"]))
+    if "vu_string" in event:
+        keys.append((event["class"], "vu", event["vu_event"]))
+
+    # Only the first event with a given string is used to build the String log page, so the rest need not be kept
+    if not string_keys.issuperset(keys):
+        string_keys.update(keys)
+        events[number] = event
+
+
+# Generate the fifo information
+#
+# Input:
+#         ocp_data     : Parsed data read from JSON file
+#         statistics   : Dictionary of statistics
+#         occupancy    : Percentage of each FIFO to fill with events or None to use the JSON file
+#
+# Output: A dictionary entry for the fifos
+#
+#      {'Data Area 1' : {<FIFO #> : {'name'   : FIFO name,
+#                                    'Events' : {<event #> : {'name'        : string to identify the event, (only the events
+#                                                                                  providing a String log page entry)
+#                                                             'class'       : debug class,
+#                                                             'descriptor'  : event descriptor,
+#                                              <optional>     'vu_event'    : Unique Vendor ID,
+#                                              <optional>     'vu_string'   : String for vendor id}, ...},
+#                                    'area'   : bytearray of the events in the FIFO,
+#                                    'size'   : size of the FIFO in bytes (the area after the events is zero filled)}, ...},
+#       'Data Area 2' : {<FIFO #> : { ... }, ...}}
+#
+def get_fifo(ocp_data, statistics, occupancy=None):
+
+    vu_strings = {}
+
+    fifo = {"Data Area 1": {}, "Data Area 2": {}}
+
+    # Keys of the strings already provided by a kept event in each data area
+    string_keys = {"Data Area 1": set(), "Data Area 2": set()}
+
+    # Loop through the defined FIFO
+    for stat, stat_value in ocp_data["Debug FIFOs"].items():
+
+        # A FIFO with a size of zero does not exist
+        if stat_value["size"] <= 0:
+            continue
+
+        # Extract the FIF0 #
+        fifo_number = int(stat)
+
+        data_area_value = stat_value["Data Area"]
+        if (data_area_value < 0) or (data_area_value > 2):
+            sys.exit(f"FIFO '{stat_value['name']}' has invalid Data Area value of {data_area_value}")
+        data_area = f"Data Area {data_area_value}"
+
+        if stat not in fifo[data_area]:
+            fifo[data_area][stat] = {"Events": {}, "name": stat_value["name"]}
+
+        # The event mix of the FIFO overrides the entries of the event mix for all FIFOs
+        mix = get_event_mix({**ocp_data.get("Event Mix", {}), **stat_value.get("Event Mix", {})})
+
+        # The commandline occupancy overrides the occupancy of each FIFO
+        if occupancy is None:
+            fifo_occupancy = stat_value.get("Occupancy")
+        else:
+            fifo_occupancy = occupancy
+
+        # Loop through the events for this FIFO
+
+        fifo_area = bytearray()
+        if fifo_occupancy is None:
+            for x in range(stat_value["Max Events"]):
+
+                # Get an event
+                event = get_event(fifo_number, x, statistics, vu_strings, mix)
+
+                # Append the event to the FIFO, if there is room
+                if (len(event["descriptor"]) + len(fifo_area)) > stat_value["size"]:
+                    break
+
+                fifo_area += event["descriptor"]
+
+                add_fifo_event(fifo[data_area][stat]["Events"], string_keys[data_area], str(x), event)
+        else:
+            if (fifo_occupancy < 0) or (fifo_occupancy > 100):
+                sys.exit(f"FIFO '{stat_value['name']}' has invalid Occupancy value of {fifo_occupancy}")
+
+            # Keep adding events until the FIFO is packed to the occupancy. An event too large for the remaining
+            # space is dropped and another is tried.
+            fill_size = (stat_value["size"] * fifo_occupancy // 100) & ~3
+            x = 0
+            attempts = 0
+            while (len(fifo_area) < fill_size) and (attempts < fill_attempts):
+                event = get_event(fifo_number, x, statistics, vu_strings, mix)
+
+                if (len(event["descriptor"]) + len(fifo_area)) > fill_size:
+                    attempts += 1
+                    continue
+
+                fifo_area += event["descriptor"]
+
+                add_fifo_event(fifo[data_area][stat]["Events"], string_keys[data_area], str(x), event)
+                x += 1
+                attempts = 0
+
+        # The unused area of the FIFO is zero filled when it is written
+        fifo[data_area][stat]["area"] = fifo_area
+        fifo[data_area][stat]["size"] = stat_value["size"]
+
+    return fifo
+
+
+# Resize Data Area 2 and its FIFOs so the Telemetry log page is a given size
+#
+# Input:
+#         ocp_data     : Parsed data read from JSON file
+#         statistics   : Dictionary of statistics
+#         log_size     : Size in bytes of the Telemetry log page
+#
+# Output: None, the sizes in ocp_data are updated. The space in Data Area 2 after the statistics is split evenly
+#         between the Data Area 2 FIFOs.
+#
+def set_log_size(ocp_data, statistics, log_size):
+
+    if (log_size % 512) != 0:
+        sys.exit(f"Log size of {log_size} is not a multiple of 512")
+
+    fixed_size = 512 + ocp_data["Data Area 1"]["size"] + ocp_data["Data Area 3"]["size"] + ocp_data["Data Area 4"]["size"]
+    data_area_2_size = log_size - fixed_size
+    if data_area_2_size < len(statistics["Data Area 2 Table"]):
+        sys.exit(f"Log size of {log_size} is too small to include Data Area 1, 3, 4 and the Data Area 2 statistics")
+
+    ocp_data["Data Area 2"]["size"] = data_area_2_size
+
+    fifos = [value for value in ocp_data["Debug FIFOs"].values() if (value["Data Area"] == 2) and (value["size"] > 0)]
+    if len(fifos) > 0:
+        fifo_size = ((data_area_2_size - len(statistics["Data Area 2 Table"])) // len(fifos)) & ~3
+        for value in fifos:
+            value["size"] = fifo_size
+
+
+# Convert hex string to bytearray
+#
+# Input:
+#         string  : hex string
+#         bytes   : # of bytes in the string
+#         order   : 'little' or 'big'
+#
+# Output: bytearray of value of hex string
+#
+def hex_str_2_bytes(string, bytes, order):
+
+    hex_data = string.decode("hex")
+    return hex_data.to_bytes(bytes, order)
+
+
+# Generate the String Log
+#
+# Input:
+#         statistics   : Dictionary of statistics
+#         fifo         : FIFO information
+#
+# Output: Dictionary containing
+#
+#       {'size' : string_log_size,
+#        'log'  : string_log}
+#
+def generate_string_log(statistics, fifo):
+
+    strings = bytearray()
+    static_identifier_string_table = bytearray()
+    event_string_table = bytearray()
+    vu_event_header_string_table = bytearray()
+
+    stat_count = 0
+
+    # Loop through Data Area 1 statistics and build the list of table entries
+
+    print("Generating the Strings log page:")
+
+    print("\tBuilding Statistics Identifier String Table...")
+
+    table_data = {}
+
+    for _area in ["Data Area 1", "Data Area 2"]:
+        for _, stat_value in statistics[_area].items():
+            if stat_value["Identifier"] >= 0x8000:
+                # Build the Statics Identyifier string table entry
+                table_entry = bytearray()
+                identifier = stat_value["Identifier"]
+                table_entry += identifier.to_bytes(2, "little")
+                table_entry += (0).to_bytes(1, "little")
+                if len(stat_value["String"]) > 256:
+                    sys.exit(f"String too long : {stat_value['String']}")
+                table_entry += (len(stat_value["String"]) - 1).to_bytes(1, "little")
+                table_entry += (len(strings) // 4).to_bytes(8, "little")
+                table_entry += (0).to_bytes(4, "little")
+
+                id_string = stat_value["String"].encode()
+                strings += id_string
+                mod_num = len(id_string) % 4
+                if mod_num != 0:
+                    for x in range(4 - mod_num):
+                        strings += (0x20).to_bytes(1, "little")
+
+                table_data[hex(identifier)] = table_entry
+
+                stat_count += 1
+
+    # Now sort the statistics
+    identifier_list = []
+    for identifier in table_data:
+        identifier_list.append(int(identifier, 16))
+    identifier_list.sort()
+
+    for identifier in identifier_list:
+        static_identifier_string_table += table_data[hex(identifier)]
+
+    print("\tBuilding Vendor Uniquie Events String Table...")
+    vu_id_list = set()
+    table_data = {}
+    # Loop through Data Area 1 FIFOs and build the list of table entries for VUs
+    for _area in ["Data Area 1", "Data Area 2"]:
+        for _, stat_value in fifo[_area].items():
+            for _, event_value in stat_value["Events"].items():
+                if event_value["class"] >= 0x80:
+                    debug_class = event_value["class"]
+                    identifier = event_value["event id"]
+                    idx = hex(debug_class) + hex(identifier)
+
+                    # Add entry if not already added
+                    if idx not in vu_id_list:
+                        # Build the Event Identyifier string table entry
+                        table_entry = bytearray()
+                        table_entry += (debug_class).to_bytes(1, "little")
+                        table_entry += (identifier).to_bytes(2, "little")
+
+                        if len(event_value["name"]) > 256:
+                            sys.exit(f"String too long : {event_value['name']}")
+                        table_entry += (len(event_value["name"]) - 1).to_bytes(1, "little")
+                        table_entry += (len(strings) // 4).to_bytes(8, "little")
+                        table_entry += (0).to_bytes(4, "little")
+
+                        id_string = event_value["name"].encode()
+                        strings += id_string
+                        mod_num = len(id_string) % 4
+                        if mod_num != 0:
+                            for x in range(4 - mod_num):
+                                strings += (0x20).to_bytes(1, "little")
+
+                        if hex(debug_class) in table_data:
+                            table_data[hex(debug_class)][hex(identifier)] = table_entry
+                        else:
+                            table_data[hex(debug_class)] = {hex(identifier): table_entry}
+
+                        vu_id_list.add(idx)
+
+    # Now sort the Vendor Unique Events based on debug class then identifier
+    debug_class_list = []
+    for debug_class in table_data:
+        debug_class_list.append(int(debug_class, 16))
+    debug_class_list.sort()
+
+    for debug_class in debug_class_list:
+
+        identifier_list = []
+        for identifier in table_data[hex(debug_class)]:
+            identifier_list.append(int(identifier, 16))
+        identifier_list.sort()
+
+        for identifier in identifier_list:
+            event_string_table += table_data[hex(debug_class)][hex(identifier)]
+
+    print("\tBuilding Vendor Uniquie Event VU Header Data String Table...")
+
+    table_data = {}
+
+    # Loop through Data Area 1 FIFOs and build the list of table entries for VU data in OCP defined events
+    vu_header_ids = set()
+    for _area in ["Data Area 1", "Data Area 2"]:
+        for _, stat_value in fifo[_area].items():
+            for _, event_value in stat_value["Events"].items():
+                if event_value["class"] < 9:
+                    if "vu_string" in event_value:
+                        class_type = event_value["class"]
+                        vu_identifier = event_value["vu_event"]
+
+                        # only build it is not already built
+                        idx = hex(class_type) + hex(vu_identifier)
+                        if idx not in vu_header_ids:
+
+                            # Build the VU Event Data Header table entry
+                            table_entry = bytearray()
+                            table_entry = (class_type).to_bytes(1, "little")
+                            table_entry += (vu_identifier).to_bytes(2, "little")
+                            if len(event_value["vu_string"]) > 256:
+                                sys.exit(f"VU Event String  too long : {event_value['vu_string']}")
+                            table_entry += (len(event_value["vu_string"]) - 1).to_bytes(1, "little")
+                            table_entry += (len(strings) // 4).to_bytes(8, "little")
+                            table_entry += (0).to_bytes(4, "little")
+
+                            id_string = event_value["vu_string"].encode()
+                            strings += id_string
+                            mod_num = len(id_string) % 4
+                            if mod_num != 0:
+                                for x in range(4 - mod_num):
+                                    strings += (0x20).to_bytes(1, "little")
+
+                            if hex(class_type) in table_data:
+                                table_data[hex(class_type)][hex(vu_identifier)] = table_entry
+                            else:
+                                table_data[hex(class_type)] = {hex(vu_identifier): table_entry}
+
+                            if len(table_entry) != 16:
+                                sys.exit("VU Event table entry not the proper size")
+
+                            vu_header_ids.add(idx)
+
+    # Now sort the Vendor Unique VU Headers based on debug class then identifier
+    debug_class_list = []
+    for debug_class in table_data:
+        debug_class_list.append(int(debug_class, 16))
+    debug_class_list.sort()
+
+    for debug_class in debug_class_list:
+
+        identifier_list = []
+        for identifier in table_data[hex(debug_class)]:
+            identifier_list.append(int(identifier, 16))
+        identifier_list.sort()
+
+        for identifier in identifier_list:
+            vu_event_header_string_table += table_data[hex(debug_class)][hex(identifier)]
+
+    print("\tBuilding String log header...")
+
+    hdr_sze = 432
+
+    string_log = bytearray()
+    string_log += (1).to_bytes(1, "little")                                                     #     0     Log Version
+    string_log += (0).to_bytes(15, "little")                                                    #  15:1     Reserevd
+    string_log += (0xB13A83691A8F408B9EA495940057AA44).to_bytes(16, "little")
+
+    string_log_size = hdr_sze
+    string_log_size += len(static_identifier_string_table)
+    string_log_size += len(event_string_table)
+    string_log_size += len(vu_event_header_string_table)
+    string_log_size += len(strings)
+
+    string_log += (string_log_size // 4).to_bytes(8, "little")                                  #  39:32    String Log Size
+    string_log += bytearray(24)                                                                 #  63:40    Reserevd
+
+    string_log += (hdr_sze // 4).to_bytes(8, "little")                                          #  71:64    Statistics Ident Start
+    string_log += (len(static_identifier_string_table) // 4).to_bytes(8, "little")              #  79:72    Statistics Ident Size
+    string_log += ((hdr_sze + len(static_identifier_string_table)) // 4).to_bytes(8, "little")  #  87:80    Event Ident Start
+    string_log += (len(event_string_table) // 4).to_bytes(8, "little")                          #  95:88    Event Ident Size
+    string_log += ((hdr_sze + len(static_identifier_string_table) + len(event_string_table)) // 4).to_bytes(
+        8, "little"
+    )                                                                                           # 103:96    VU Event Ident Start
+    string_log += (len(vu_event_header_string_table) // 4).to_bytes(8, "little")                # 111:104    VU Event Ident Size
+    string_log += (
+        (
+            hdr_sze
+            + len(static_identifier_string_table)
+            + len(event_string_table)                                                           # 119:112   ASCII Start
+            + len(vu_event_header_string_table)
+        )
+        // 4
+    ).to_bytes(8, "little")
+    string_log += (len(strings) // 4).to_bytes(8, "little")                                     # 127:120   ASCII table size
+
+    # Build the FIFO name list                                                                  # 383:128   FIFO names[1:16]
+    for x in range(1, 17):
+        if str(x) in fifo["Data Area 1"]:
+            name = fifo["Data Area 1"][str(x)]["name"]
+        elif str(x) in fifo["Data Area 2"]:
+            name = fifo["Data Area 2"][str(x)]["name"]
+        else:
+            name = ""
+
+        if len(name) > 16:
+            sys.exit(f"FIFO {x} name is more than 16 characters: {name}")
+        name_array = bytearray(name.encode("utf-8"))
+        if len(name) != 16:
+            name_array += bytearray(16 - len(name))
+        string_log += name_array
+
+    string_log += bytearray(431 - 384 + 1)                                                      # 431:384   Reserved
+    print(f"\tStatistics Start : {len(string_log)} (0x{len(string_log) // 4:x})")
+    string_log += static_identifier_string_table
+    print(f"\tEvent Start : {len(string_log)} (0x{len(string_log) // 4:x})")
+    string_log += event_string_table
+    print(f"\tVU Event Start : {len(string_log)} (0x{len(string_log) // 4:x})")
+    string_log += vu_event_header_string_table
+    print(f"\tASCII Start : {len(string_log)} (0x{len(string_log) // 4:x})")
+    string_log += strings
+    print(f"\tString log size : {len(string_log)} (0x{len(string_log) // 4:x})")
+
+    return {"size": string_log_size, "log": string_log}
+
+
+# Get FIFO Data Area location
+#
+# Input:
+#         fifo         : FIFO information
+#         fifo_num     : FIFO number
+#
+# Output: Data Area location (i.e, 1 or 2) or 0 to mean FIFO does not exist
+#
+def get_fifo_location(fifo, fifo_num):
+
+    if str(fifo_num) in fifo["Data Area 1"]:
+        data_location = 1
+    elif str(fifo_num) in fifo["Data Area 2"]:
+        data_location = 2
+    else:
+        data_location = 0
+    return int(data_location)
+
+
+# Get FIFO start and end locations of the fifo
+#
+# Input:
+#         statistics   : Dictionary of statistics
+#         fifo         : FIFO information
+#         fifo_num     : FIFO number
+#
+# Output: Touple of (start, size) in dwords
+#
+def get_fifo_start_end(statistics, fifo, fifo_num):
+
+    # FIFOs are place in order in each data area after the statistics
+
+    # Determine the data area
+    if str(fifo_num) in fifo["Data Area 1"]:
+        data_area = "Data Area 1"
+        offset = 1536 + len(statistics["Data Area 1 Table"])  # from the start of the log page
+    elif str(fifo_num) in fifo["Data Area 2"]:
+        data_area = "Data Area 2"
+        offset = len(statistics["Data Area 2 Table"])
+    else:
+        # Does not exist so clear the data;
+        return (0, 0)
+
+    # Add in the size of the statistics area
+
+    # Loop through the FIFO's in order and determine the start and end sizes
+    if fifo_num > 1:
+        for x in range(1, fifo_num):
+            fifo_str = str(x)
+            if fifo_str in fifo[data_area]:
+                offset += fifo[data_area][fifo_str]["size"]
+
+    start = offset // 4
+    size = fifo[data_area][str(fifo_num)]["size"]
+
+    return (start, size)
+
+
+# Generate a dummy SMART / Information log page 02h
+#
+# Input: None
+#
+# Output: bytearray containing a dummy dummy SMART / Information log page 02h
+#
+def get_log_02():
+
+    data = bytearray()
+    data += random.randint(0, (2 ** 6) - 1).to_bytes(1, "little")        #     000  Critical Warning
+    data += random.randint(255, 305).to_bytes(2, "little")               # 002:001  Composite (0F to 90F)
+    data += random.randint(0, 100).to_bytes(1, "little")                 #     003  Available spare
+    data += random.randint(0, 100).to_bytes(1, "little")                 #     004  Available spare threshold
+    data += random.randint(0, 100).to_bytes(1, "little")                 #     005  percentage used
+    data += bytearray(1)                                                 #     006  Endurance Group Critical Warning
+    data += bytearray(25)                                                # 031:007  Resereved
+    data += random.randint(0, 2 ** (16 * 8) - 1).to_bytes(16, "little")  # 047:032  Data Units Read
+    data += random.randint(0, 2 ** (16 * 8) - 1).to_bytes(16, "little")  # 063:048  Data Units Written
+    data += random.randint(0, 2 ** (16 * 8) - 1).to_bytes(16, "little")  # 079:064  Host Read Commands
+    data += random.randint(0, 2 ** (16 * 8) - 1).to_bytes(16, "little")  # 095:080  Host Write Commands
+    data += random.randint(0, 2 ** (16 * 8) - 1).to_bytes(16, "little")  # 111:096  Host Busy time
+    data += random.randint(0, 2 ** (16 * 8) - 1).to_bytes(16, "little")  # 127:112  Power Cycles
+    data += random.randint(0, 2 ** (16 * 8) - 1).to_bytes(16, "little")  # 143:128  Power On Hours
+    data += random.randint(0, 2 ** (16 * 8) - 1).to_bytes(16, "little")  # 159:144  Unsafe Shutdown
+    data += random.randint(0, 2 ** (16 * 8) - 1).to_bytes(16, "little")  # 175:160  Media and Data Integrity Errors
+    data += random.randint(0, 2 ** (16 * 8) - 1).to_bytes(16, "little")  # 191:176  Error Information Entries
+    data += random.randint(0, 2 ** (4 * 8) - 1).to_bytes(4, "little")    # 195:192  Warning Composite Temperate Time
+    data += random.randint(0, 2 ** (4 * 8) - 1).to_bytes(4, "little")    # 199:196  Critical Composite Temperate Time
+    data += random.randint(255, 305).to_bytes(2, "little")               # 201:200  Temperature Sensor 1
+    data += random.randint(255, 305).to_bytes(2, "little")               # 203:202  Temperature Sensor 2
+    data += random.randint(255, 305).to_bytes(2, "little")               # 205:204  Temperature Sensor 3
+    data += random.randint(255, 305).to_bytes(2, "little")               # 207:206  Temperature Sensor 4
+    data += random.randint(255, 305).to_bytes(2, "little")               # 209:208  Temperature Sensor 5
+    data += random.randint(255, 305).to_bytes(2, "little")               # 211:210  Temperature Sensor 6
+    data += random.randint(255, 305).to_bytes(2, "little")               # 213:212  Temperature Sensor 7
+    data += random.randint(255, 305).to_bytes(2, "little")               # 215:214  Temperature Sensor 8
+    data += random.randint(0, 2 ** (4 * 8) - 1).to_bytes(4, "little")    # 219:216  Thermal Management Temperature 1 Transition Count
+    data += random.randint(0, 2 ** (4 * 8) - 1).to_bytes(4, "little")    # 223:220  Thermal Management Temperature 2 Transition Count
+    data += random.randint(0, 2 ** (4 * 8) - 1).to_bytes(4, "little")    # 227:224  Total Time For Thermal Management Temperature 1
+    data += random.randint(0, 2 ** (4 * 8) - 1).to_bytes(4, "little")    # 231:228  Total Time For Thermal Management Temperature 2
+    data += bytearray(280)                                               # 511:232  Reserved
+
+    if len(data) != 512:
+        sys.exit(f"SMART / Health Information log page 02h wrong size: {len(data)}")
+
+    return data
+
+
+# Generate a dummy SMART / Health Information Extentipon log page C0h
+#
+# Input: None
+#
+# Output: bytearray containing a dummy dummy SMART / Information Extentipon log page C0h
+#
+def get_log_c0():
+    data = bytearray()
+    data += random.randint(0, 2 ** (16 * 8) - 1).to_bytes(16, "little")     # 015:000 Physical Media Units Written
+    data += random.randint(0, 2 ** (16 * 8) - 1).to_bytes(16, "little")     # 031:016 Physical Media Units Read
+    data += random.randint(0, 2 ** (4 * 8) - 1).to_bytes(6, "little")       # 037:032 Bad User NAND Blocks Raw Count
+    data += random.randint(0, 100).to_bytes(2, "little")                    # 039:038 Bad User NAND Blocks Normalized value
+    data += random.randint(0, 2 ** (4 * 8) - 1).to_bytes(6, "little")       # 045:040 Bad System NAND Blocks Raw Count
+    data += random.randint(0, 100).to_bytes(2, "little")                    # 047:046 Bad System NAND Blocks Normalized value
+    data += random.randint(0, 2 ** (8 * 8) - 1).to_bytes(8, "little")       # 055:048 XOR Recovery Count
+    data += random.randint(0, 2 ** (8 * 8) - 1).to_bytes(8, "little")       # 063:056 Uncorrectable Read Error Count
+    data += random.randint(0, 2 ** (8 * 8) - 1).to_bytes(8, "little")       # 071:064 Soft ECC Error Count
+    data += random.randint(0, 2 ** (8 * 8) - 1).to_bytes(8, "little")       # 079:072 End to End Correction Counts
+    data += random.randint(0, 2 ** (1 * 8) - 1).to_bytes(1, "little")       #     080 System Data % Used
+    data += random.randint(0, 2 ** (7 * 8) - 1).to_bytes(7, "little")       # 087:081 System Data % Used
+    data += random.randint(0, 2 ** (8 * 8) - 1).to_bytes(8, "little")       # 095:088 User Data Erase Counts
+    data += random.randint(0, 2 ** (1 * 8) - 1).to_bytes(1, "little")       #     096 Thermal Throttling Count
+    data += random.randint(0, 3).to_bytes(1, "little")                      #     097 Thermal Throttling Status
+    data += (0).to_bytes(1, "little")                                       #     098 DSSD Specification Version Errata
+    data += (0).to_bytes(2, "little")                                       # 100:099 DSSD Specification Version Point Version
+    data += (5).to_bytes(2, "little")                                       # 102:101 DSSD Specification Version Minor Version
+    data += (2).to_bytes(1, "little")                                       #     103 DSSD Specification Version Major Version
+    data += random.randint(0, 2 ** (8 * 8) - 1).to_bytes(8, "little")       # 111:104 PCIe Correctable Error Count
+    data += random.randint(0, 2 ** (4 * 8) - 1).to_bytes(4, "little")       # 115:112 Incomplete Shutdowns
+    data += bytearray(4)                                                    # 119:116 Reserved
+    data += random.randint(0, 100).to_bytes(1, "little")                    #     120 % Free Blocks
+    data += bytearray(7)                                                    # 127:121 Reserved
+    data += random.randint(0, 2 ** (2 * 8) - 1).to_bytes(2, "little")       # 129:128 Capacitor Health
+    data += (99).to_bytes(1, "little")                                      #     130 NVMe Errata Version 'c'
+    data += bytearray(5)                                                    # 135:131 Reserved
+    data += random.randint(0, 2 ** (8 * 8) - 1).to_bytes(8, "little")       # 143:136 Unaligned I/O
+    data += random.randint(0, 2 ** (8 * 8) - 1).to_bytes(8, "little")       # 151:144 Security Version Number
+    data += random.randint(0, 2 ** (8 * 8) - 1).to_bytes(8, "little")       # 159:152 Total NUSE
+    data += random.randint(0, 2 ** (16 * 8) - 1).to_bytes(16, "little")     # 175:160 PLP Start Count
+    data += random.randint(0, 2 ** (16 * 8) - 1).to_bytes(16, "little")     # 191:176 Endurance Estimate
+    data += random.randint(0, 2 ** (8 * 8) - 1).to_bytes(8, "little")       # 199:192 PCIe Link Retraining Count
+    data += random.randint(0, 2 ** (8 * 8) - 1).to_bytes(8, "little")       # 207:200 Power State Change Count
+    data += random.randint(0, 2 ** (16 * 8) - 1).to_bytes(16, "little")     # 223:208 Hardware Version
+    data += bytearray(493 - 224 + 1)                                        # 493:224 Reserved
+    data += (3).to_bytes(2, "little")                                       # 495:494 Log Page Version
+    data += int(0xAFD514C97C6F4F9CA4F2BFEA2810AFC5).to_bytes(16, "little")  # 511:496 Log PAge GUID
+    if len(data) != 512:
+        sys.exit("SMART / Health Information Extension log page C0h wrong size")
+    return data
+
+
+# Generate Data Area 1
+#
+# Input:
+#         ocp_data        : Parsed data read from JSON file
+#         statistics      : Dictionary of statistics
+#         fifo            : FIFO information
+#         string_log_size : string log size in bytes
+#
+# Output: List of (data, size) segments making up Data Area 1 where the bytes after data in each segment are zero
+#
+def generate_data_area_1(ocp_data, statistics, fifo, string_log_size):
+    print("Generating Data Area 1:")
+
+    if ocp_data["size"] <= 1028:
+        sys.exit("Data Area 1 Size too small as it must be larger than 2048 bytes")
+
+    data_area_1 = bytearray()
+    print(f"\tData Area 1 Header Offset : 0x{len(data_area_1):x}")
+    data_area_1 += (3).to_bytes(2, "little")                                          #   1:0     Major Version
+    data_area_1 += (1).to_bytes(2, "little")                                          #   3:2     minor Version
+    data_area_1 += (0).to_bytes(4, "little")                                          #   7:4     Resereved
+    nvme_timestamp(data_area_1)                                                       #  15:8     Timestamp
+    data_area_1 += int(0xBA560A9C3043424CBC73719D87E64EFA).to_bytes(16, "little")     #  31:16    GUID
+    number_profiles = random.randint(2, 10)
+    data_area_1 += number_profiles.to_bytes(1, "little")                              #     32    Profiles
+    data_area_1 += random.randint(1, number_profiles).to_bytes(1, "little")           #     33    Profile Selected
+    data_area_1 += (0).to_bytes(6, "little")                                          #  39:34    Reserved
+    data_area_1 += (string_log_size // 4).to_bytes(8, "little")                       #  47:40    Strng Log Size
+    data_area_1 += (0).to_bytes(8, "little")                                          #  55:48    Reserved
+
+    fw_verison_str = "FIRM: XX"
+    data_area_1 += fw_verison_str.encode()                                            #   63:56   FW Version string
+    data_area_1 += (0).to_bytes(32, "little")                                         #   95:64   Reserved
+    data_area_1 += (2048 // 4).to_bytes(8, "little")                                  #  103:96   Data Area 1 Statistics start
+    data_area_1 += (len(statistics["Data Area 1 Table"]) // 4).to_bytes(8, "little")  #  111:104  Data Area 1 Statistics size
+    data_area_1 += (0).to_bytes(8, "little")                                          #  119:112  Data Area 2 Statistics start
+    data_area_1 += (len(statistics["Data Area 2 Table"]) // 4).to_bytes(8, "little")  #  127:120  Data Area 2 Statistics size
+    data_area_1 += (0).to_bytes(32, "little")                                         #  159:128  Reserved
+
+    for x in range(1, 17):
+        data_area_1 += get_fifo_location(fifo, x).to_bytes(1, "little")               #  175:160  FIFO 1 location
+
+    for x in range(1, 17):
+        (start, size) = get_fifo_start_end(statistics, fifo, x)
+        data_area_1 += start.to_bytes(8, "little")                                    #  431:176  FIFO 1 dw start/size
+        data_area_1 += (size // 4).to_bytes(8, "little")
+
+    data_area_1 += bytearray(80)                                                      #  511:432  FIFO 15 dw end
+
+    log_page = get_log_02()
+    print(f"\t\tSmart / Health Information log page Offset : 0x{len(data_area_1):x} (Length : 0x{len(log_page):x})")
+    data_area_1 += log_page                                                           # 1023:512  SMART / Health log page (02h)
+
+    log_page = get_log_c0()
+    print(f"\t\tSmart / Health Information Extended log page Offset : 0x{len(data_area_1):x} (Length : 0x{len(log_page):x})")
+    data_area_1 += log_page                                                           # 1535:1024 SMART / Health Extended log page (C0h)
+
+    print(f"\t\tData Area 1 Header Size : {len(data_area_1)} (0x{len(log_page):x})")
+
+    if ocp_data["size"] < len(data_area_1) + len(statistics["Data Area 1 Table"]):
+        sys.exit("Data Area 1 Size too small to include statistics area")
+
+    print(f"\tStatistics Table Offset : 0x{len(data_area_1):x} (Length : 0x{len(statistics['Data Area 1 Table']):x})")
+    data_area_1 += statistics["Data Area 1 Table"]
+
+    segments = [(data_area_1, len(data_area_1))]
+    offset = len(data_area_1)
+
+    for x in range(1, 17):
+        fifo_str = str(x)
+        if fifo_str in fifo["Data Area 1"]:
+            fifo_size = fifo["Data Area 1"][fifo_str]["size"]
+            if ocp_data["size"] < offset + fifo_size:
+                sys.exit(f"Data Area 1 Size too small to include FIFO {x}")
+
+            print(f"\tFIFO {fifo_str} Offset : 0x{offset:x} (Length : 0x{fifo_size:x})")
+            segments.append((fifo["Data Area 1"][fifo_str]["area"], fifo_size))
+            offset += fifo_size
+
+    # zero fill the remainder of Data Area 1
+    if ocp_data["size"] > offset:
+        print(f"\tZero Fill Offset : 0x{offset:x} (Length : 0x{ocp_data['size'] - offset:x})")
+        segments.append((bytearray(), ocp_data["size"] - offset))
+
+    print(f"\tData Area 1 Length: {ocp_data['size']} (0x{ocp_data['size']:x})")
+
+    return segments
+
+
+# Generate Data Area 2
+#
+# Input:
+#         ocp_data     : Parsed data read from JSON file
+#         statistics   : Dictionary of statistics
+#         fifo         : FIFO information
+#
+# Output: List of (data, size) segments making up Data Area 2 where the bytes after data in each segment are zero
+#
+def generate_data_area_2(ocp_data, statistics, fifo):
+
+    print("Generating Data Area 2:")
+
+    # statistics
+    data_area_2 = bytearray()
+
+    print(f"\tStatistics Table Offset : 0x{len(data_area_2):x} (Length : 0x{len(statistics['Data Area 2 Table']):x})")
+    if ocp_data["size"] < len(statistics["Data Area 2 Table"]):
+        sys.exit("Data Area 2 Size too small to include statistics area")
+
+    data_area_2 += statistics["Data Area 2 Table"]
+
+    segments = [(data_area_2, len(data_area_2))]
+    offset = len(data_area_2)
+
+    for x in range(1, 17):
+        idx = str(x)
+        if idx in fifo["Data Area 2"]:
+            fifo_size = fifo["Data Area 2"][idx]["size"]
+            if ocp_data["size"] < offset + fifo_size:
+                sys.exit(f"Data Area 2 Size too small to include FIFO {x}")
+
+            print(f"\tFIFO {idx} Offset : 0x{offset:x} (Length : 0x{fifo_size:x})")
+            segments.append((fifo["Data Area 2"][idx]["area"], fifo_size))
+            offset += fifo_size
+
+    # zero fill the remainder of the data area
+    if ocp_data["size"] > offset:
+        print(f"\tZero Fill Offset : 0x{offset:x} (Length : 0x{ocp_data['size'] - offset:x})")
+        segments.append((bytearray(), ocp_data["size"] - offset))
+
+    print(f"\tData Area 2 Length: {ocp_data['size']} (0x{ocp_data['size']:x})")
+    return segments
+
+
+# Need a defult JSON file if the user does not specify a --telemetry option
+json_default = "ocp_debug.json"
+
+# Time and allocations of each generation phase when benchmarking, or None when not benchmarking
+#
+#      phase_stats = {<phase name> : {'seconds'   : [elapsed time of each run],
+#                                     'allocated' : bytes still allocated at the end of the phase (traced runs only),
+#                                     'peak'      : peak bytes allocated during the phase (traced runs only)}}
+phase_stats = None
+
+
+# Record the time and allocations of a generation phase in phase_stats
+#
+# Input:
+#         name : Name of the phase. A phase entered more than once in a run is summed.
+#
+# Output: None
+#
+@contextmanager
+def timed_phase(name):
+
+    if phase_stats is None:
+        yield
+        return
+
+    import tracemalloc
+
+    tracing = tracemalloc.is_tracing()
+    if tracing:
+        tracemalloc.reset_peak()
+        start_memory = tracemalloc.get_traced_memory()[0]
+
+    start = perf_counter()
+    yield
+    elapsed = perf_counter() - start
+
+    stat = phase_stats.setdefault(name, {"seconds": [], "allocated": 0, "peak": 0, "run": None})
+    if stat["run"] == phase_run:
+        stat["seconds"][-1] += elapsed
+    else:
+        stat["seconds"].append(elapsed)
+        stat["run"] = phase_run
+
+    if tracing:
+        current_memory, peak_memory = tracemalloc.get_traced_memory()
+        stat["allocated"] += current_memory - start_memory
+        stat["peak"] = max(stat["peak"], peak_memory - start_memory)
+
+
+# Benchmark run number used to sum a phase entered more than once in a run
+phase_run = 0
+
+
+# Generate the Telemetry log page and the OCP Strings log page
+#
+# Input:
+#         ocp_debug_data : Parsed data read from JSON file
+#         telemetry_file : Telemetry log page filename
+#         string_file    : OCP Strings log page filename
+#         controller     : True to generate a Telemetry Controller-Initiated log page
+#         occupancy      : Percentage of each FIFO to fill with events or None to use the JSON file
+#         log_size       : Size in bytes of the Telemetry log page or None to use the JSON file
+#
+# Output: None
+#
+def generate_logs(ocp_debug_data, telemetry_file, string_file, controller, occupancy, log_size):
+
+    # initilize the fake timestamp
+    global_time = ocp_debug_data["Timestamp"]
+
+    # Fix variables that have limitations per the spec.
+    if ("Host Write Bandwidth" in ocp_debug_data["Statistics"]["OCP Defined"]) and (
+        "GC Write Bandwidth" in ocp_debug_data["Statistics"]["OCP Defined"]
+    ):
+
+        # Pick the value
+        host_value = random.randint(
+            ocp_debug_data["Statistics"]["OCP Defined"]["Host Write Bandwidth"]["Value Min"],
+            ocp_debug_data["Statistics"]["OCP Defined"]["Host Write Bandwidth"]["Value Max"],
+        )
+        gc_value = 100 - host_value
+
+        # Validate the value
+        if (gc_value < ocp_debug_data["Statistics"]["OCP Defined"]["GC Write Bandwidth"]["Value Min"]) or (
+            gc_value > ocp_debug_data["Statistics"]["OCP Defined"]["GC Write Bandwidth"]["Value Max"]
+        ):
+            sys.exit("Statistics 'Host Write Bandwidth' and 'GC Write Bandwidth' min\/max value range error")
+
+        # Save the selected values
+        ocp_debug_data["Statistics"]["OCP Defined"]["Host Write Bandwidth"]["Value Min"] = host_value
+        ocp_debug_data["Statistics"]["OCP Defined"]["Host Write Bandwidth"]["Value Max"] = host_value
+        ocp_debug_data["Statistics"]["OCP Defined"]["GC Write Bandwidth"]["Value Min"] = gc_value
+        ocp_debug_data["Statistics"]["OCP Defined"]["GC Write Bandwidth"]["Value Max"] = gc_value
+
+    # Generate the statistics information
+    with timed_phase("get_statistics"):
+        statistics = get_statistics(ocp_debug_data)
+
+    # Resize Data Area 2 to reach the requested log page size
+    if log_size != None:
+        set_log_size(ocp_debug_data, statistics, log_size)
+
+    # Generate the Fifo Information
+    with timed_phase("get_fifo"):
+        fifo = get_fifo(ocp_debug_data, statistics, occupancy)
+
+    # The only difference between the Telemetry Host-Initiated log page and the Telemetry COntroller-Initiated log page
+    # if the header.
+    header = nvme_telemetry_host_controller_initiated_header(
+        ocp_debug_data["Data Area 1"]["size"],
+        ocp_debug_data["Data Area 2"]["size"],
+        ocp_debug_data["Data Area 3"]["size"],
+        ocp_debug_data["Data Area 4"]["size"],
+        controller,
+    )
+
+    # Generate the strings log page
+    with timed_phase("generate_string_log"):
+        string_log = generate_string_log(statistics, fifo)
+
+    # Need to generate Data Area 2 before Data Area 1 as data from Data Area 2 exists in data area 1
+    with timed_phase("generate_data_area_2"):
+        data_area_2 = generate_data_area_2(ocp_debug_data["Data Area 2"], statistics, fifo)
+    with timed_phase("generate_data_area_1"):
+        data_area_1 = generate_data_area_1(ocp_debug_data["Data Area 1"], statistics, fifo, string_log["size"])
+
+    # Compute the offsets to each data area relative to the Telemetry Host-Initiated log page
+    data_area_1_offset = len(header)
+    data_area_2_offset = data_area_1_offset + ocp_debug_data["Data Area 1"]["size"]
+    data_area_3_offset = data_area_2_offset + ocp_debug_data["Data Area 2"]["size"]
+    data_area_4_offset = data_area_3_offset + ocp_debug_data["Data Area 3"]["size"]
+    telemetry_size = data_area_4_offset + ocp_debug_data["Data Area 4"]["size"]
+
+    # Print the offsets which are very helpful for debugging this script
+    print("\nBuilding NVMe Host-Initiated Telemetry log page:")
+    print(f"\tHeader Start : 0x{0:x}")
+    print(f"\tData Area 1 : 0x{data_area_1_offset:x}")
+    print(f"\tData Area 2 : 0x{data_area_2_offset:x}")
+    if data_area_3_offset > data_area_2_offset:
+        print(f"\tData Area 3 : 0x{data_area_3_offset:x}")
+    else:
+        print("\tData Area 3 : Does not exist")
+    if telemetry_size > data_area_4_offset:
+        print(f"\tData Area 4 : 0x{data_area_4_offset:x}")
+    else:
+        print("\tData Area 4 : Does not exist")
+
+    # Write the Telemetry Host-Initiated log page. Data Area 3 and Data Area 4 are random data generated a chunk
+    # at a time so the memory used does not depend on the size of the log page.
+    with timed_phase("write"), open(telemetry_file, "wb") as f:
+        f.write(header)
+        write_segments(f, data_area_1)
+        write_segments(f, data_area_2)
+        write_random_data_area(f, 3, ocp_debug_data["Data Area 3"]["size"])
+        write_random_data_area(f, 4, ocp_debug_data["Data Area 4"]["size"])
+
+        # Extend the file over any trailing sparse hole
+        f.truncate(telemetry_size)
+
+    # Write the OCP Strings log page (log identifier C9h)
+    with timed_phase("write"), open(string_file, "wb") as f:
+        f.write(string_log["log"])
+        f.close()
+
+
+# Benchmark configuration presets. The Random Fields, Random Data Area and FIFO Occupancy values override the sample JSON
+# and the Log Size sets the size of the Telemetry log page.
+benchmark_presets = {
+    "sample": {},
+    "packed": {"Occupancy": 100, "Log Size": 1024 * 1024},
+    "vu-32k": {"Random Fields": 32000, "Random Data Area": 2, "Occupancy": 100, "Log Size": 4 * 1024 * 1024},
+}
+
+
+# Benchmark the generation of the log pages for a set of configuration presets
+#
+# Input:
+#         presets        : list of benchmark preset names
+#         count          : number of log pages to generate for each preset
+#         seed           : random seed of the first log page. Each log page uses the next seed.
+#         telemetry_file : Telemetry log page filename
+#         string_file    : OCP Strings log page filename
+#         output         : JSON filename to save the results or None
+#         allocations    : True to measure the allocations of each phase
+#
+# Output: None, the time and, if measured, the allocations of each phase are printed. The allocations are from an
+#         additional run with tracemalloc enabled, which is much slower than the timed runs and is not included in the
+#         times.
+#
+def run_benchmark(presets, count, seed, telemetry_file, string_file, output, allocations):
+    global phase_stats
+    global phase_run
+
+    import tracemalloc
+    from statistics import median
+
+    results = {}
+    for preset in presets:
+        settings = benchmark_presets[preset]
+
+        phase_stats = {}
+        totals = []
+        for run in range(count + 1 if allocations else count):
+            ocp_data = json.loads(get_sample_json())
+            if "Random Fields" in settings:
+                ocp_data["Statistics"]["Vendor Defined"]["Random Fields"] = settings["Random Fields"]
+            if "Random Data Area" in settings:
+                ocp_data["Statistics"]["Vendor Defined"]["Random Data Area"] = settings["Random Data Area"]
+
+            # The last run is traced for the allocations and is not included in the times
+            traced = run == count
+            if traced:
+                timed = phase_stats
+                phase_stats = {name: {"seconds": [], "allocated": 0, "peak": 0, "run": None} for name in timed}
+                tracemalloc.start()
+
+            random.seed(seed + run)
+            phase_run = run
+            start = perf_counter()
+            with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+                generate_logs(ocp_data, telemetry_file, string_file, False, settings.get("Occupancy"), settings.get("Log Size"))
+            elapsed = perf_counter() - start
+
+            if traced:
+                tracemalloc.stop()
+                for name, stat in timed.items():
+                    stat["allocated"] = phase_stats[name]["allocated"]
+                    stat["peak"] = phase_stats[name]["peak"]
+                phase_stats = timed
+            else:
+                totals.append(elapsed)
+
+        result = {
+            "logs": count,
+            "seconds": sum(totals),
+            "logs/s": count / sum(totals),
+            "telemetry size": os.path.getsize(telemetry_file),
+            "string size": os.path.getsize(string_file),
+            "phases": {},
+        }
+        for name, stat in phase_stats.items():
+            result["phases"][name] = {"median seconds": median(stat["seconds"]), "share": sum(stat["seconds"]) / sum(totals)}
+            if allocations:
+                result["phases"][name]["allocated"] = stat["allocated"]
+                result["phases"][name]["peak"] = stat["peak"]
+        results[preset] = result
+
+        print(f"\nPreset '{preset}': {count} logs in {result['seconds']:.3f}s ({result['logs/s']:.2f} logs/s)")
+        print(f"\tTelemetry log page size : {result['telemetry size']}")
+        print(f"\tStrings log page size   : {result['string size']}")
+        if allocations:
+            print("\tAllocations are from one more run with tracemalloc, which is not included in the times")
+            print(f"\t{'Phase':<24}{'Median (s)':>12}{'Share':>8}{'Allocated':>14}{'Peak':>14}")
+        else:
+            print("\tAllocations are not measured, use --allocations to measure them in one more run")
+            print(f"\t{'Phase':<24}{'Median (s)':>12}{'Share':>8}")
+        for name, phase in result["phases"].items():
+            text = f"\t{name:<24}{phase['median seconds']:>12.4f}{phase['share']:>8.1%}"
+            if allocations:
+                text += f"{phase['allocated']:>14}{phase['peak']:>14}"
+            print(text)
+
+    phase_stats = None
+
+    if output != None:
+        with open(output, "w") as f:
+            json.dump({"version": version, "seed": seed, "allocations": allocations, "presets": results}, f, indent=4)
+        print(f"\nResults written to {output}")
+
+
+# Parse the input parameters
+#
+# Input:
+#         argv : list of commandline arguments or None to use sys.argv
+#
+# Output: Input parameters
+#
+def parse_inputs(argv=None):
+    import argparse
+
+    telemetry_default = "telemetry.bin"
+    string_default = "string.bin"
+    json_default = "ocp_debug.json"
+
+    # Add the agruments
+    parser = argparse.ArgumentParser(
+        prog="ocp_generate_nvme_telemtry.py",
+        description="This script uses a JSON file to define the settings for generating an NVMe(TM) Telemetry log page  "
+        " and a OCP Strings log page based on the OCP Datacenter NVMe SSD specification " + ocp_ver + ". A sample JSON file can be "
+        " generated using the -g option. If a JSON file is not specified, then information from the sample JSON file is used. "
+        " This script by default generates an NVMe(TM) Telemetry Host-Initiated log page but the --controller (-c) "
+        " commandline argument causes an NVMe(TM) Telemetry Controller-Initiated log page to be generated.",
+        epilog="The generated Telemetry Host-Initiated log page while formated per the specifications contains random information.",
+    )
+
+    parser.add_argument(
+        "-j",
+        "--json",
+        type=str,
+        dest="json",
+        required=False,
+        metavar="<filename>",
+        help="Specify JSON filename\n\n"
+        + "If -g is specified on the commandline, then this defines the"
+        + "output filename to contain a sample JSON file. If -g is not "
+        + "specified on the commandline, then this defines the input filename "
+        + json_default
+        + "to contain a JSON file used to create the Telemetry and OCP Strings log pages.",
+    )
+    parser.add_argument(
+        "-c",
+        "--controller",
+        action="store_true",
+        default=False,
+        dest="controller",
+        required=False,
+        help="Generate a Telemetry Controller-Initiated log page",
+    )
+    parser.add_argument(
+        "-g",
+        "--generate",
+        action="store_true",
+        dest="generate",
+        required=False,
+        help="Generate a sample JSON file.  If -t is not "
+        + "specified on the commandline, then the output filename "
+        + json_default
+        + "to contain a JSON file used to create the Telemetry and OCP Strings log pages.",
+    )
+    parser.add_argument(
+        "-t",
+        "--telemetry",
+        type=str,
+        dest="telemetry",
+        required=False,
+        metavar="<filename>",
+        default=telemetry_default,
+        help="Telemetry log page filename."
+        + "If -g is not specified on the commandline, then this defines the output filename"
+        + "to contain the Telemetry Host-Initiated log page. If not specified then the filename '"
+        + telemetry_default
+        + "' is used.",
+    )
+    parser.add_argument(
+        "-s",
+        "--string",
+        type=str,
+        dest="string",
+        required=False,
+        metavar="<filename>",
+        default=string_default,
+        help="OCP Strings log page (C9h) filename. "
+        + "If -g is not specified on the commandline, then this defines the output filename"
+        + "to contain the OCP Strings log page. If not specified then the filename '"
+        + string_default
+        + "' is used.",
+    )
+    parser.add_argument(
+        "-r",
+        "--random",
+        type=int,
+        dest="random",
+        required=False,
+        metavar="<value>",
+        help="Specify the random seed value so that log pages with different content can be generated.",
+    )
+    parser.add_argument(
+        "-o",
+        "--occupancy",
+        type=int,
+        dest="occupancy",
+        required=False,
+        metavar="<percent>",
+        help="Pack every FIFO with events to this percentage (0 to 100) of its size. This overrides the 'Max Events' and "
+        + "'Occupancy' values in the JSON file.",
+    )
+    parser.add_argument(
+        "-l",
+        "--log-size",
+        type=int,
+        dest="log_size",
+        required=False,
+        metavar="<bytes>",
+        help="Size in bytes of the Telemetry log page to generate. Data Area 2 is resized to reach this size and the "
+        + "space after the Data Area 2 statistics is split evenly between the Data Area 2 FIFOs.",
+    )
+    parser.add_argument(
+        "-b",
+        "--benchmark",
+        nargs="*",
+        choices=list(benchmark_presets),
+        dest="benchmark",
+        required=False,
+        metavar="<preset>",
+        help="Benchmark the generation of the log pages and report the time of each phase and the logs/s for each "
+        + "preset. The presets are: "
+        + ", ".join(benchmark_presets)
+        + ". If no preset is specified then all of the presets are used. The -t and -s filenames are overwritten by each "
+        + "log page generated.",
+    )
+    parser.add_argument(
+        "--count",
+        type=int,
+        dest="count",
+        required=False,
+        metavar="<value>",
+        default=3,
+        help="Number of log pages to generate for each benchmark preset.",
+    )
+    parser.add_argument(
+        "--allocations",
+        action="store_true",
+        dest="allocations",
+        required=False,
+        help="Also report the allocations of each benchmark phase from one more run of each preset with tracemalloc. The "
+        + "traced run is much slower and is not included in the times.",
+    )
+    parser.add_argument(
+        "--benchmark-output",
+        type=str,
+        dest="benchmark_output",
+        required=False,
+        metavar="<filename>",
+        help="JSON filename to save the benchmark results.",
+    )
+    parser.add_argument(
+        "-v", "--version", action="store_true", dest="list_ver", required=False, help="Specify the version of this script and exit."
+    )
+
+    # Parse the argument
+    return parser.parse_args(argv)
+
+
+# Main part of the script
+#
+# Input:
+#         argv : list of commandline arguments or None to use sys.argv
+#
+# Output: None
+#
+def main(argv=None):
+
+    args = parse_inputs(argv)
+    if args.list_ver:
+
+        print(f"{os.path.basename(sys.argv[0])} version: {version}")
+
+    elif args.generate:
+
+        # Use the default filename if the -t option is not on the commandline
+        if args.telemetry != None:
+            filename = json_default
+        else:
+            filename = args.json
+
+        # Generate a sample JSON file
+        with open(filename, "w") as f:
+            f.write(get_sample_json())
+            f.close()
+
+    elif args.benchmark != None:
+
+        if args.count < 1:
+            sys.exit(f"Count value of {args.count} is invalid.")
+
+        # Use a fixed seed so that runs can be compared
+        seed = args.random if args.random != None else 1
+        presets = args.benchmark or list(benchmark_presets)
+        run_benchmark(presets, args.count, seed, args.telemetry, args.string, args.benchmark_output, args.allocations)
+
+    else:
+
+        # Setup the random seed
+        if args.random != None:
+            seed = args.random
+        else:
+            seed = random.randrange(sys.maxsize)
+        random.seed(seed)
+
+        print(f"Random Seed: {seed}")
+        # Parse the JSON information
+        if args.json == None:
+            print("Opening sample JSON\n")
+            ocp_debug_data = json.loads(get_sample_json())
+        else:
+            print(f"Opening provided file: {args.json}")
+            with open(args.json, "r") as f:
+                ocp_debug_data = json.load(f)
+
+        generate_logs(ocp_debug_data, args.telemetry, args.string, args.controller, args.occupancy, args.log_size)
+
+
+if __name__ == "__main__":
+    main()
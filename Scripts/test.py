@@ -1,2 +0,0 @@
-
-print(f"\tString log size : {str(len(string_log))} ({hex(int(len(string_log) / 4))})")
@@ -0,0 +1,54 @@
+# *****************************************************************************
+#
+#          Copyright (c) 2026 Open Compute Project
+#
+#   SPDX-License-Identifier: MIT
+#
+#   Released under the MIT License of this repository. See the LICENSE
+#   file at the root of the repository for the full license text.
+#
+# *****************************************************************************
+#
+# Round trip log pages made by the generator through the dumper
+
+import contextlib
+import io
+import json
+
+import pytest
+
+from ocp_telemetry import dump, generate
+
+
+# Generate a Telemetry and OCP Strings log page with packed FIFOs
+#
+# Input:
+#      directory : pathlib.Path of the directory to write the log pages
+#      log_size  : size in bytes of the Telemetry log page
+#      mix       : "Event Mix" section of the generator JSON
+#
+# Output: (bytes of the Telemetry log page, bytes of the OCP Strings log page)
+def generate_logs(directory, log_size, mix):
+    ocp_data = json.loads(generate.get_sample_json())
+    ocp_data["Event Mix"] = mix
+    json_file = directory / "ocp_debug.json"
+    json_file.write_text(json.dumps(ocp_data))
+
+    telemetry_file = directory / "telemetry.bin"
+    strings_file = directory / "strings.bin"
+    argv = ["-r", "1", "-o", "100", "-l", str(log_size), "-j", str(json_file), "-t", str(telemetry_file), "-s", str(strings_file)]
+    with contextlib.redirect_stdout(io.StringIO()):
+        generate.main(argv)
+
+    return (telemetry_file.read_bytes(), strings_file.read_bytes())
+
+
+@pytest.mark.parametrize("mix", [{}, {"Class Weights": {"Vendor Unique": 1}}], ids=["default", "vendor unique"])
+@pytest.mark.parametrize("log_size", [64 * 1024, 256 * 1024, 1024 * 1024])
+def test_generated_log_parses(tmp_path, log_size, mix):
+    (telemetry, string_log) = generate_logs(tmp_path, log_size, mix)
+    assert len(telemetry) == log_size
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        strings = dump.parse_strings(string_log)
+        dump.parse_telemetry(telemetry, strings)
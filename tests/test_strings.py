@@ -0,0 +1,74 @@
+# *****************************************************************************
+#
+#          Copyright (c) 2026 Open Compute Project
+#
+#   SPDX-License-Identifier: MIT
+#
+#   Released under the MIT License of this repository. See the LICENSE
+#   file at the root of the repository for the full license text.
+#
+# *****************************************************************************
+#
+# Parse hand built OCP Strings log pages
+
+import contextlib
+import io
+
+import pytest
+
+from ocp_telemetry import dump
+
+
+# Build an OCP Strings log page with one statistic string followed by one event string in the ASCII table
+#
+# Input:
+#      event_string : bytes of the event string, the last string of the ASCII table
+#      event_len    : length of the event string in its table entry or None to use its length
+#
+# Output: bytes of the log page
+def build_string_log(event_string, event_len=None):
+    stat_string = b"Stat"
+    ascii_table = stat_string + event_string
+    ascii_table += b" " * (-len(ascii_table) % 4)
+    if event_len is None:
+        event_len = len(event_string)
+
+    header_dw = 432 // 4
+    size_dw = header_dw + 4 + 4 + (len(ascii_table) // 4)
+
+    log = bytearray(432)
+    log[0] = 1
+    log[16:32] = (0xB13A83691A8F408B9EA495940057AA44).to_bytes(16, "little")
+    log[32:40] = size_dw.to_bytes(8, "little")
+    log[64:72] = header_dw.to_bytes(8, "little")  # Statistics Identifier String Table
+    log[72:80] = (4).to_bytes(8, "little")
+    log[80:88] = (header_dw + 4).to_bytes(8, "little")  # Event String Table
+    log[88:96] = (4).to_bytes(8, "little")
+    log[96:104] = (header_dw + 8).to_bytes(8, "little")  # VU Event String Table, empty
+    log[112:120] = (header_dw + 8).to_bytes(8, "little")  # ASCII Table
+    log[120:128] = (len(ascii_table) // 4).to_bytes(8, "little")
+
+    stat_entry = (0x8000).to_bytes(2, "little") + bytes([0, len(stat_string) - 1]) + (0).to_bytes(8, "little") + bytes(4)
+    event_offset_dw = len(stat_string) // 4
+    event_entry = bytes([0x80]) + (1).to_bytes(2, "little") + bytes([event_len - 1]) + event_offset_dw.to_bytes(8, "little") + bytes(4)
+
+    return bytes(log) + stat_entry + event_entry + ascii_table
+
+
+def parse_strings(string_log):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return dump.parse_strings(string_log)
+
+
+def test_last_string_ends_at_end_of_ascii_table():
+    string_log = build_string_log(b"Last string!")
+    assert len(string_log) == 432 + 16 + 16 + 16
+
+    strings = parse_strings(string_log)
+    assert strings["statistics"]["0x8000"]["string"] == str(b"Stat")
+    assert strings["events"]["0x800x1"]["string"] == str(b"Last string!")
+
+
+def test_string_past_end_of_ascii_table():
+    with pytest.raises(SystemExit, match="not within the ASCII table"):
+        parse_strings(build_string_log(b"Last string!", 13))